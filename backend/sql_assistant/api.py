@@ -3,28 +3,43 @@ QueryBot API entry module.
 Provides HTTP interfaces for external access to QueryBot services.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Optional, Dict, Any
+import secrets
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator, List
 from fastapi import FastAPI, HTTPException, Body
+from fastapi.responses import StreamingResponse
+from langchain_core.messages import BaseMessage
 from pydantic import BaseModel
 
 from backend.sql_assistant.async_executor import (
     run_query_bot_async,
+    run_query_bot_batch_async,
     request_tracker,
 )
 from langgraph.checkpoint.memory import MemorySaver
-from backend.sql_assistant.utils.user_mapper import UserMapper
+from backend.sql_assistant.graph.assistant_graph import astream_query_bot
+from backend.sql_assistant.nodes.sql_execution_node import get_query_cache_stats
+from backend.sql_assistant.utils.user_mapper import get_user_mapper
+from backend.sql_assistant.utils.llm_cache import create_llm_cache
 from langchain_core.globals import set_llm_cache
-from langchain_community.cache import SQLiteCache
 from utils.core.streamlit_config import settings
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
-# Setup LLM cache
-set_llm_cache(SQLiteCache(database_path="./data/llm_cache/langchain.db"))
+try:
+    # Rust JSON serializer shipped with langsmith, used when available
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed langsmith version
+    orjson = None
 
-if settings.monitoring.phoenix_enabled:
+
+def setup_phoenix_tracing() -> None:
+    """Register Phoenix OpenTelemetry instrumentation for LangChain"""
     from phoenix.otel import register
     from openinference.instrumentation.langchain import LangChainInstrumentor
 
@@ -34,14 +49,33 @@ if settings.monitoring.phoenix_enabled:
     )
     LangChainInstrumentor().instrument(tracer_provider=tracer_provider)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up process-wide LLM cache and tracing when the server starts
+
+    Done here rather than at import so importing the module stays cheap;
+    blocking setup runs in a worker thread to keep the event loop free.
+    """
+    # Setup LLM cache
+    set_llm_cache(await asyncio.to_thread(create_llm_cache))
+
+    if settings.monitoring.phoenix_enabled:
+        await asyncio.to_thread(setup_phoenix_tracing)
+
+    yield
+
+
 # FastAPI application
-app = FastAPI(title="QueryBot API")
+app = FastAPI(title="QueryBot API", lifespan=lifespan)
 
 
 # Configuration
 class Config:
     # User permission control (optional feature, set to False to skip user permission verification)
     USER_AUTH_ENABLED = settings.app.user_auth_enabled
+    # Most queries accepted by one batch request; each runs the full graph
+    BATCH_MAX_QUERIES = 16
 
 
 class ChatResponse(BaseModel):
@@ -52,38 +86,74 @@ class ChatResponse(BaseModel):
 # Global variables
 checkpoint_saver = MemorySaver()
 # User mapper (only used when user permission control is enabled)
-user_mapper = UserMapper()
+user_mapper = get_user_mapper()
+
+
+def build_request_id(username: str, text: str) -> str:
+    """Build request ID for in-flight deduplication
+
+    Uses a content hash instead of the built-in hash(), which is salted per
+    process and would give different IDs for the same query on each worker.
+    """
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{username}_{digest}"
+
+
+def resolve_user_id(username: str) -> Optional[int]:
+    """Resolve user ID when user permission control is enabled
+
+    Raises:
+        HTTPException: Raised when a named user has no access permissions
+    """
+    if not Config.USER_AUTH_ENABLED:
+        return None
+    user_id = user_mapper.get_user_id(username)
+    if user_id is None and username != "anonymous":
+        raise HTTPException(
+            status_code=404,
+            detail="Sorry, you currently do not have access permissions. Please contact the data team to grant you relevant permissions.",
+        )
+    return user_id
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values json cannot handle natively (messages, dates, decimals)"""
+    if isinstance(value, BaseMessage):
+        return {"type": value.type, "content": value.content}
+    return str(value)
+
+
+def format_sse_event(data: Dict[str, Any]) -> str:
+    """Format a graph update as a server-sent event"""
+    if orjson is not None:
+        try:
+            return f"data: {orjson.dumps(data, default=_json_default).decode()}\n\n"
+        except TypeError:
+            pass
+    return f"data: {json.dumps(data, ensure_ascii=False, default=_json_default)}\n\n"
 
 
 @app.post("/api/query-bot", response_model=ChatResponse)
 async def process_query(request: Dict[str, Any] = Body(...)) -> ChatResponse:
     """Process SQL query requests"""
     # Generate request ID
-    request_id = f"{request.get('username', 'anonymous')}_{hash(request.get('text', ''))}"
+    request_id = build_request_id(request.get("username", "anonymous"), request.get("text", ""))
+    is_tracked = False
 
     try:
         text = request.get("text", "")
         username = request.get("username", "anonymous")
         session_id = request.get("session_id", None)
 
-        # Check if the same request is being processed
-        if await request_tracker.is_processing(request_id):
+        # Check and mark in one step so concurrent duplicates cannot both pass
+        if not await request_tracker.try_add(request_id):
             return ChatResponse(
                 text="Your previous query is being processed, please wait...", session_id=session_id
             )
-
-        # Mark request as being processed
-        await request_tracker.add_request(request_id)
+        is_tracked = True
 
         # Decide whether to perform user permission control based on environment variables
-        user_id = None
-        if Config.USER_AUTH_ENABLED:
-            user_id = user_mapper.get_user_id(username)
-            if user_id is None and username != "anonymous":
-                raise HTTPException(
-                    status_code=404,
-                    detail="Sorry, you currently do not have access permissions. Please contact the data team to grant you relevant permissions.",
-                )
+        user_id = resolve_user_id(username)
 
         # Run QueryBot asynchronously
         result = await run_query_bot_async(
@@ -113,11 +183,83 @@ async def process_query(request: Dict[str, Any] = Body(...)) -> ChatResponse:
             detail="Sorry, the system encountered a problem while processing your request. Please try again later. If the problem persists, please contact the data team for help.",
         )
     finally:
-        # Remove request tracking
-        await request_tracker.remove_request(request_id)
+        # Remove request tracking, unless this call was rejected as a duplicate
+        if is_tracked:
+            await request_tracker.remove_request(request_id)
+
+
+@app.post("/api/query-bot/batch", response_model=List[ChatResponse])
+async def process_query_batch(request: Dict[str, Any] = Body(...)) -> List[ChatResponse]:
+    """Process several independent SQL queries, each in a new session
+
+    Replies are returned in request order with the session ID of each query,
+    which can be passed to /api/query-bot to continue that conversation.
+    """
+    texts = request.get("texts")
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        raise HTTPException(status_code=400, detail="'texts' must be a list of query strings")
+    if len(texts) > Config.BATCH_MAX_QUERIES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"A batch accepts at most {Config.BATCH_MAX_QUERIES} queries",
+        )
+
+    user_id = resolve_user_id(request.get("username", "anonymous"))
+
+    results = await run_query_bot_batch_async(
+        queries=texts,
+        checkpoint_saver=checkpoint_saver,
+        user_id=user_id,
+    )
+
+    responses = []
+    for result in results:
+        messages = result.get("messages", [])
+        if "error" in result or not messages:
+            text = "Sorry, the system encountered a problem while processing this query. Please try again later."
+        else:
+            text = messages[-1].content
+        responses.append(ChatResponse(text=text, session_id=result["thread_id"]))
+    return responses
+
+
+@app.post("/api/query-bot/stream")
+async def stream_query(request: Dict[str, Any] = Body(...)) -> StreamingResponse:
+    """Stream SQL query processing as server-sent events, one event per node update
+
+    The first event carries the session ID, so a new conversation can be continued.
+    """
+    text = request.get("text", "")
+    username = request.get("username", "anonymous")
+    session_id = request.get("session_id") or secrets.token_hex(8)
+    request_id = build_request_id(username, text)
+    user_id = resolve_user_id(username)
+
+    async def event_stream() -> AsyncIterator[str]:
+        yield format_sse_event({"session_id": session_id})
+
+        # Tracked inside the stream so the finally below always releases it
+        if not await request_tracker.try_add(request_id):
+            yield format_sse_event(
+                {"error": {"error": "Your previous query is being processed, please wait..."}}
+            )
+            return
+
+        try:
+            async for chunk in astream_query_bot(
+                query=text,
+                thread_id=session_id,
+                checkpoint_saver=checkpoint_saver,
+                user_id=user_id,
+            ):
+                yield format_sse_event(chunk)
+        finally:
+            await request_tracker.remove_request(request_id)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy"}
+    """Health check endpoint, with query result cache statistics"""
+    return {"status": "healthy", "query_cache": get_query_cache_stats()}
@@ -3,18 +3,13 @@ QueryBot asynchronous execution module.
 Provides functionality for asynchronous execution of QueryBot tasks.
 """
 
-import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
-from backend.sql_assistant.graph.assistant_graph import run_query_bot
+from backend.sql_assistant.graph.assistant_graph import arun_query_bot, arun_query_bot_batch
 
 logger = logging.getLogger(__name__)
 
-# Create thread pool executor
-thread_pool = ThreadPoolExecutor(max_workers=3)
-
 
 async def run_query_bot_async(
     query: str,
@@ -24,34 +19,57 @@ async def run_query_bot_async(
 ) -> Dict[str, Any]:
     """Run QueryBot asynchronously
 
-    Execute synchronous processing logic in thread pool to avoid blocking the event loop
+    Awaits the graph on the running event loop. Nodes without an async
+    implementation are dispatched by LangGraph to the loop's default executor.
+    """
+    return await arun_query_bot(query, thread_id, checkpoint_saver, user_id)
+
+
+async def run_query_bot_batch_async(
+    queries: List[str],
+    checkpoint_saver: Optional[Any] = None,
+    user_id: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Run QueryBot for several independent queries asynchronously
+
+    Each query runs in a new session; results carry its "thread_id".
     """
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(
-        thread_pool, run_query_bot, query, thread_id, checkpoint_saver, user_id
-    )
+    return await arun_query_bot_batch(queries, checkpoint_saver, user_id)
 
 
 # For managing requests being processed
 class RequestTracker:
+    """Track in-flight requests within this process
+
+    All methods run on the event loop thread without awaiting in between,
+    so the check-and-add in try_add is atomic without a lock.
+    """
+
     def __init__(self):
         self._processing_requests = set()
-        self._lock = asyncio.Lock()
 
     async def is_processing(self, request_id: str) -> bool:
         """Check if request is being processed"""
-        async with self._lock:
-            return request_id in self._processing_requests
+        return request_id in self._processing_requests
+
+    async def try_add(self, request_id: str) -> bool:
+        """Mark request as being processed
+
+        Returns:
+            bool: False if the same request is already being processed
+        """
+        if request_id in self._processing_requests:
+            return False
+        self._processing_requests.add(request_id)
+        return True
 
     async def add_request(self, request_id: str):
         """Add request being processed"""
-        async with self._lock:
-            self._processing_requests.add(request_id)
+        self._processing_requests.add(request_id)
 
     async def remove_request(self, request_id: str):
         """Remove completed request"""
-        async with self._lock:
-            self._processing_requests.discard(request_id)
+        self._processing_requests.discard(request_id)
 
 
 # Create global request tracker
@@ -3,21 +3,31 @@ QueryBot graph construction module.
 Builds and configures the complete processing flow graph for QueryBot.
 """
 
-import uuid
 import logging
 import os
-from typing import Dict, Any, Optional
+import secrets
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
 from langfuse import Langfuse, get_client
 from langfuse.langchain import CallbackHandler
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
-from backend.sql_assistant.nodes.intent_analysis_node import intent_analysis_node
-from backend.sql_assistant.nodes.keyword_extraction_node import keyword_extraction_node
-from backend.sql_assistant.nodes.term_mapping_node import domain_term_mapping_node
+from backend.sql_assistant.nodes.intent_analysis_node import (
+    intent_analysis_node,
+    intent_analysis_node_async,
+)
+from backend.sql_assistant.nodes.keyword_extraction_node import (
+    keyword_extraction_node,
+    keyword_extraction_node_async,
+)
+from backend.sql_assistant.nodes.term_mapping_node import (
+    domain_term_mapping_node,
+    domain_term_mapping_node_async,
+)
 from backend.sql_assistant.nodes.query_rewrite_node import query_rewrite_node
 from backend.sql_assistant.nodes.data_source_node import data_source_identification_node
 from backend.sql_assistant.nodes.table_structure_node import (
@@ -29,7 +39,10 @@ from backend.sql_assistant.nodes.permission_control_node import permission_contr
 from backend.sql_assistant.nodes.sql_execution_node import sql_execution_node
 from backend.sql_assistant.nodes.error_analysis_node import error_analysis_node
 from backend.sql_assistant.nodes.result_generation_node import result_generation_node
-from backend.sql_assistant.nodes.feasibility_check_node import feasibility_check_node
+from backend.sql_assistant.nodes.feasibility_check_node import (
+    feasibility_check_node,
+    feasibility_check_node_async,
+)
 from backend.sql_assistant.routes.node_routes import (
     route_after_intent,
     route_after_execution,
@@ -39,16 +52,37 @@ from backend.sql_assistant.routes.node_routes import (
     route_after_data_source,
 )
 
+# Core infrastructure imports
+from utils.core.streamlit_config import settings
+
 logger = logging.getLogger(__name__)
 
 
+def _is_langfuse_enabled() -> bool:
+    """Check whether Langfuse tracing is enabled
+
+    QUERYBOT_DISABLE_TRACING=1 turns tracing off regardless of configuration.
+    """
+    if os.getenv("QUERYBOT_DISABLE_TRACING", "").lower() in ("1", "true", "yes"):
+        return False
+    return settings.monitoring.langfuse_enabled
+
+
+# Evaluated once at import, configuration does not change while the process runs
+_LANGFUSE_ENABLED = _is_langfuse_enabled()
+
+# Graph runs in flight at once for batch execution
+BATCH_MAX_CONCURRENCY = 8
+
+
+@lru_cache()
 def initialize_langfuse():
     """
     Initialize Langfuse client (only when enabled).
-    In Langfuse 3.x, the client needs to be initialized at application startup.
+    In Langfuse 3.x, the client needs to be initialized at application startup,
+    so this runs once per process; later calls return immediately.
     """
-    from utils.core.streamlit_config import settings
-    if settings.monitoring.langfuse_enabled:
+    if _LANGFUSE_ENABLED:
         try:
             Langfuse(
                 public_key=settings.monitoring.langfuse_public_key,
@@ -85,16 +119,28 @@ def build_query_bot_graph() -> StateGraph:
     # Create graph builder
     graph_builder = StateGraph(SQLAssistantState)
 
-    # Add all nodes
-    graph_builder.add_node("intent_analysis", intent_analysis_node)
-    graph_builder.add_node("keyword_extraction", keyword_extraction_node)
-    graph_builder.add_node("domain_term_mapping", domain_term_mapping_node)
+    # Add all nodes; nodes with an async variant use it under ainvoke/astream
+    graph_builder.add_node(
+        "intent_analysis",
+        RunnableLambda(intent_analysis_node, afunc=intent_analysis_node_async),
+    )
+    graph_builder.add_node(
+        "keyword_extraction",
+        RunnableLambda(keyword_extraction_node, afunc=keyword_extraction_node_async),
+    )
+    graph_builder.add_node(
+        "domain_term_mapping",
+        RunnableLambda(domain_term_mapping_node, afunc=domain_term_mapping_node_async),
+    )
     graph_builder.add_node("query_rewrite", query_rewrite_node)
     graph_builder.add_node(
         "data_source_identification", data_source_identification_node
     )
     graph_builder.add_node("table_structure_analysis", table_structure_analysis_node)
-    graph_builder.add_node("feasibility_checking", feasibility_check_node)
+    graph_builder.add_node(
+        "feasibility_checking",
+        RunnableLambda(feasibility_check_node, afunc=feasibility_check_node_async),
+    )
     graph_builder.add_node("query_example_retrieval", query_example_node)
     graph_builder.add_node("sql_generation", sql_generation_node)
     graph_builder.add_node("permission_control", permission_control_node)
@@ -106,13 +152,13 @@ def build_query_bot_graph() -> StateGraph:
     graph_builder.add_conditional_edges(
         "intent_analysis",
         route_after_intent,
-        {"keyword_extraction": "keyword_extraction", END: END},
+        {"domain_term_mapping": "domain_term_mapping", END: END},
     )
 
     graph_builder.add_conditional_edges(
         "feasibility_checking",
         route_after_feasibility_check,
-        {"query_example_retrieval": "query_example_retrieval", END: END},
+        {"sql_generation": "sql_generation", END: END},
     )
 
     graph_builder.add_conditional_edges(
@@ -147,27 +193,84 @@ def build_query_bot_graph() -> StateGraph:
     )
 
     # Modify basic flow edges, add permission control node
-    graph_builder.add_edge("keyword_extraction", "domain_term_mapping")
     graph_builder.add_edge("domain_term_mapping", "query_rewrite")
+
+    # Fan out after query rewrite: example retrieval only needs the rewritten query,
+    # so it runs alongside data source identification. Its update is committed at the
+    # end of that superstep, before sql_generation is scheduled further down the chain.
     graph_builder.add_edge("query_rewrite", "data_source_identification")
+    graph_builder.add_edge("query_rewrite", "query_example_retrieval")
     graph_builder.add_edge("table_structure_analysis", "feasibility_checking")
-    graph_builder.add_edge("query_example_retrieval", "sql_generation")
     graph_builder.add_edge("sql_generation", "permission_control")
     graph_builder.add_edge("result_generation", END)
 
-    # Set entry point
+    # Set entry points: keyword extraction only reads the messages, so it runs
+    # alongside intent analysis; term mapping starts only once intent is clear.
+    # Trade-off: when intent turns out unclear, the keyword call is wasted. That
+    # costs one LLM call per clarification turn (none when the messages hold no
+    # entity candidates) in exchange for taking keyword extraction off the
+    # critical path of every answerable query.
     graph_builder.add_edge(START, "intent_analysis")
+    graph_builder.add_edge(START, "keyword_extraction")
 
     return graph_builder
 
 
-def run_query_bot(
+@lru_cache(maxsize=4)
+def get_compiled_graph(checkpoint_saver: Optional[Any] = None):
+    """Get compiled QueryBot graph for a checkpoint saver
+
+    Building and compiling the graph is independent of the request, so compiled
+    graphs are cached per saver instance and only the runtime config varies per call.
+
+    Args:
+        checkpoint_saver: State saver instance, None to run without checkpointing
+
+    Returns:
+        CompiledStateGraph: Compiled graph instance
+    """
+    return build_query_bot_graph().compile(checkpointer=checkpoint_saver)
+
+
+def _new_turn_state() -> Dict[str, Any]:
+    """Build state values of a turn before any node has run
+
+    Only messages accumulate across turns of a thread; every other channel
+    describes the current query and must not survive into the next one.
+
+    Returns:
+        Dict[str, Any]: Reset values for all per-turn state fields
+    """
+    return {
+        "dialogue_history": None,
+        "query_intent": None,
+        "is_intent_clear": False,
+        "keywords": [],
+        "domain_term_mappings": {},
+        "formatted_term_descriptions": None,
+        "rewritten_query": None,
+        "matched_tables": [],
+        "table_structures": [],
+        "formatted_table_structures": None,
+        "generated_sql": None,
+        "execution_result": None,
+        "error_analysis_result": None,
+        "retry_count": 0,
+        "result_feedback": None,
+        "feasibility_check": None,
+        "query_examples": None,
+        "formatted_query_examples": None,
+        "has_relevant_tables": False,
+    }
+
+
+def _prepare_run(
     query: str,
     thread_id: Optional[str] = None,
     checkpoint_saver: Optional[Any] = None,
     user_id: Optional[int] = None,
-) -> Dict[str, Any]:
-    """Run QueryBot
+) -> Tuple[Any, Dict[str, Any], Dict[str, Any]]:
+    """Prepare compiled graph, runtime config and input state for one query
 
     Args:
         query: User's query text
@@ -176,24 +279,18 @@ def run_query_bot(
         user_id: User ID for permission control
 
     Returns:
-        Dict[str, Any]: Processing result dictionary
+        Tuple[Any, Dict[str, Any], Dict[str, Any]]: Compiled graph, runtime config and input state
     """
     # Initialize Langfuse client (if enabled)
     initialize_langfuse()
 
-    # Create graph builder
-    graph_builder = build_query_bot_graph()
-
-    # Use default memory saver
-    if checkpoint_saver is None:
-        checkpoint_saver = MemorySaver()
-
-    # Compile graph
-    graph = graph_builder.compile(checkpointer=checkpoint_saver)
+    # Get compiled graph; without a saver no state outlives the call,
+    # matching the previous throwaway per-request MemorySaver
+    graph = get_compiled_graph(checkpoint_saver)
 
     # Generate session ID
     if thread_id is None:
-        thread_id = str(uuid.uuid4())
+        thread_id = secrets.token_hex(8)
 
     # Configure runtime parameters
     config = {
@@ -202,17 +299,41 @@ def run_query_bot(
         }
     }
 
-    # Construct input state
+    # Construct input state; per-turn fields are reset so a checkpointed thread
+    # does not carry the previous turn's retries, SQL or results into this one
     state_input = {
+        **_new_turn_state(),
         "messages": [HumanMessage(content=query)],
         "user_id": user_id,  # Add user ID to initial state
     }
 
+    return graph, config, state_input
+
+
+def run_query_bot(
+    query: str,
+    thread_id: Optional[str] = None,
+    checkpoint_saver: Optional[Any] = None,
+    user_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run QueryBot
+
+    Args:
+        query: User's query text
+        thread_id: Session ID
+        checkpoint_saver: State saver instance
+        user_id: User ID for permission control
+
+    Returns:
+        Dict[str, Any]: Processing result dictionary
+    """
+    graph, config, state_input = _prepare_run(query, thread_id, checkpoint_saver, user_id)
+    thread_id = config["configurable"]["thread_id"]
+
     # Execute graph
     try:
         # Use span context only when Langfuse is enabled
-        from utils.core.streamlit_config import settings
-        if settings.monitoring.langfuse_enabled:
+        if _LANGFUSE_ENABLED:
             langfuse_client = get_client()
             with langfuse_client.start_as_current_span(name="query-bot-query") as span:
                 # Set trace attributes
@@ -242,11 +363,113 @@ def run_query_bot(
         return {"error": error_msg}
 
 
+async def arun_query_bot(
+    query: str,
+    thread_id: Optional[str] = None,
+    checkpoint_saver: Optional[Any] = None,
+    user_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run QueryBot asynchronously
+
+    Uses LangGraph's native async API so concurrent queries share one event loop
+    instead of each occupying a worker thread for the whole graph run.
+
+    Args:
+        query: User's query text
+        thread_id: Session ID
+        checkpoint_saver: State saver instance
+        user_id: User ID for permission control
+
+    Returns:
+        Dict[str, Any]: Processing result dictionary
+    """
+    graph, config, state_input = _prepare_run(query, thread_id, checkpoint_saver, user_id)
+    thread_id = config["configurable"]["thread_id"]
+
+    # Execute graph
+    try:
+        # Use span context only when Langfuse is enabled
+        if _LANGFUSE_ENABLED:
+            langfuse_client = get_client()
+            with langfuse_client.start_as_current_span(name="query-bot-query") as span:
+                # Set trace attributes
+                span.update_trace(
+                    user_id=str(user_id) if user_id else None,
+                    session_id=thread_id,
+                    tags=["query_bot"],
+                    input={"query": query}
+                )
+
+                # Add callbacks
+                config["callbacks"] = [create_langfuse_handler()]
+
+                # Execute graph
+                result = await graph.ainvoke(state_input, config)
+
+                # Set output
+                span.update_trace(output=result)
+
+                return result
+        else:
+            return await graph.ainvoke(state_input, config)
+
+    except Exception as e:
+        error_msg = f"QueryBot execution error: {str(e)}"
+        logger.error(error_msg)
+        return {"error": error_msg}
+
+
+async def arun_query_bot_batch(
+    queries: List[str],
+    checkpoint_saver: Optional[Any] = None,
+    user_id: Optional[int] = None,
+    max_concurrency: int = BATCH_MAX_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """Run QueryBot for several independent queries asynchronously
+
+    Each query gets its own session; the graph runs are executed together with
+    LangGraph's batch API, so their LLM and database calls overlap.
+
+    Args:
+        queries: User query texts
+        checkpoint_saver: State saver instance
+        user_id: User ID for permission control
+        max_concurrency: Maximum number of graph runs executed at once
+
+    Returns:
+        List[Dict[str, Any]]: Processing result dictionaries in query order, each
+        with the "thread_id" of its session so the conversation can be continued
+    """
+    if not queries:
+        return []
+
+    runs = [_prepare_run(query, None, checkpoint_saver, user_id) for query in queries]
+    graph = runs[0][0]
+    configs = [config for _, config, _ in runs]
+    inputs = [state_input for _, _, state_input in runs]
+    for config in configs:
+        config["max_concurrency"] = max_concurrency
+        if _LANGFUSE_ENABLED:
+            config["callbacks"] = [create_langfuse_handler()]
+
+    results = await graph.abatch(inputs, configs, return_exceptions=True)
+
+    responses = []
+    for config, result in zip(configs, results):
+        if isinstance(result, Exception):
+            error_msg = f"QueryBot execution error: {str(result)}"
+            logger.error(error_msg)
+            result = {"error": error_msg}
+        responses.append({**result, "thread_id": config["configurable"]["thread_id"]})
+    return responses
+
+
 def stream_query_bot(
     query: str,
     thread_id: Optional[str] = None,
     checkpoint_saver: Optional[Any] = None,
     user_id: Optional[int] = None,
+    stream_tokens: bool = False,
 ):
     """Stream QueryBot execution with native LangGraph updates
 
@@ -255,44 +478,83 @@ def stream_query_bot(
         thread_id: Session ID
         checkpoint_saver: State saver instance
         user_id: User ID for permission control
+        stream_tokens: Also stream LLM message chunks; chunks are then yielded as
+            (mode, chunk) pairs with mode "updates" or "messages", as LangGraph
+            does for multiple stream modes
 
     Yields:
         Dict[str, Any]: Stream chunks from graph execution
     """
-    # Initialize Langfuse client (if enabled)
-    initialize_langfuse()
+    graph, config, state_input = _prepare_run(query, thread_id, checkpoint_saver, user_id)
+    thread_id = config["configurable"]["thread_id"]
+    stream_mode = ["updates", "messages"] if stream_tokens else "updates"
 
-    # Create graph builder
-    graph_builder = build_query_bot_graph()
+    # Stream execution with Langfuse monitoring
+    try:
+        if _LANGFUSE_ENABLED:
+            langfuse_client = get_client()
+            with langfuse_client.start_as_current_span(name="query-bot-stream") as span:
+                # Set trace attributes
+                span.update_trace(
+                    user_id=str(user_id) if user_id else None,
+                    session_id=thread_id,
+                    tags=["query_bot", "stream"],
+                    input={"query": query}
+                )
 
-    # Use default memory saver
-    if checkpoint_saver is None:
-        checkpoint_saver = MemorySaver()
+                # Add callbacks for monitoring
+                config["callbacks"] = [create_langfuse_handler()]
 
-    # Compile graph
-    graph = graph_builder.compile(checkpointer=checkpoint_saver)
+                # Stream with native LangGraph updates mode
+                final_result = None
+                for chunk in graph.stream(state_input, config, stream_mode=stream_mode):
+                    # Capture final result
+                    mode, update = chunk if stream_tokens else ("updates", chunk)
+                    if mode == "updates":
+                        for node_name, node_output in update.items():
+                            if isinstance(node_output, dict) and 'messages' in node_output:
+                                final_result = node_output
 
-    # Generate session ID
-    if thread_id is None:
-        thread_id = str(uuid.uuid4())
+                    yield chunk
 
-    # Configure runtime parameters
-    config = {
-        "configurable": {
-            "thread_id": thread_id,
-        }
-    }
+                # Set final output for monitoring
+                if final_result:
+                    span.update_trace(output=final_result)
+        else:
+            # Stream without monitoring
+            for chunk in graph.stream(state_input, config, stream_mode=stream_mode):
+                yield chunk
 
-    # Construct input state
-    state_input = {
-        "messages": [HumanMessage(content=query)],
-        "user_id": user_id,
-    }
+    except Exception as e:
+        error_msg = f"QueryBot streaming error: {str(e)}"
+        logger.error(error_msg)
+        error_chunk = {"error": {"error": error_msg}}
+        yield ("updates", error_chunk) if stream_tokens else error_chunk
+
+
+async def astream_query_bot(
+    query: str,
+    thread_id: Optional[str] = None,
+    checkpoint_saver: Optional[Any] = None,
+    user_id: Optional[int] = None,
+):
+    """Asynchronously stream QueryBot execution with native LangGraph updates
+
+    Args:
+        query: User's query text
+        thread_id: Session ID
+        checkpoint_saver: State saver instance
+        user_id: User ID for permission control
+
+    Yields:
+        Dict[str, Any]: Stream chunks from graph execution
+    """
+    graph, config, state_input = _prepare_run(query, thread_id, checkpoint_saver, user_id)
+    thread_id = config["configurable"]["thread_id"]
 
     # Stream execution with Langfuse monitoring
     try:
-        from utils.core.streamlit_config import settings
-        if settings.monitoring.langfuse_enabled:
+        if _LANGFUSE_ENABLED:
             langfuse_client = get_client()
             with langfuse_client.start_as_current_span(name="query-bot-stream") as span:
                 # Set trace attributes
@@ -306,9 +568,8 @@ def stream_query_bot(
                 # Add callbacks for monitoring
                 config["callbacks"] = [create_langfuse_handler()]
 
-                # Stream with native LangGraph updates mode
                 final_result = None
-                for chunk in graph.stream(state_input, config, stream_mode="updates"):
+                async for chunk in graph.astream(state_input, config, stream_mode="updates"):
                     # Capture final result
                     for node_name, node_output in chunk.items():
                         if isinstance(node_output, dict) and 'messages' in node_output:
@@ -321,7 +582,7 @@ def stream_query_bot(
                     span.update_trace(output=final_result)
         else:
             # Stream without monitoring
-            for chunk in graph.stream(state_input, config, stream_mode="updates"):
+            async for chunk in graph.astream(state_input, config, stream_mode="updates"):
                 yield chunk
 
     except Exception as e:
@@ -5,7 +5,8 @@ Responsible for identifying data tables most relevant to query requirements.
 
 import os
 import logging
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
 from langchain_core.messages import AIMessage
@@ -13,17 +14,25 @@ from langchain_core.messages import AIMessage
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
 # Factory class imports
 from utils.factories.milvus import MilvusFactory
-from utils.factories.embedding import EmbeddingFactory
 
 # Service function imports
 from utils.services.milvus_service import search_in_milvus
+from utils.services.batching import get_batching_embeddings
 from utils.services.llm import init_language_model, LanguageModelChain
 
 # Core infrastructure imports
 from utils.core.streamlit_config import settings
+from utils.core.cache import TTLCache
+from utils.core.constants import CacheConstants
 
 logger = logging.getLogger(__name__)
 
+# Candidate tables keyed by (query, top_k, min_similarity), shared across matcher instances
+_candidate_cache = TTLCache(
+    maxsize=CacheConstants.CANDIDATE_TABLES_MAXSIZE,
+    ttl=CacheConstants.CANDIDATE_TABLES_TTL,
+)
+
 
 class TableSelectionResult(BaseModel):
     """Table selection result model"""
@@ -34,40 +43,22 @@ class TableSelectionResult(BaseModel):
     )
 
 
-TABLE_SELECTION_SYSTEM_PROMPT = """You are a professional data analyst responsible for selecting the most suitable tables from candidate data tables to answer user queries.
-Please follow these principles:
-
-1. Understand query requirements:
-   - Analyze the core information the user wants to query
-   - Identify the main dimensions and metrics of the query
-   - Determine if multi-table joins are needed
-
-2. Evaluate table relevance:
-   - Whether the table's main purpose is directly related to the query objective
-   - Whether the table contains required key fields
-   - Whether the table's data granularity is appropriate
-   - Whether the table's data update characteristics meet the requirements
+TABLE_SELECTION_SYSTEM_PROMPT = """You are a data analyst selecting the candidate tables best suited to answer a user query.
 
-3. Selection principles:
-   - Select the most relevant tables based on query requirements
-   - Select at most three tables
-   - Choose tables with the most appropriate data granularity
-   - Avoid selecting redundant tables
-
-4. Output requirements:
-   - Briefly explain the reasoning process and selection rationale (within 20 words)
+- Identify the query's target information, dimensions and metrics, and whether joins are needed
+- Prefer tables whose purpose, key fields, granularity and update frequency fit the query
+- Select at most 3 tables and avoid redundant ones
+- Explain the reasoning within 20 words
 """
 
 
-TABLE_SELECTION_USER_PROMPT = """Please select the most suitable tables from the following candidate data tables to answer the user query:
+TABLE_SELECTION_USER_PROMPT = """Select the most suitable tables for the user query.
 
-1. User query requirements:
+1. User query:
 {query}
 
-2. Candidate data table list:
-{candidate_tables}
-
-Please analyze the relevance of each table, select at most 2 most suitable tables, and explain the selection reasons in detail."""
+2. Candidate tables:
+{candidate_tables}"""
 
 
 class DataSourceMatcher:
@@ -82,17 +73,22 @@ class DataSourceMatcher:
         )
         # Get table descriptions collection
         self.collection = self.milvus_connection.get_collection("table_descriptions")
-        # Initialize embedding model
-        self.embeddings = EmbeddingFactory.get_default_embeddings()
+        # Shared embedding model, concurrent queries are batched into one request
+        self.embeddings = get_batching_embeddings()
 
     def find_candidate_tables(
-        self, query: str, top_k: int = 10
+        self,
+        query: str,
+        top_k: int = 5,
+        min_similarity: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
         """Identify candidate data tables most relevant to the query
 
         Args:
             query: Standardized query text
             top_k: Number of most relevant tables to return
+            min_similarity: Minimum similarity score for a table to be kept,
+                defaults to the configured table similarity threshold
 
         Returns:
             List[Dict[str, Any]]: List of candidate table information, each table contains name, description and similarity score
@@ -100,6 +96,14 @@ class DataSourceMatcher:
         Raises:
             ValueError: Raised when vector search fails
         """
+        if min_similarity is None:
+            min_similarity = settings.vector_db.table_similarity_threshold
+
+        cache_key = (query, top_k, min_similarity)
+        cached = _candidate_cache.get(cache_key)
+        if cached is not None:
+            return [dict(table) for table in cached]
+
         try:
             # Generate vector representation of query text
             query_vector = self.embeddings.embed_query(query)
@@ -113,7 +117,7 @@ class DataSourceMatcher:
             )
 
             # Convert result format
-            return [
+            candidate_tables = [
                 {
                     "table_name": result["table_name"],
                     "description": result["description"],
@@ -122,11 +126,24 @@ class DataSourceMatcher:
                     "schema": result.get("schema", ""),
                 }
                 for result in results
+                if result["distance"] >= min_similarity
             ]
 
         except Exception as e:
             raise ValueError(f"Data table vector search failed: {str(e)}")
 
+        _candidate_cache.set(cache_key, candidate_tables)
+        return [dict(table) for table in candidate_tables]
+
+
+@lru_cache()
+def get_matcher() -> DataSourceMatcher:
+    """Get shared data source matcher
+
+    Reuses the Milvus connection and embedding model across requests.
+    """
+    return DataSourceMatcher()
+
 
 def create_table_selection_chain(temperature: float = 0.0) -> LanguageModelChain:
     """Create table selection task chain"""
@@ -140,16 +157,20 @@ def create_table_selection_chain(temperature: float = 0.0) -> LanguageModelChain
     )()
 
 
+@lru_cache(maxsize=None)
+def _get_table_selection_chain(temperature: float = 0.0):
+    """Get shared table selection chain, built once per temperature"""
+    return create_table_selection_chain(temperature)
+
+
 def format_candidate_tables(tables: List[Dict[str, Any]]) -> str:
     """Format candidate table information"""
-    formatted = []
-    for i, table in enumerate(tables, 1):
-        formatted.append(
-            f"{i}. Table name: {table['table_name']}\n"
-            f"   Description: {table['description']}\n"
-            f"   Additional info: {table['additional_info']}\n"
-        )
-    return "\n".join(formatted)
+    return "\n".join(
+        f"{i}. Table name: {table['table_name']}\n"
+        f"   Description: {table['description']}\n"
+        f"   Additional info: {table['additional_info']}\n"
+        for i, table in enumerate(tables, 1)
+    )
 
 
 def data_source_identification_node(state: SQLAssistantState) -> dict:
@@ -169,36 +190,39 @@ def data_source_identification_node(state: SQLAssistantState) -> dict:
         raise ValueError("Rewritten query not found in state")
 
     try:
-        # Create matcher instance
-        matcher = DataSourceMatcher()
+        # Get shared matcher instance
+        matcher = get_matcher()
 
         # 1. Get candidate tables
         candidate_tables = matcher.find_candidate_tables(rewritten_query)
         logger.info(f"Number of initially matched candidate tables: {len(candidate_tables)}")
 
-        # 2. Create table selection chain
-        selection_chain = create_table_selection_chain()
+        selected_table_names = []
+        if candidate_tables:
+            # 2. Create table selection chain
+            selection_chain = _get_table_selection_chain()
 
-        # 3. Use LLM to select most relevant tables
-        input_data = {
-            "query": rewritten_query,
-            "candidate_tables": format_candidate_tables(candidate_tables),
-        }
+            # 3. Use LLM to select most relevant tables
+            input_data = {
+                "query": rewritten_query,
+                "candidate_tables": format_candidate_tables(candidate_tables),
+            }
 
-        selection_result = selection_chain.invoke(input_data)
-        selected_table_names = selection_result["selected_table_names"]
-        has_relevant_tables = len(selected_table_names) > 0
+            selection_result = selection_chain.invoke(input_data)
+            selected_table_names = selection_result["selected_table_names"]
 
-        logger.info(
-            f"LLM selection result: Selected tables {selected_table_names}\n"
-            f"Selection reasoning: {selection_result['selection_reasoning']}"
-        )
+            logger.info(
+                f"LLM selection result: Selected tables {selected_table_names}\n"
+                f"Selection reasoning: {selection_result['selection_reasoning']}"
+            )
+        has_relevant_tables = bool(selected_table_names)
 
         # 4. Extract complete information of selected tables from candidates
+        candidates_by_name = {table["table_name"]: table for table in candidate_tables}
         matched_tables = [
-            table
-            for table in candidate_tables
-            if table["table_name"] in selected_table_names
+            candidates_by_name[name]
+            for name in selected_table_names
+            if name in candidates_by_name
         ]
 
         # 5. If no relevant tables found, add user-friendly prompt message
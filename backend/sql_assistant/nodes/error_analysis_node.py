@@ -4,19 +4,26 @@ Responsible for analyzing SQL execution error causes and providing repair soluti
 """
 
 import logging
-from datetime import datetime
+import re
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from typing import Optional
-from langchain_core.messages import AIMessage
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
+from backend.sql_assistant.utils.llm_cache import LLMCache
+from backend.sql_assistant.utils.prompt_utils import NATURAL_TABLE_NAMES_RULE, ROLE_PREAMBLE
 from backend.sql_assistant.utils.format_utils import (
-    format_table_structures,
-    format_term_descriptions,
+    get_formatted_table_structures,
+    get_formatted_term_descriptions,
+    get_current_date,
+    feedback_message_update,
 )
 # Service function imports
 from utils.services.llm import init_language_model, LanguageModelChain
 
+# Core infrastructure imports
+from utils.core.constants import ErrorMessages
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,7 +40,7 @@ class ErrorAnalysisResult(BaseModel):
     user_feedback: Optional[str] = Field(None, description="User-friendly error explanation")
 
 
-ERROR_ANALYSIS_SYSTEM_PROMPT = """You are a professional data analyst responsible for analyzing SQL execution failure causes and providing solutions.
+ERROR_ANALYSIS_SYSTEM_PROMPT = f"""{ROLE_PREAMBLE} responsible for analyzing SQL execution failure causes and providing solutions.
 Please follow these rules for analysis:
 
 1. Error type analysis:
@@ -45,42 +52,29 @@ Please follow these rules for analysis:
    - Other system errors: Database server issues, etc.
 
 2. Determine repairability:
-   - Repairable: Issues that can be resolved by modifying SQL statements (syntax errors, field errors, etc.)
-   - Non-repairable: Issues requiring system-level solutions (permissions, connections, etc.)
-
-3. Repair suggestions:
-   - If it's a repairable error, provide specific corrected SQL statement
-   - Ensure corrected SQL matches original query intent
-   - Maintain SQL optimization principles
-   - Ensure correct table and field names are used
-
-4. User feedback requirements:
-   - For permission issues:
-     * Point out which tables the user lacks access permissions for
-     * Use natural language to represent table names, don't expose database table names
-     * Suggest user contact data team to apply for appropriate permissions
-   - For other non-repairable issues:
-     * Explain the problem in easy-to-understand language
-     * Provide clear follow-up handling suggestions
-     * Express appropriate apologies
-
-5. Output requirements:
-   - Clearly indicate whether it can be fixed by modifying SQL
-   - Explain error causes in detail
-   - For repairable errors, provide corrected SQL
-   - For non-repairable errors, provide user-friendly feedback information"""
-
-ERROR_ANALYSIS_USER_PROMPT = """Please analyze the causes of the following SQL execution failure and provide solutions:
-
-1. Original query requirements:
-{rewritten_query}
+   - Repairable (is_sql_fixable = true): resolved by modifying the SQL statement (syntax errors, field errors, etc.)
+   - Non-repairable: requires system-level solutions (permissions, connections, etc.)
+
+3. For repairable errors, provide the corrected SQL in fixed_sql:
+   - Keep the original query intent and SQL optimization principles
+   - Use correct table and field names
 
-2. Available table structures:
+4. For non-repairable errors, provide user_feedback:
+   - Permission issues: point out which tables the user lacks access to and suggest contacting the data team for permissions
+   - Other issues: explain the problem in easy-to-understand language, with clear follow-up suggestions and an appropriate apology
+   - {NATURAL_TABLE_NAMES_RULE}"""
+
+ERROR_ANALYSIS_USER_PROMPT = """Please analyze the causes of the following SQL execution failure and provide solutions.
+
+1. Available table structures:
 {table_structures}
 
-3. Business term explanations:
+2. Business term explanations:
 {term_descriptions}
 
+3. Original query requirements:
+{rewritten_query}
+
 4. Current date:
 {current_date}
 
@@ -89,8 +83,6 @@ ERROR_ANALYSIS_USER_PROMPT = """Please analyze the causes of the following SQL e
 
 6. Error message:
 {error_message}
-
-Please analyze error causes, determine whether it can be fixed by modifying SQL, and output analysis results in the specified JSON format.
 """
 
 
@@ -106,6 +98,69 @@ def create_error_analysis_chain(temperature: float = 0.0) -> LanguageModelChain:
     )()
 
 
+@lru_cache(maxsize=None)
+def _get_error_analysis_chain(temperature: float = 0.0):
+    """Get shared error analysis chain, built once per temperature"""
+    return create_error_analysis_chain(temperature)
+
+
+# Parsed results of the deterministic error analysis chain
+_error_analysis_cache = LLMCache(ERROR_ANALYSIS_SYSTEM_PROMPT, ERROR_ANALYSIS_USER_PROMPT)
+
+# Errors that no SQL change can fix, classified without the LLM.
+# Fixable errors and permission errors (whose feedback must translate
+# table names) still go through the chain.
+_ERROR_RULES = [
+    (
+        re.compile(
+            r"Can't connect to|Lost connection|server has gone away|Connection refused"
+            r"|could not connect to server|connection to server .* failed",
+            re.IGNORECASE,
+        ),
+        "Database connection error, not caused by the SQL statement",
+        "Sorry, the database is temporarily unreachable. Please try again later, "
+        "or contact the data team if the problem persists.",
+    ),
+    (
+        re.compile(r"timed? ?out|Query execution was interrupted|canceling statement", re.IGNORECASE),
+        "Query was interrupted by a database timeout",
+        "Sorry, the query took too long and was stopped by the database. "
+        "Please try narrowing the query scope, e.g. a shorter time range.",
+    ),
+    (
+        re.compile(r"Too many connections|too many clients", re.IGNORECASE),
+        "Database connection limit reached, a system-level issue",
+        "Sorry, the database is busy at the moment. Please try again later.",
+    ),
+    (
+        re.compile(re.escape(ErrorMessages.MAX_RETRY_EXCEEDED)),
+        "SQL repair retry limit reached",
+        "Sorry, the query still failed after several repair attempts. "
+        "Please try rephrasing your question.",
+    ),
+]
+
+
+def classify_error(error_message: str) -> Optional[dict]:
+    """Classify a non-fixable execution error by rule
+
+    Args:
+        error_message: Error message of the failed execution
+
+    Returns:
+        Optional[dict]: Error analysis result, None if no rule matches
+    """
+    for pattern, analysis, user_feedback in _ERROR_RULES:
+        if pattern.search(error_message):
+            return {
+                "error_analysis": analysis,
+                "is_sql_fixable": False,
+                "fixed_sql": None,
+                "user_feedback": user_feedback,
+            }
+    return None
+
+
 def error_analysis_node(state: SQLAssistantState) -> dict:
     """SQL error analysis node function
 
@@ -128,42 +183,40 @@ def error_analysis_node(state: SQLAssistantState) -> dict:
         return {"error": "Generated SQL not found in state"}
 
     try:
-        # Prepare input data
-        input_data = {
-            "rewritten_query": state["rewritten_query"],
-            "table_structures": format_table_structures(state["table_structures"]),
-            "term_descriptions": format_term_descriptions(
-                state.get("domain_term_mappings", {})
-            ),
-            "current_date": datetime.now().strftime("%Y-%m-%d"),
-            "failed_sql": generated_sql.get("permission_controlled_sql", ""),
-            "error_message": execution_result["error"],
-        }
+        # Known system-level errors are classified without the LLM
+        result = classify_error(str(execution_result["error"]))
+        if result is None:
+            # Prepare input data
+            input_data = {
+                "rewritten_query": state["rewritten_query"],
+                "table_structures": get_formatted_table_structures(state),
+                "term_descriptions": get_formatted_term_descriptions(state),
+                "current_date": get_current_date(),
+                "failed_sql": generated_sql.get("permission_controlled_sql", ""),
+                "error_message": execution_result["error"],
+            }
 
-        # Create and execute error analysis chain
-        analysis_chain = create_error_analysis_chain()
-        result = analysis_chain.invoke(input_data)
+            # Create and execute error analysis chain
+            analysis_chain = _get_error_analysis_chain()
+            result = _error_analysis_cache.get_or_compute(
+                input_data, lambda: analysis_chain.invoke(input_data)
+            )
 
-        logger.info(f"Error analysis result: Is fixable={result['is_sql_fixable']}")
+        logger.info("Error analysis result: Is fixable=%s", result["is_sql_fixable"])
         if result['is_sql_fixable'] and result['fixed_sql']:
-            logger.info(f"Fixed SQL: {result['fixed_sql']}")
+            logger.info("Fixed SQL: %s", result["fixed_sql"])
 
-        # Construct return result
-        response = {
+        # Construct return result, adding a message only when there's user feedback
+        return {
             "error_analysis_result": {
                 "is_sql_fixable": result["is_sql_fixable"],
                 "error_analysis": result["error_analysis"],
                 "fixed_sql": result["fixed_sql"] if result["is_sql_fixable"] else None,
                 "user_feedback": result["user_feedback"]
-            }
+            },
+            **feedback_message_update(result.get("user_feedback")),
         }
 
-        # Only add message when there's user feedback
-        if result.get("user_feedback"):
-            response["messages"] = [AIMessage(content=result["user_feedback"])]
-
-        return response
-
     except Exception as e:
         error_msg = f"Error analysis process error: {str(e)}"
         logger.error(error_msg)
@@ -6,15 +6,18 @@ Responsible for evaluating whether existing data tables can meet user query requ
 from pydantic import BaseModel, Field
 from typing import Optional
 import logging
+from functools import lru_cache
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
+from backend.sql_assistant.utils.llm_cache import LLMCache
+from backend.sql_assistant.utils.prompt_utils import NATURAL_TABLE_NAMES_RULE, ROLE_PREAMBLE
 from backend.sql_assistant.utils.format_utils import (
-    format_table_structures,
-    format_term_descriptions,
+    get_formatted_table_structures,
+    get_formatted_term_descriptions,
+    feedback_message_update,
 )
 # Service function imports
 from utils.services.llm import init_language_model, LanguageModelChain
-from langchain_core.messages import AIMessage
 
 logger = logging.getLogger(__name__)
 
@@ -36,62 +39,46 @@ class FeasibilityCheckResult(BaseModel):
     )
 
 
-FEASIBILITY_CHECK_SYSTEM_PROMPT = """You are a professional data analysis expert who needs to rigorously evaluate whether data tables can provide complete and accurate information to answer user queries.
+FEASIBILITY_CHECK_SYSTEM_PROMPT = f"""{ROLE_PREAMBLE} who must rigorously evaluate whether data tables can provide complete and accurate information to answer user queries.
 
 Assessment steps:
 
-1. Analyze basic attributes of data tables
-   - Understand the main purpose of data tables (e.g., transaction records, training records, employee roster)
-   - Determine update characteristics of data tables (e.g., snapshot, transaction log, master data)
-   - Evaluate coverage scope of data tables (e.g., whether it includes all employees, or only specific groups)
-
-2. Analyze data requirements of user queries
-   - Identify core information needed for queries (e.g., headcount, amount, status)
-   - Determine business scope of queries (e.g., all employees, specific departments, specific time periods)
-   - Judge whether queries require accurate point-in-time data
-
-3. Strict matching assessment
-   Must satisfy ALL following conditions to be judged as matching (is_feasible = true):
-   - Main purpose of data tables is directly related to query objectives
-   - Data tables contain complete information required for queries
-   - Coverage scope of data tables meets query requirements
-   - Data tables can provide accurate results (not partial data or derived data)
-
-4. Common non-matching situations
-   Following situations must be judged as non-matching (is_feasible = false):
-   - Statistical scope of data tables does not match query requirements
-   - Data tables have related fields but cannot guarantee data completeness
-   - Complex derivation is needed to obtain query results
-
-5. Output requirements:
-   a) feasible_analysis should include:
-      - Identify core data requirements of user queries
-      - Analyze key information of existing data tables
-      - Explain main reasons for matching or non-matching
-      - Keep concise reasoning process records
-
-   b) When judged as non-matching, user_feedback should:
-      - Distinguish between two situations:
-        * No data tables related to user queries in the database
-        * Related tables exist but lack necessary field information
-      - Use natural language to describe table names, do not expose database table names
-      - Inform users concisely and clearly, avoid over-explanation
+1. Analyze the data tables
+   - Main purpose (e.g., transaction records, training records, employee roster)
+   - Update characteristics (e.g., snapshot, transaction log, master data)
+   - Coverage scope (e.g., all employees or only specific groups)
+
+2. Analyze the query
+   - Core information needed (e.g., headcount, amount, status)
+   - Business scope (e.g., all employees, specific departments, specific time periods)
+   - Whether accurate point-in-time data is required
+
+3. Strict matching
+   is_feasible is true only if ALL of the following hold:
+   - The tables' main purpose is directly related to the query objective
+   - The tables contain complete information for the query, not merely related fields
+   - The tables' coverage scope meets the query requirements
+   - Results can be obtained without complex derivation or partial data
+
+4. Output requirements:
+   a) feasible_analysis: concise reasoning covering the query's core data requirements, the key table information and the main reasons for the judgment
+   b) When not feasible, user_feedback should:
+      - Distinguish between no related tables and related tables lacking necessary fields
+      - {NATURAL_TABLE_NAMES_RULE}
+      - Inform users concisely and clearly
 """
 
 
-FEASIBILITY_CHECK_USER_PROMPT = """Please evaluate whether the following data tables contain sufficient information to answer user queries:
+FEASIBILITY_CHECK_USER_PROMPT = """Please evaluate whether the following data tables contain sufficient information to answer the user query, following the system assessment steps.
 
-1. User query requirements:
-{rewritten_query}
-
-2. Existing data table structures:
+1. Existing data table structures:
 {table_structures}
 
-3. Related business term explanations (if exist):
+2. Related business term explanations (if exist):
 {term_descriptions}
 
-Please first understand the basic attributes and coverage scope of data tables, then rigorously evaluate whether accurate query results can be provided.
-Even if data tables contain related fields, judge whether data completeness and accuracy meet query requirements."""
+3. User query requirements:
+{rewritten_query}"""
 
 
 def create_feasibility_check_chain(temperature: float = 0.0) -> LanguageModelChain:
@@ -106,6 +93,43 @@ def create_feasibility_check_chain(temperature: float = 0.0) -> LanguageModelCha
     )()
 
 
+@lru_cache(maxsize=None)
+def _get_feasibility_check_chain(temperature: float = 0.0):
+    """Get shared feasibility check chain, built once per temperature"""
+    return create_feasibility_check_chain(temperature)
+
+
+# Parsed results of the deterministic feasibility check chain
+_feasibility_cache = LLMCache(FEASIBILITY_CHECK_SYSTEM_PROMPT, FEASIBILITY_CHECK_USER_PROMPT)
+
+
+def _build_feasibility_input(state: SQLAssistantState) -> dict:
+    """Build feasibility check chain input from state"""
+    return {
+        "rewritten_query": state["rewritten_query"],
+        "table_structures": get_formatted_table_structures(state),
+        "term_descriptions": get_formatted_term_descriptions(state),
+    }
+
+
+def _build_feasibility_response(result: dict) -> dict:
+    """Build state update from feasibility check result"""
+    if result["is_feasible"]:
+        logger.info("Feasibility check result: Passed")
+    else:
+        logger.info("Feasibility check result: Failed, Reason: %s", result["user_feedback"])
+
+    user_feedback = result["user_feedback"] if not result["is_feasible"] else None
+    return {
+        "feasibility_check": {
+            "is_feasible": result["is_feasible"],
+            "feasible_analysis": result["feasible_analysis"],
+            "user_feedback": user_feedback,
+        },
+        **feedback_message_update(user_feedback),
+    }
+
+
 def feasibility_check_node(state: SQLAssistantState) -> dict:
     """Query feasibility check node function"""
     if not state.get("rewritten_query"):
@@ -114,32 +138,33 @@ def feasibility_check_node(state: SQLAssistantState) -> dict:
         return {"error": "Table structure information not found in state"}
 
     try:
-        input_data = {
-            "rewritten_query": state["rewritten_query"],
-            "table_structures": format_table_structures(state["table_structures"]),
-            "term_descriptions": format_term_descriptions(
-                state.get("domain_term_mappings", {})
-            ),
-        }
-
-        check_chain = create_feasibility_check_chain()
-        result = check_chain.invoke(input_data)
-
-        logger.info(f"Feasibility check result: {'Passed' if result['is_feasible'] else 'Failed'}" +
-                   (f", Reason: {result['user_feedback']}" if not result['is_feasible'] else ""))
-
-        response = {
-            "feasibility_check": {
-                "is_feasible": result["is_feasible"],
-                "feasible_analysis": result["feasible_analysis"],
-                "user_feedback": result["user_feedback"] if not result["is_feasible"] else None,
-            }
-        }
-
-        if not result["is_feasible"] and result["user_feedback"]:
-            response["messages"] = [AIMessage(content=result["user_feedback"])]
-
-        return response
+        input_data = _build_feasibility_input(state)
+
+        check_chain = _get_feasibility_check_chain()
+        result = _feasibility_cache.get_or_compute(
+            input_data, lambda: check_chain.invoke(input_data)
+        )
+
+        return _build_feasibility_response(result)
+
+    except Exception as e:
+        error_msg = f"Feasibility check process error: {str(e)}"
+        return {"error": error_msg}
+
+
+async def feasibility_check_node_async(state: SQLAssistantState) -> dict:
+    """Asynchronous variant of feasibility_check_node"""
+    if not state.get("rewritten_query"):
+        return {"error": "Rewritten query not found in state"}
+    if not state.get("table_structures"):
+        return {"error": "Table structure information not found in state"}
+
+    try:
+        input_data = _build_feasibility_input(state)
+        result = await _feasibility_cache.aget_or_compute(
+            input_data, lambda: _get_feasibility_check_chain().ainvoke(input_data)
+        )
+        return _build_feasibility_response(result)
 
     except Exception as e:
         error_msg = f"Feasibility check process error: {str(e)}"
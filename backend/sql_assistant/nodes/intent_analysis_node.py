@@ -7,12 +7,21 @@ from typing import Optional
 from pydantic import BaseModel, Field
 from langchain_core.messages import AIMessage
 import logging
+from functools import lru_cache
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
-from backend.sql_assistant.utils.format_utils import format_conversation_history
+from backend.sql_assistant.utils.format_utils import (
+    format_conversation_history,
+    has_meaningful_input,
+)
+from backend.sql_assistant.utils.llm_cache import LLMCache
+from backend.sql_assistant.utils.prompt_utils import ROLE_PREAMBLE
 # Service function imports
 from utils.services.llm import init_language_model, LanguageModelChain
 
+# Core infrastructure imports
+from utils.core.streamlit_config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,29 +37,24 @@ class QueryIntentAnalysis(BaseModel):
     )
 
 
-INTENT_CLARITY_ANALYSIS_PROMPT = """
-You are a professional data query assistant responsible for determining the executability of user data query requests. Please analyze the user's query intent with an open and pragmatic attitude.
+INTENT_CLARITY_ANALYSIS_PROMPT = f"""{ROLE_PREAMBLE} responsible for determining whether a user's data query request can be executed. Analyze the intent with an open and pragmatic attitude.
 
 Judgment criteria:
-1. Clear query objective: Clearly understand what data the user wants to query
-2. Complete query conditions: If filtering is needed, are the conditions clear (not mandatory)
-3. Clear time range: If the query involves time, is the time range clear (not mandatory)
-4. Allow the existence of unknown proprietary terms and domain terminology, which will be explained in subsequent steps
-5. Be tolerant of vague but inferable queries
+1. The query objective is clear: it is understood what data the user wants
+2. Filter conditions and time range are clear where needed (not mandatory)
+3. Unknown proprietary or domain terms are allowed; they are explained in later steps
+4. Vague but inferable queries are accepted
 
 Output requirements:
-1. If it's not a data query request, set is_intent_clear to false and generate a reply explaining that you can only handle data query related questions
-2. If intent is clear, set is_intent_clear to true
-3. If intent is unclear, set is_intent_clear to false and generate a specific question to obtain missing information
-4. Questions should specifically point out missing information points for user understanding and response
+1. Not a data query request: set is_intent_clear to false and reply that only data query questions can be handled
+2. Intent clear: set is_intent_clear to true
+3. Intent unclear: set is_intent_clear to false and ask a specific question naming the missing information
 """
 
-INTENT_ANALYSIS_USER_PROMPT = """Please analyze the following user's data query request:
+INTENT_ANALYSIS_USER_PROMPT = """Please analyze the following user's data query request and output the analysis results in the specified JSON format according to the system instructions.
 
 User query:
-{query}
-
-Please output the analysis results in the specified JSON format according to the system instructions."""
+{query}"""
 
 
 def create_intent_clarity_analyzer(temperature: float = 0.0) -> LanguageModelChain:
@@ -73,6 +77,59 @@ def create_intent_clarity_analyzer(temperature: float = 0.0) -> LanguageModelCha
     )()
 
 
+@lru_cache(maxsize=None)
+def _get_intent_clarity_analyzer(temperature: float = 0.0):
+    """Get shared intent clarity analysis chain, built once per temperature"""
+    return create_intent_clarity_analyzer(temperature)
+
+
+# Parsed intent analysis results, the only cache of this node; paraphrased
+# conversations can match by embedding
+_intent_cache = LLMCache(
+    INTENT_CLARITY_ANALYSIS_PROMPT,
+    INTENT_ANALYSIS_USER_PROMPT,
+    semantic_field="query" if settings.llm.semantic_cache_enabled else None,
+    similarity_threshold=settings.llm.semantic_cache_threshold,
+)
+
+
+# Result returned without a model call when user messages hold no usable text
+_EMPTY_QUERY_RESULT = {
+    "is_intent_clear": False,
+    "clarification_question": "Please describe the data you would like to query.",
+}
+
+
+def _build_intent_response(result: dict, dialogue_history: str) -> dict:
+    """Build state update from intent analysis result
+
+    The formatted conversation history is stored as well so later nodes reuse it.
+    """
+    logger.info(
+        "Intent analysis result: Intent clarity=%s, Clarification question=%s",
+        result["is_intent_clear"], result.get("clarification_question"),
+    )
+
+    # If intent is unclear, add an assistant message asking for clarification
+    response = {}
+    if not result["is_intent_clear"] and result.get("clarification_question"):
+        response["messages"] = [
+            AIMessage(content=result["clarification_question"])]
+
+    # Update state
+    response.update({
+        "query_intent": {
+            "is_clear": result["is_intent_clear"],
+            "clarification_needed": not result["is_intent_clear"],
+            "clarification_question": result["clarification_question"] if not result["is_intent_clear"] else None
+        },
+        "is_intent_clear": result["is_intent_clear"],
+        "dialogue_history": dialogue_history,
+    })
+
+    return response
+
+
 def intent_analysis_node(state: SQLAssistantState) -> dict:
     """Node function for analyzing user query intent
 
@@ -94,29 +151,35 @@ def intent_analysis_node(state: SQLAssistantState) -> dict:
     dialogue_history = format_conversation_history(messages)
 
     # Add user query log
-    logger.info(f"User query: {dialogue_history}")
+    logger.info("User query: %s", dialogue_history)
+
+    # Ask for a query directly when the messages contain nothing to analyze
+    if not has_meaningful_input(messages):
+        return _build_intent_response(_EMPTY_QUERY_RESULT, dialogue_history)
 
     # Create analysis chain
-    analysis_chain = create_intent_clarity_analyzer()
+    analysis_chain = _get_intent_clarity_analyzer()
 
     # Execute analysis
-    result = analysis_chain.invoke({"query": dialogue_history})
-    logger.info(f"Intent analysis result: Intent clarity={result['is_intent_clear']}, Clarification question={result.get('clarification_question')}")
+    input_data = {"query": dialogue_history}
+    result = _intent_cache.get_or_compute(input_data, lambda: analysis_chain.invoke(input_data))
+    return _build_intent_response(result, dialogue_history)
 
-    # If intent is unclear, add an assistant message asking for clarification
-    response = {}
-    if not result["is_intent_clear"] and result.get("clarification_question"):
-        response["messages"] = [
-            AIMessage(content=result["clarification_question"])]
 
-    # Update state
-    response.update({
-        "query_intent": {
-            "is_clear": result["is_intent_clear"],
-            "clarification_needed": not result["is_intent_clear"],
-            "clarification_question": result["clarification_question"] if not result["is_intent_clear"] else None
-        },
-        "is_intent_clear": result["is_intent_clear"]
-    })
+async def intent_analysis_node_async(state: SQLAssistantState) -> dict:
+    """Asynchronous variant of intent_analysis_node"""
+    messages = state.get("messages", [])
+    if not messages:
+        raise ValueError("No message history found in state")
 
-    return response
+    dialogue_history = format_conversation_history(messages)
+    logger.info("User query: %s", dialogue_history)
+
+    if not has_meaningful_input(messages):
+        return _build_intent_response(_EMPTY_QUERY_RESULT, dialogue_history)
+
+    input_data = {"query": dialogue_history}
+    result = await _intent_cache.aget_or_compute(
+        input_data, lambda: _get_intent_clarity_analyzer().ainvoke(input_data)
+    )
+    return _build_intent_response(result, dialogue_history)
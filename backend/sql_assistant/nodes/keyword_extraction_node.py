@@ -6,14 +6,27 @@ Responsible for extracting key business entities and terms from user queries.
 from pydantic import BaseModel, Field
 from typing import List
 import logging
+import re
+from functools import lru_cache
+
+from langchain_core.messages import HumanMessage
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
-from backend.sql_assistant.utils.format_utils import format_conversation_history
+from backend.sql_assistant.utils.format_utils import (
+    format_conversation_history,
+    has_meaningful_input,
+)
+from backend.sql_assistant.utils.node_cache import memoize_node
+from backend.sql_assistant.utils.prompt_utils import ROLE_PREAMBLE
 # Service function imports
 from utils.services.llm import init_language_model, LanguageModelChain
 
 logger = logging.getLogger(__name__)
 
+# Runs of two or more CJK characters may be entity names
+_CJK_PATTERN = re.compile(r"[\u4e00-\u9fff]{2,}")
+_TOKEN_PATTERN = re.compile(r"\w+")
+
 
 class QueryKeywordExtraction(BaseModel):
     """Query keyword extraction result model"""
@@ -24,11 +37,9 @@ class QueryKeywordExtraction(BaseModel):
 
 
 # System prompt for domain entity extraction
-DOMAIN_ENTITY_EXTRACTION_PROMPT = """You are a professional data analyst responsible for extracting specific business entity names that require precise matching from user queries.
+DOMAIN_ENTITY_EXTRACTION_PROMPT = f"""{ROLE_PREAMBLE} responsible for extracting specific business entity names that require precise matching from user queries.
 
-Extraction principles:
-1. Only extract specific entity names that require exact matching in the database
-2. These entities typically have uniqueness and specificity - replacing them with other names would lead to completely different query results
+Only extract unique business entities that must be matched exactly against values in the database, i.e. replacing them with other names would give completely different query results.
 
 Do NOT extract:
 1. Generic concept words (e.g., training, data, personnel, content)
@@ -36,24 +47,15 @@ Do NOT extract:
 3. Vague descriptive words (e.g., recent, all)
 4. Common measurement units (e.g., quantity, amount, ratio)
 
-Judgment criteria:
-- Does this word need to be precisely matched against specific values in the database?
-- Would replacing it with other words result in completely different query results?
-- Does this word represent a unique business entity?
-
 Output requirements:
-1. Only output entity names that truly require exact matching
-2. Return empty list if no entities requiring exact matching are found
-3. Remove duplicates
-4. Maintain original form of entity expressions"""
+1. Return an empty list if no such entities are found
+2. Remove duplicates
+3. Keep the original form of each entity"""
 
-KEYWORD_EXTRACTION_USER_PROMPT = """Please extract specific business entity names that require exact matching from the following conversation:
+KEYWORD_EXTRACTION_USER_PROMPT = """Extract the business entity names that require exact matching from the following conversation, following the system rules.
 
 Conversation history:
-{dialogue_history}
-
-Please extract key entities according to the rules in the system message and output results in the specified JSON format.
-Note: Only extract entity names that need to be precisely matched against specific values in the database."""
+{dialogue_history}"""
 
 
 def create_keyword_extraction_chain(temperature: float = 0.0) -> LanguageModelChain:
@@ -74,6 +76,53 @@ def create_keyword_extraction_chain(temperature: float = 0.0) -> LanguageModelCh
     )()
 
 
+@lru_cache(maxsize=None)
+def _get_keyword_extraction_chain(temperature: float = 0.0):
+    """Get shared keyword extraction chain, built once per temperature"""
+    return create_keyword_extraction_chain(temperature)
+
+
+def has_entity_candidates(state: SQLAssistantState) -> bool:
+    """Cheaply check whether the user's messages may contain entity names
+
+    Entity names are proper nouns, codes or Chinese terms, so a conversation whose
+    user messages are nearly empty, or contain no capitalized or digit-bearing
+    token and no CJK text, cannot yield keywords. The check errs on the side of calling the LLM.
+
+    Args:
+        state: Current state object
+
+    Returns:
+        bool: False only when keyword extraction can be skipped
+    """
+    messages = state.get("messages", [])
+    if not has_meaningful_input(messages):
+        return False
+    for message in messages:
+        if not isinstance(message, HumanMessage) or not isinstance(message.content, str):
+            continue
+        text = message.content
+        if _CJK_PATTERN.search(text):
+            return True
+        for token in _TOKEN_PATTERN.findall(text):
+            if len(token) > 1 and (token[0].isupper() or any(ch.isdigit() for ch in token)):
+                return True
+    return False
+
+
+def _get_dialogue_history(state: SQLAssistantState) -> str:
+    """Get formatted conversation history from state
+
+    Formats the messages itself: this node runs in the same step as intent
+    analysis, so a stored dialogue_history would still be the previous turn's.
+    """
+    messages = state.get("messages", [])
+    if not messages:
+        raise ValueError("No message history found in state")
+    return format_conversation_history(messages)
+
+
+@memoize_node(lambda state: format_conversation_history(state.get("messages", [])))
 def keyword_extraction_node(state: SQLAssistantState) -> dict:
     """Keyword extraction node function
 
@@ -86,25 +135,43 @@ def keyword_extraction_node(state: SQLAssistantState) -> dict:
     Returns:
         dict: State update containing extracted keywords
     """
-    # Get conversation history
-    messages = state.get("messages", [])
-    if not messages:
-        raise ValueError("No message history found in state")
-
     # Format conversation history
-    dialogue_history = format_conversation_history(messages)
+    dialogue_history = _get_dialogue_history(state)
+
+    # Skip the LLM call when no message can contain an entity name
+    if not has_entity_candidates(state):
+        logger.info("No entity candidates in user messages, skipping keyword extraction")
+        return {"keywords": []}
 
     # Create extraction chain
-    extraction_chain = create_keyword_extraction_chain()
+    extraction_chain = _get_keyword_extraction_chain()
 
     # Execute extraction
-    result = extraction_chain.invoke({
-        "dialogue_history": dialogue_history
-    })
+    input_data = {"dialogue_history": dialogue_history}
+    result = extraction_chain.invoke(input_data)
 
-    logger.info(f"Extracted keywords: {result['keywords']}")
+    logger.info("Extracted keywords: %s", result["keywords"])
 
     # Update state
     return {
         "keywords": result["keywords"]
     }
+
+
+@memoize_node(lambda state: format_conversation_history(state.get("messages", [])))
+async def keyword_extraction_node_async(state: SQLAssistantState) -> dict:
+    """Asynchronous variant of keyword_extraction_node"""
+    dialogue_history = _get_dialogue_history(state)
+
+    if not has_entity_candidates(state):
+        logger.info("No entity candidates in user messages, skipping keyword extraction")
+        return {"keywords": []}
+
+    input_data = {"dialogue_history": dialogue_history}
+    result = await _get_keyword_extraction_chain().ainvoke(input_data)
+
+    logger.info("Extracted keywords: %s", result["keywords"])
+
+    return {
+        "keywords": result["keywords"]
+    }
@@ -4,8 +4,12 @@ Responsible for SQL permission verification and permission condition injection.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, NamedTuple
-from sqlalchemy import text
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, NamedTuple
+from sqlalchemy import Connection, text
 import os
 import sqlparse
 from sqlparse.sql import TokenList, Identifier
@@ -18,10 +22,131 @@ from backend.sql_assistant.states.assistant_state import SQLAssistantState
 from utils.factories.database import DatabaseFactory
 
 # Core infrastructure imports
+from utils.core.cache import TTLCache
+from utils.core.constants import CacheConstants, RegexPatterns
 from utils.core.streamlit_config import settings
 
 logger = logging.getLogger(__name__)
 
+# Permission metadata shared by all validators; entries are replaced after their TTL
+_table_permission_cache = TTLCache(
+    maxsize=CacheConstants.TABLE_PERMISSION_MAXSIZE, ttl=CacheConstants.TABLE_PERMISSION_TTL
+)
+_user_permission_cache = TTLCache(
+    maxsize=CacheConstants.USER_PERMISSION_MAXSIZE, ttl=CacheConstants.USER_PERMISSION_TTL
+)
+
+
+# Keywords that can follow a table reference and must not be taken as its alias
+_NON_ALIAS_KEYWORDS = (
+    "where", "on", "using", "join", "inner", "left", "right", "full", "cross",
+    "outer", "natural", "straight_join", "group", "order", "having", "limit",
+    "offset", "union", "intersect", "except", "window", "for", "lock",
+    "use", "ignore", "force",
+)
+# Table references following FROM/JOIN, with optional alias; names may be backquoted.
+# A name followed by a dot is a qualifier (schema or column reference) and is skipped.
+# Groups: 1 quoted table name, 2 table name, 3 quoted alias, 4 alias
+_TABLE_REFERENCE_PATTERN = re.compile(
+    r"\b(?:FROM|JOIN)\s+(`?([A-Za-z_]\w*)`?)(?![\w`]*\s*\.)"
+    rf"(?:\s+(?:AS\s+)?(?!(?:{'|'.join(_NON_ALIAS_KEYWORDS)})\b)(`?([A-Za-z_]\w*)`?))?",
+    re.IGNORECASE,
+)
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*")
+# Identifiers that are not qualifiers of a following column, e.g. "employees" in
+# "FROM hr.employees" but not in "employees.name"
+_UNQUALIFYING_IDENTIFIER_PATTERN = re.compile(r"\b[A-Za-z_]\w*(?![\w`]*\s*\.)")
+
+
+# Fixed-shape table name filters per SQL dialect, so the statement text does not
+# change with the number of tables; other dialects expand an IN list
+_TABLE_NAME_FILTERS = {
+    "postgresql": "table_name = ANY(:table_names)",
+    "mysql": "FIND_IN_SET(table_name, :table_names) > 0",
+}
+_TEXT_CASTS = {
+    "postgresql": "TEXT",
+    "mysql": "CHAR",
+}
+
+
+def _table_name_filter(dialect_name: str) -> str:
+    """Get WHERE condition matching table_name against the :table_names parameter"""
+    return _TABLE_NAME_FILTERS.get(dialect_name, "table_name IN :table_names")
+
+
+def _table_names_param(dialect_name: str, table_names: frozenset) -> Any:
+    """Build the :table_names parameter value in the shape the dialect filter expects"""
+    if dialect_name == "postgresql":
+        return sorted(table_names)
+    if dialect_name == "mysql":
+        return ",".join(sorted(table_names))
+    return tuple(table_names)
+
+
+@lru_cache(maxsize=8)
+def _permission_configs_query(dialect_name: str):
+    """Get table permission configuration query for the dialect"""
+    return text(
+        f"""
+            SELECT table_name, need_dept_control, dept_path_field
+            FROM table_permission_config
+            WHERE {_table_name_filter(dialect_name)}
+            AND status = 1
+        """
+    )
+
+
+@lru_cache(maxsize=8)
+def _permission_context_query(dialect_name: str):
+    """Get combined accessible tables, configurations and department paths query for the dialect"""
+    return text(
+        f"""
+            SELECT 'acc' AS kind, tpc.table_name AS v1, NULL AS v2, NULL AS v3
+            FROM user_role ur
+            JOIN role_table_permission rtp ON ur.role_id = rtp.role_id
+            JOIN table_permission_config tpc ON rtp.table_permission_id = tpc.table_permission_id
+            WHERE ur.user_id = :user_id
+            AND tpc.status = 1
+            UNION ALL
+            SELECT 'cfg', table_name, need_dept_control, dept_path_field
+            FROM table_permission_config
+            WHERE {_table_name_filter(dialect_name)}
+            AND status = 1
+            UNION ALL
+            SELECT 'dept', CAST(dept_id AS {_TEXT_CASTS.get(dialect_name, "CHAR")}), NULL, NULL
+            FROM user_department
+            WHERE user_id = :user_id
+        """
+    )
+
+
+def _get_or_load(cache: TTLCache, key: Hashable, loader: Callable[[], Any]) -> Any:
+    """Return cached value, loading and caching it on a miss"""
+    value = cache.get(key)
+    if value is None:
+        value = loader()
+        cache.set(key, value)
+    return value
+
+
+@lru_cache(maxsize=512)
+def _compiled_table_pattern(table_name: str, alias: Optional[str]) -> "re.Pattern":
+    """Get compiled case-insensitive pattern matching a table reference"""
+    if alias:
+        pattern = RegexPatterns.TABLE_ALIAS_PATTERN.format(table_name=table_name, alias=alias)
+    else:
+        pattern = RegexPatterns.TABLE_NAME_PATTERN.format(table_name=table_name)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _dept_regexp_pattern(dept_paths: Tuple[str, ...]) -> str:
+    """Get REGEXP pattern matching any of the department paths"""
+    return "|".join(
+        RegexPatterns.DEPT_PATH_PATTERN.format(dept_id=dept_id) for dept_id in dept_paths
+    )
+
 
 class TablePermissionConfig(BaseModel):
     """Table permission configuration model"""
@@ -32,10 +157,110 @@ class TablePermissionConfig(BaseModel):
 
 
 class TableInfo(NamedTuple):
-    """Table information including table name and alias"""
+    """Table information including table name and alias
+
+    ``start`` and ``end`` delimit the whole reference (table name and alias) in
+    the SQL text when known, so it can be replaced without searching again.
+    """
 
     name: str
     alias: Optional[str]
+    start: Optional[int] = None
+    end: Optional[int] = None
+
+
+# Tokens ending an sqlparse identifier that are not an alias
+_ALIAS_STOP_WORDS = frozenset({"as", "from", "join", "where", "on", "and", "or"})
+
+
+def _find_mentioned_tables(sql: str, lower_tables: frozenset) -> Counter:
+    """Count occurrences of configured table names appearing in the SQL as identifiers
+
+    Returns:
+        Counter: Occurrences per lowercased table name, only names that appear
+    """
+    return Counter(
+        lower for lower in map(str.lower, _IDENTIFIER_PATTERN.findall(sql))
+        if lower in lower_tables
+    )
+
+
+def _scan_table_references(
+    sql: str, lower_tables: frozenset, mentioned: Optional[Counter] = None
+) -> Optional[List[TableInfo]]:
+    """Extract known table references with a single regex pass
+
+    The result is only trusted when every occurrence of every configured table
+    name is a matched reference. A single unmatched occurrence (comma join,
+    schema-qualified name, parenthesized subquery source, column qualifier)
+    could be a reference left without permission conditions.
+
+    Args:
+        sql: SQL statement
+        lower_tables: Lowercased names of all configured tables
+        mentioned: Result of _find_mentioned_tables, computed when omitted
+
+    Returns:
+        Optional[List[TableInfo]]: Table information, or None when a configured
+        table name appears in the SQL outside a simple FROM/JOIN reference,
+        so a full parse is needed
+    """
+    tables = []
+    matched = Counter()
+    for match in _TABLE_REFERENCE_PATTERN.finditer(sql):
+        name, alias = match.group(2), match.group(4)
+        lower = name.lower()
+        if lower in lower_tables:
+            tables.append(TableInfo(name, alias, match.start(1), match.end()))
+            matched[lower] += 1
+
+    if mentioned is None:
+        mentioned = _find_mentioned_tables(sql, lower_tables)
+    if matched != mentioned:
+        return None
+    return tables
+
+
+def _find_unrestricted_tables(
+    sql: str, auth_subqueries: List[str], restricted_tables: frozenset
+) -> set:
+    """Get restricted tables still referenced outside the injected subqueries
+
+    Args:
+        sql: SQL statement after permission injection
+        auth_subqueries: Injected permission subqueries
+        restricted_tables: Lowercased names of tables requiring department control
+
+    Returns:
+        set: Lowercased names of restricted tables referenced without restriction
+    """
+    for auth_subquery in set(auth_subqueries):
+        sql = sql.replace(auth_subquery, " ")
+    return {
+        identifier.lower() for identifier in _UNQUALIFYING_IDENTIFIER_PATTERN.findall(sql)
+    } & restricted_tables
+
+
+class _LazyConnection:
+    """Connection checked out of the pool on first execute
+
+    Lets several cached lookups share one connection while issuing no
+    checkout at all when every lookup is served from cache.
+    """
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._conn: Optional[Connection] = None
+
+    def execute(self, *args, **kwargs):
+        if self._conn is None:
+            self._conn = self._engine.connect()
+        return self._conn.execute(*args, **kwargs)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
 
 class PermissionValidator:
@@ -45,8 +270,29 @@ class PermissionValidator:
         """Initialize database connection"""
         self.engine = DatabaseFactory.get_default_engine()
 
+    @contextmanager
+    def _connect(self, conn: Optional[Connection] = None):
+        """Use the given connection, or check one out of the pool for this block"""
+        if conn is not None:
+            yield conn
+            return
+        with self.engine.connect() as connection:
+            yield connection
+
     def get_all_table_names(self) -> List[str]:
-        """Get all configured table names from database"""
+        """Get all configured table names, cached for a few minutes"""
+        return list(_get_or_load(_table_permission_cache, "all_table_names", self._load_all_table_names))
+
+    def get_lower_table_names(self) -> frozenset:
+        """Get interned lowercased names of all configured tables, cached with the catalog"""
+        return _get_or_load(
+            _table_permission_cache,
+            "lower_table_names",
+            lambda: frozenset(sys.intern(t.lower()) for t in self.get_all_table_names()),
+        )
+
+    def _load_all_table_names(self) -> Tuple[str, ...]:
+        """Load all configured table names from database"""
         query = text(
             """
             SELECT table_name
@@ -57,70 +303,71 @@ class PermissionValidator:
 
         with self.engine.connect() as conn:
             result = conn.execute(query)
-            return [row[0] for row in result]
+            return tuple(row[0] for row in result)
 
-    def _extract_table_info(self, statement: TokenList) -> List[TableInfo]:
+    def _extract_table_info(
+        self, statement: TokenList, lower_tables: Optional[frozenset] = None
+    ) -> List[TableInfo]:
         """Extract table information from SQL statement
 
         Use sqlparse to parse SQL and extract table names and alias information.
 
         Args:
             statement: TokenList object of SQL statement
+            lower_tables: Lowercased names of all configured tables, loaded when omitted
 
         Returns:
             List[TableInfo]: List of table information
         """
         tables = []
-        all_table_names = set(self.get_all_table_names())
+        if lower_tables is None:
+            lower_tables = self.get_lower_table_names()
 
         def _process_identifier(identifier: Identifier) -> Optional[TableInfo]:
             """Process single identifier"""
-            # Get actual table name
-            tokens = list(identifier.flatten())
-
-            # Find first token matching known table names
+            # Find first token matching known table names, tracking the last
+            # token in the same pass instead of materializing the token list
             table_name = None
-            for token in tokens:
-                if token.value.lower() in {t.lower() for t in all_table_names}:
+            last_token = None
+            token_count = 0
+            for token in identifier.flatten():
+                token_count += 1
+                last_token = token
+                if table_name is None and token.value.lower() in lower_tables:
                     table_name = token.value
-                    break
 
             if not table_name:
                 return None
 
             # Check if there's an alias
             alias = None
-            if len(tokens) > 1:
+            if token_count > 1:
                 # Last token might be alias
-                last_token = tokens[-1]
-                if (
-                    last_token.value.lower() != table_name.lower()
-                    and last_token.value.lower()
-                    not in {"as", "from", "join", "where", "on", "and", "or"}
-                ):
+                last_value = last_token.value.lower()
+                if last_value != table_name.lower() and last_value not in _ALIAS_STOP_WORDS:
                     alias = last_token.value
 
             return TableInfo(table_name, alias)
 
-        def _process_token(token):
-            """Recursively process token"""
+        # Walk the token tree depth-first with an explicit stack, in statement order
+        stack = list(reversed(statement.tokens))
+        while stack:
+            token = stack.pop()
             if isinstance(token, Identifier):
                 table_info = _process_identifier(token)
                 if table_info:
                     tables.append(table_info)
             elif isinstance(token, TokenList):
-                for sub_token in token.tokens:
-                    _process_token(sub_token)
-
-        # Process all tokens
-        for token in statement.tokens:
-            _process_token(token)
+                stack.extend(reversed(token.tokens))
 
         return tables
 
     def extract_table_names(self, sql: str) -> List[TableInfo]:
         """Extract table information from SQL statement
 
+        A regex scan handles plain FROM/JOIN references; statements where it
+        may miss a configured table fall back to parsing with sqlparse.
+
         Args:
             sql: SQL statement
 
@@ -128,19 +375,43 @@ class PermissionValidator:
             List[TableInfo]: List of table information
         """
         try:
+            lower_tables = self.get_lower_table_names()
+
+            # SQL that never mentions a configured table needs no further work
+            mentioned = _find_mentioned_tables(sql, lower_tables)
+            if not mentioned:
+                return []
+
+            # Fast path: simple FROM/JOIN references are extracted by regex
+            table_infos = _scan_table_references(sql, lower_tables, mentioned)
+            if table_infos is not None:
+                return table_infos
+
             parsed = sqlparse.parse(sql)
             if not parsed:
                 raise ValueError("SQL parsing failed")
 
             statement = parsed[0]
-            return self._extract_table_info(statement)
+            return self._extract_table_info(statement, lower_tables)
 
         except Exception as e:
             logger.error(f"Error extracting table information: {str(e)}")
             raise ValueError(f"Failed to extract table information: {str(e)}")
 
-    def get_user_accessible_tables(self, user_id: int) -> List[str]:
-        """Get all table names accessible to user"""
+    def get_user_accessible_tables(
+        self, user_id: int, conn: Optional[Connection] = None
+    ) -> List[str]:
+        """Get all table names accessible to user, cached briefly per user"""
+        return list(_get_or_load(
+            _user_permission_cache,
+            ("accessible_tables", user_id),
+            lambda: self._load_user_accessible_tables(user_id, conn),
+        ))
+
+    def _load_user_accessible_tables(
+        self, user_id: int, conn: Optional[Connection] = None
+    ) -> Tuple[str, ...]:
+        """Load all table names accessible to user from database"""
         query = text(
             """
             SELECT DISTINCT tpc.table_name
@@ -152,12 +423,24 @@ class PermissionValidator:
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(query, {"user_id": user_id})
-            return [row[0] for row in result]
-
-    def get_user_dept_paths(self, user_id: int) -> List[str]:
-        """Get user's department path list"""
+        with self._connect(conn) as connection:
+            result = connection.execute(query, {"user_id": user_id})
+            return tuple(row[0] for row in result)
+
+    def get_user_dept_paths(
+        self, user_id: int, conn: Optional[Connection] = None
+    ) -> List[str]:
+        """Get user's department path list, cached briefly per user"""
+        return list(_get_or_load(
+            _user_permission_cache,
+            ("dept_paths", user_id),
+            lambda: self._load_user_dept_paths(user_id, conn),
+        ))
+
+    def _load_user_dept_paths(
+        self, user_id: int, conn: Optional[Connection] = None
+    ) -> Tuple[str, ...]:
+        """Load user's department path list from database"""
         query = text(
             """
             SELECT dept_id
@@ -166,29 +449,36 @@ class PermissionValidator:
         """
         )
 
-        with self.engine.connect() as conn:
-            result = conn.execute(query, {"user_id": user_id})
-            return [row[0] for row in result]
+        with self._connect(conn) as connection:
+            result = connection.execute(query, {"user_id": user_id})
+            return tuple(row[0] for row in result)
 
     def get_table_permission_configs(
-        self, table_names: List[str]
+        self, table_names: List[str], conn: Optional[Connection] = None
     ) -> Dict[str, TablePermissionConfig]:
-        """Get permission configuration information for tables"""
+        """Get permission configuration information for tables, cached per table set"""
         if not table_names:
             return {}
 
-        query = text(
-            """
-            SELECT table_name, need_dept_control, dept_path_field
-            FROM table_permission_config
-            WHERE table_name IN :table_names
-            AND status = 1
-        """
-        )
+        table_set = frozenset(table_names)
+        return dict(_get_or_load(
+            _table_permission_cache,
+            ("configs", table_set),
+            lambda: self._load_table_permission_configs(table_set, conn),
+        ))
+
+    def _load_table_permission_configs(
+        self, table_names: frozenset, conn: Optional[Connection] = None
+    ) -> Dict[str, TablePermissionConfig]:
+        """Load permission configuration information for tables from database"""
+        dialect_name = self.engine.dialect.name
+        query = _permission_configs_query(dialect_name)
 
         configs = {}
-        with self.engine.connect() as conn:
-            result = conn.execute(query, {"table_names": tuple(table_names)})
+        with self._connect(conn) as connection:
+            result = connection.execute(
+                query, {"table_names": _table_names_param(dialect_name, table_names)}
+            )
             for row in result:
                 configs[row[0]] = TablePermissionConfig(
                     table_name=row[0],
@@ -197,6 +487,68 @@ class PermissionValidator:
                 )
         return configs
 
+    def get_permission_context(
+        self, user_id: int, table_names: List[str], conn: Optional[Connection] = None
+    ) -> Tuple[List[str], Dict[str, TablePermissionConfig], List[str]]:
+        """Get everything needed to check a query's tables in at most one round trip
+
+        Args:
+            user_id: User ID
+            table_names: Tables referenced by the query, must not be empty
+            conn: Connection used on a cache miss
+
+        Returns:
+            Tuple: User accessible tables, permission configurations of the
+            referenced tables, and user department paths
+        """
+        table_set = frozenset(table_names)
+        accessible_key = ("accessible_tables", user_id)
+        dept_key = ("dept_paths", user_id)
+        configs_key = ("configs", table_set)
+
+        accessible_tables = _user_permission_cache.get(accessible_key)
+        dept_paths = _user_permission_cache.get(dept_key)
+        table_configs = _table_permission_cache.get(configs_key)
+        if accessible_tables is None or dept_paths is None or table_configs is None:
+            accessible_tables, table_configs, dept_paths = self._load_permission_context(
+                user_id, table_set, conn
+            )
+            _user_permission_cache.set(accessible_key, accessible_tables)
+            _user_permission_cache.set(dept_key, dept_paths)
+            _table_permission_cache.set(configs_key, table_configs)
+
+        return list(accessible_tables), dict(table_configs), list(dept_paths)
+
+    def _load_permission_context(
+        self, user_id: int, table_names: frozenset, conn: Optional[Connection] = None
+    ) -> Tuple[Tuple[str, ...], Dict[str, TablePermissionConfig], Tuple[str, ...]]:
+        """Load accessible tables, table configurations and department paths with one UNION ALL query"""
+        dialect_name = self.engine.dialect.name
+        query = _permission_context_query(dialect_name)
+
+        accessible_tables, dept_paths = set(), []
+        configs = {}
+        with self._connect(conn) as connection:
+            result = connection.execute(
+                query,
+                {
+                    "user_id": user_id,
+                    "table_names": _table_names_param(dialect_name, table_names),
+                },
+            )
+            for kind, value, need_dept_control, dept_path_field in result:
+                if kind == "acc":
+                    accessible_tables.add(value)
+                elif kind == "cfg":
+                    configs[value] = TablePermissionConfig(
+                        table_name=value,
+                        need_dept_control=bool(need_dept_control),
+                        dept_path_field=dept_path_field,
+                    )
+                else:
+                    dept_paths.append(value)
+        return tuple(accessible_tables), configs, tuple(dept_paths)
+
     def _build_auth_subquery(
             self,
             table_info: TableInfo,
@@ -213,9 +565,8 @@ class PermissionValidator:
         Returns:
             str: Built subquery SQL
         """
-        # Build REGEXP pattern
-        patterns = [f"(^|>){dept_id}(>|$)" for dept_id in dept_paths]
-        regexp_pattern = "|".join(patterns)
+        # Build REGEXP pattern, shared by all tables of the same user
+        regexp_pattern = _dept_regexp_pattern(tuple(dept_paths))
 
         # Build subquery
         subquery = f"(SELECT * FROM {table_info.name} WHERE {dept_path_field} REGEXP '{regexp_pattern}')"
@@ -227,30 +578,52 @@ class PermissionValidator:
         return subquery
 
     def verify_and_inject_permissions(
-        self, user_id: int, sql: str
+        self, user_id: int, sql: str, table_infos: Optional[List[TableInfo]] = None
     ) -> Tuple[bool, Optional[str], Optional[List[str]]]:
-        """Verify permissions and inject permission conditions"""
+        """Verify permissions and inject permission conditions
+
+        Table information already extracted from the same SQL can be passed in
+        to avoid parsing it again.
+        """
+        # Lookups missing the cache share a single pooled connection
+        conn = _LazyConnection(self.engine)
         try:
             # Extract all table information from SQL
-            table_infos = self.extract_table_names(sql)
+            if table_infos is None:
+                table_infos = self.extract_table_names(sql)
             logger.info(f"Table information extracted from SQL: {table_infos}")
 
             # Get all table names
             query_tables = [info.name for info in table_infos]
+            if not query_tables:
+                # No configured table is referenced, so no permission lookup is needed
+                return True, sql, None
 
-            # Get user accessible tables
-            accessible_tables = self.get_user_accessible_tables(user_id)
+            # Single-table fast path: when the table's cached configuration needs no
+            # department control, only table access has to be checked
+            if len(set(query_tables)) == 1:
+                table_name = query_tables[0]
+                cached_configs = _table_permission_cache.get(("configs", frozenset(query_tables)))
+                if cached_configs is not None and not (
+                    table_name in cached_configs and cached_configs[table_name].need_dept_control
+                ):
+                    if table_name in self.get_user_accessible_tables(user_id, conn):
+                        return True, sql, None
+                    return False, None, [table_name]
 
-            # Verify table permissions
+            # Get accessible tables, table configurations and department paths together
+            accessible_tables, table_configs, dept_paths = self.get_permission_context(
+                user_id, query_tables, conn
+            )
+
+            # Verify table permissions with constant-time lookups
+            accessible_set = frozenset(accessible_tables)
             unauthorized_tables = [
-                table for table in query_tables if table not in accessible_tables
+                table for table in query_tables if table not in accessible_set
             ]
             if unauthorized_tables:
                 return False, None, unauthorized_tables
 
-            # Get table permission configuration information
-            table_configs = self.get_table_permission_configs(query_tables)
-
             # Get tables requiring department permission control
             dept_control_tables = [
                 info
@@ -262,32 +635,50 @@ class PermissionValidator:
             if not dept_control_tables:
                 return True, sql, None
 
-            # Get user's department paths
-            dept_paths = self.get_user_dept_paths(user_id)
+            # Without department paths there is nothing to restrict on
             if not dept_paths:
                 return True, sql, None
 
-            # Process each table requiring permission control
-            modified_sql = sql
-            for table_info in dept_control_tables:
-                field = table_configs[table_info.name].dept_path_field
-                if not field:
-                    continue
-
-                # Build subquery with permission control
-                auth_subquery = self._build_auth_subquery(table_info, field, dept_paths)
-
-                # Replace original table reference in SQL
-                # Build different replacement patterns based on whether there's an alias
-                if table_info.alias:
-                    pattern = rf"{table_info.name}\s+(?:AS\s+)?{table_info.alias}\b"
-                else:
-                    pattern = rf"\b{table_info.name}\b"
+            # Build subquery with permission control for each table requiring it
+            replacements = [
+                (table_info, self._build_auth_subquery(
+                    table_info, table_configs[table_info.name].dept_path_field, dept_paths
+                ))
+                for table_info in dept_control_tables
+                if table_configs[table_info.name].dept_path_field
+            ]
 
-                # Ignore case when replacing
-                modified_sql = re.sub(
-                    pattern, auth_subquery, modified_sql, flags=re.IGNORECASE
+            if all(table_info.start is not None for table_info, _ in replacements):
+                # Splice subqueries at the known reference positions in one pass,
+                # back to front so earlier positions stay valid
+                parts = []
+                last = len(sql)
+                for table_info, auth_subquery in sorted(
+                    replacements, key=lambda item: item[0].start, reverse=True
+                ):
+                    parts.append(sql[table_info.end:last])
+                    parts.append(auth_subquery)
+                    last = table_info.start
+                parts.append(sql[:last])
+                modified_sql = "".join(reversed(parts))
+            else:
+                # Positions unknown (parsed by sqlparse), replace references by pattern
+                modified_sql = sql
+                for table_info, auth_subquery in replacements:
+                    pattern = _compiled_table_pattern(table_info.name, table_info.alias)
+                    modified_sql = pattern.sub(auth_subquery, modified_sql)
+
+            # Fail closed if any restricted table is still read without its subquery
+            unrestricted = _find_unrestricted_tables(
+                modified_sql,
+                [auth_subquery for _, auth_subquery in replacements],
+                frozenset(table_info.name.lower() for table_info, _ in replacements),
+            )
+            if unrestricted:
+                logger.error(
+                    "Permission injection left tables unrestricted: %s", sorted(unrestricted)
                 )
+                return False, None, None
 
             # Log modified SQL for debugging
             logger.info(f"SQL after permission injection: {modified_sql}")
@@ -296,6 +687,14 @@ class PermissionValidator:
         except Exception as e:
             logger.error(f"Permission verification process error: {str(e)}")
             return False, None, None
+        finally:
+            conn.close()
+
+
+@lru_cache()
+def get_permission_validator() -> PermissionValidator:
+    """Get shared permission validator"""
+    return PermissionValidator()
 
 
 def permission_control_node(state: SQLAssistantState) -> dict:
@@ -326,13 +725,16 @@ def permission_control_node(state: SQLAssistantState) -> dict:
         return {"execution_result": {"success": False, "error": "User ID information not found"}}
 
     try:
-        # Create permission validator
-        validator = PermissionValidator()
+        # Get shared permission validator
+        validator = get_permission_validator()
+
+        # Extract tables once; the names are also passed on to later nodes
+        table_infos = validator.extract_table_names(generated_sql["sql_query"])
 
         # Execute permission verification and injection
         is_valid, modified_sql, unauthorized_tables = (
             validator.verify_and_inject_permissions(
-                user_id=user_id, sql=generated_sql["sql_query"]
+                user_id=user_id, sql=generated_sql["sql_query"], table_infos=table_infos
             )
         )
 
@@ -350,7 +752,8 @@ def permission_control_node(state: SQLAssistantState) -> dict:
         return {
             "generated_sql": {
                 "sql_query": generated_sql["sql_query"],
-                "permission_controlled_sql": modified_sql
+                "permission_controlled_sql": modified_sql,
+                "tables": [info.name for info in table_infos],
             },
             "execution_result": {"success": True},
         }
@@ -5,15 +5,17 @@ Responsible for retrieving the most similar SQL query examples based on user que
 
 import os
 import logging
-from typing import Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
+from backend.sql_assistant.utils.format_utils import format_query_examples
 # Factory class imports
 from utils.factories.milvus import MilvusFactory
-from utils.factories.embedding import EmbeddingFactory
 
 # Service function imports
-from utils.services.milvus_service import search_in_milvus
+from utils.services.milvus_service import batch_search_in_milvus
+from utils.services.batching import MicroBatcher, get_batching_embeddings
 
 # Core infrastructure imports
 from utils.core.streamlit_config import settings
@@ -29,12 +31,31 @@ class QueryExampleRetriever:
         )
         # Get query examples collection
         self.collection = self.milvus_connection.get_collection("query_examples")
-        # Initialize embedding model
-        self.embeddings = EmbeddingFactory.get_default_embeddings()
+        # Shared embedding model
+        self.embeddings = get_batching_embeddings()
+        # Concurrent retrievals share one embedding request and one Milvus search
+        self._batcher = MicroBatcher(
+            self._retrieve_batch, max_wait=0.01, name="query-example-batcher"
+        )
+
+    def _retrieve_batch(self, items: List[Tuple[str, int]]) -> List[List[Dict[str, Any]]]:
+        """Embed and search a batch of (query, top_k) items together"""
+        top_k = max(item_top_k for _, item_top_k in items)
+        query_vectors = self.embeddings.embed_documents([query for query, _ in items])
+        results = batch_search_in_milvus(
+            collection=self.collection,
+            query_vectors=query_vectors,
+            vector_field="query_text",
+            top_k=top_k,
+            output_fields=["query_text", "query_sql"],
+        )
+        return [
+            hits[:item_top_k] for (_, item_top_k), hits in zip(items, results)
+        ]
 
     def retrieve_examples(
         self, query: str, top_k: int = 2
-    ) -> List[Dict[str, str]]:
+    ) -> List[Dict[str, Any]]:
         """
         Retrieve the most similar SQL query examples based on query
 
@@ -46,30 +67,23 @@ class QueryExampleRetriever:
             List of most similar query examples
         """
         try:
-            # Generate vector representation of query text
-            query_vector = self.embeddings.embed_query(query)
-
-            # Search for similar examples in vector database
-            results = search_in_milvus(
-                collection=self.collection,
-                query_vector=query_vector,
-                vector_field="query_text",
-                top_k=top_k,
-            )
-
-            # Convert result format
-            return [
-                {
-                    "query_text": result["query_text"],
-                    "query_sql": result["query_sql"],
-                }
-                for result in results
-            ]
+            # Embedding and vector search run in a batch with concurrent queries
+            return self._batcher((query, top_k))
 
         except Exception as e:
             logger.error(f"Query example retrieval failed: {str(e)}")
             return []
 
+
+@lru_cache()
+def get_retriever() -> QueryExampleRetriever:
+    """Get shared query example retriever
+
+    Reuses the Milvus connection and collection handle across requests.
+    """
+    return QueryExampleRetriever()
+
+
 def query_example_node(state: SQLAssistantState) -> dict:
     """
     Query example retrieval node function
@@ -85,20 +99,27 @@ def query_example_node(state: SQLAssistantState) -> dict:
     # Get rewritten query
     rewritten_query = state.get("rewritten_query")
     if not rewritten_query:
-        return {"query_examples": []}
+        return {"query_examples": [], "formatted_query_examples": format_query_examples([])}
 
     try:
-        # Create example retriever instance
-        retriever = QueryExampleRetriever()
+        # Get shared example retriever
+        retriever = get_retriever()
 
         # Retrieve similar examples
         query_examples = retriever.retrieve_examples(rewritten_query)
 
         logger.info(f"Retrieved {len(query_examples)} similar query examples")
 
-        return {"query_examples": query_examples}
+        return {
+            "query_examples": query_examples,
+            "formatted_query_examples": format_query_examples(query_examples),
+        }
 
     except Exception as e:
         error_msg = f"Query example retrieval process error: {str(e)}"
         logger.error(error_msg)
-        return {"query_examples": [], "error": error_msg}
+        return {
+            "query_examples": [],
+            "formatted_query_examples": format_query_examples([]),
+            "error": error_msg,
+        }
@@ -5,13 +5,15 @@ Responsible for rewriting user's original queries into standardized form.
 
 from pydantic import BaseModel, Field
 import logging
-from datetime import datetime
+from functools import lru_cache
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
 from backend.sql_assistant.utils.format_utils import (
-    format_conversation_history,
-    format_term_descriptions
+    get_formatted_term_descriptions,
+    get_dialogue_history,
+    get_current_date,
 )
+from backend.sql_assistant.utils.node_cache import memoize_node
 # Service function imports
 from utils.services.llm import init_language_model, LanguageModelChain
 
@@ -77,6 +79,22 @@ def create_query_rewrite_chain(temperature: float = 0.0) -> LanguageModelChain:
     )()
 
 
+@lru_cache(maxsize=None)
+def _get_query_rewrite_chain(temperature: float = 0.0):
+    """Get shared query rewrite chain, built once per temperature"""
+    return create_query_rewrite_chain(temperature)
+
+
+def _query_rewrite_cache_key(state: SQLAssistantState) -> tuple:
+    """Cache key of query rewrite, includes the date since relative dates are resolved against it"""
+    return (
+        get_dialogue_history(state),
+        sorted(state.get("domain_term_mappings", {}).items()),
+        get_current_date(),
+    )
+
+
+@memoize_node(_query_rewrite_cache_key)
 def query_rewrite_node(state: SQLAssistantState) -> dict:
     """Query requirement rewrite node function
 
@@ -90,26 +108,23 @@ def query_rewrite_node(state: SQLAssistantState) -> dict:
         dict: State update containing rewritten query
     """
     # Get conversation history
-    messages = state.get("messages", [])
-    if not messages:
+    if not state.get("messages"):
         raise ValueError("No message history found in state")
 
-    # Format conversation history
-    dialogue_history = format_conversation_history(messages)
+    # Reuse conversation history formatted by intent analysis
+    dialogue_history = get_dialogue_history(state)
 
     # Format term descriptions
-    term_descriptions = format_term_descriptions(
-        state.get("domain_term_mappings", {})
-    )
+    term_descriptions = get_formatted_term_descriptions(state)
 
     # Create rewrite chain
-    rewrite_chain = create_query_rewrite_chain()
+    rewrite_chain = _get_query_rewrite_chain()
 
     # Execute rewrite
     result = rewrite_chain.invoke({
         "dialogue_history": dialogue_history,
         "term_descriptions": term_descriptions,
-        "current_date": datetime.now().strftime("%Y-%m-%d")
+        "current_date": get_current_date()
     })
 
     logger.info(f"Query rewrite completed, result: {result['rewritten_query']}")
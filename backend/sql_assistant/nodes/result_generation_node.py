@@ -4,16 +4,16 @@ Responsible for converting SQL query results into user-friendly descriptions.
 """
 
 import logging
-from datetime import datetime
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from langchain_core.messages import AIMessage
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
 from backend.sql_assistant.utils.format_utils import (
     format_results_preview,
-    format_term_descriptions,
-    format_full_results,
-    format_table_structures
+    get_formatted_table_structures,
+    get_formatted_term_descriptions,
+    get_current_date,
 )
 # Service function imports
 from utils.services.llm import init_language_model, LanguageModelChain
@@ -137,6 +137,12 @@ def create_result_generation_chain(temperature: float = 0.0) -> LanguageModelCha
     )()
 
 
+@lru_cache(maxsize=None)
+def _get_result_generation_chain(temperature: float = 0.0):
+    """Get shared result generation chain, built once per temperature"""
+    return create_result_generation_chain(temperature)
+
+
 def result_generation_node(state: SQLAssistantState) -> dict:
     """Result generation node function
 
@@ -157,34 +163,35 @@ def result_generation_node(state: SQLAssistantState) -> dict:
     try:
         # Prepare input data
         generated_sql = state.get("generated_sql", {})
+        # Prefer the tables the permission node extracted from the executed SQL;
+        # SQL fixed by error analysis was never parsed, so use the matched tables then
+        tables = []
+        if execution_result.get("sql_source") != "error_analysis":
+            tables = list(dict.fromkeys(generated_sql.get("tables") or []))
         input_data = {
             "rewritten_query": state["rewritten_query"],
-            "row_count": execution_result["row_count"],
+            # A truncated result only knows a lower bound of its size
+            "row_count": (
+                f"more than {execution_result['row_count']}"
+                if execution_result["truncated"]
+                else execution_result["row_count"]
+            ),
             "truncated": execution_result["truncated"],
             "results_preview": format_results_preview(execution_result),
-            "table_structures": format_table_structures(state.get("table_structures", [])),
-            "term_descriptions": format_term_descriptions(
-                state.get("domain_term_mappings", {})
-            ),
-            "data_source": state.get("matched_tables", [{}])[0].get("table_name", "Unknown data source"),
+            "table_structures": get_formatted_table_structures(state),
+            "term_descriptions": get_formatted_term_descriptions(state),
+            "data_source": ", ".join(tables)
+            or (state.get("matched_tables") or [{}])[0].get("table_name", "Unknown data source"),
             "sql_query": generated_sql.get("sql_query", "Unknown SQL query"),
-            "current_date": datetime.now().strftime("%Y-%m-%d")
+            "current_date": get_current_date()
         }
 
         # Create and execute result generation chain
-        generation_chain = create_result_generation_chain()
+        generation_chain = _get_result_generation_chain()
         result = generation_chain.invoke(input_data)
 
         logger.info(f"Result generation completed: {result['result_description'][:100]}...")
 
-        # Combine result description with complete table results
-        formatted_table = format_full_results(execution_result)
-        combined_message = (
-            f"{result['result_description']}\n\n"
-            f"Query result details:\n"
-            f"{formatted_table}"
-        )
-
         return {
             "result_description": result["result_description"],
             "messages": [AIMessage(content=result['result_description'])]
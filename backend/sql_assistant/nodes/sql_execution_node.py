@@ -4,8 +4,11 @@ Responsible for executing SQL queries and handling execution results.
 """
 
 import os
+import hashlib
+from functools import lru_cache
 from typing import Dict, Any
-import pandas as pd
+import sqlparse
+from sqlparse import tokens as T
 from sqlalchemy import text, Engine
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
@@ -15,10 +18,77 @@ from utils.factories.database import DatabaseFactory
 # Core infrastructure imports
 from utils.core.logging_config import get_logger, log_operation_result, log_database_operation
 from utils.core.error_handler import ProcessingError, DatabaseError, error_handler, create_error_response, ErrorLevel
-from utils.core.constants import DatabaseConstants, ErrorMessages, SuccessMessages, BusinessConstants
+from utils.core.constants import DatabaseConstants, ErrorMessages, SuccessMessages, BusinessConstants, CacheConstants
+from utils.core.cache import TTLCache
 
 logger = get_logger(__name__)
 
+# Results of recently executed queries; only single SELECT statements are executed
+_query_result_cache = TTLCache(
+    maxsize=CacheConstants.QUERY_RESULT_MAXSIZE, ttl=CacheConstants.QUERY_RESULT_TTL
+)
+
+
+def _is_empty_statement(statement) -> bool:
+    """Check whether a parsed statement holds only whitespace, comments and semicolons"""
+    return all(
+        token.is_whitespace or token.ttype in T.Comment or token.value == ";"
+        for token in statement.flatten()
+    )
+
+
+def is_read_only_query(sql_query: str) -> bool:
+    """Check that SQL is a single statement whose only DML/DDL/DCL keywords are SELECT
+
+    A cheap guard run before touching the database; sqlparse does not validate
+    syntax, so malformed SELECT statements still fail at execution.
+
+    Args:
+        sql_query: SQL query statement
+
+    Returns:
+        bool: True if the SQL can be executed
+    """
+    statements = [stmt for stmt in sqlparse.parse(sql_query) if not _is_empty_statement(stmt)]
+    if len(statements) != 1:
+        return False
+
+    has_select = False
+    for token in statements[0].flatten():
+        if token.ttype in (T.Keyword.DML, T.Keyword.DDL, T.Keyword.DCL):
+            if token.normalized != "SELECT":
+                return False
+            has_select = True
+    return has_select
+
+
+def _query_cache_key(sql_query: str) -> bytes:
+    """Build cache key of a SQL statement
+
+    Only surrounding whitespace and a trailing semicolon are normalized, since
+    case and spacing inside string literals are significant.
+    """
+    normalized = sql_query.strip().rstrip(";").rstrip()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+def _error_result(error_msg: str) -> Dict[str, Any]:
+    """Build failed execution result with empty result fields"""
+    return create_error_response(
+        error=error_msg,
+        additional_data={
+            'rows': None,
+            'columns': None,
+            'row_count': 0,
+            'truncated': False
+        }
+    )
+
+
+def get_query_cache_stats() -> Dict[str, int]:
+    """Get hit, miss and size statistics of the query result cache"""
+    return _query_result_cache.stats()
+
 
 class SQLExecutor:
     """SQL executor
@@ -39,44 +109,71 @@ class SQLExecutor:
 
         Returns:
             Dict: Dictionary containing execution results or error information.
-                 On success contains results, columns, row_count and other info,
+                 On success contains rows (tuples in column order), columns, row_count and other info;
+                 when truncated is True the result set has more rows than row_count,
+                 which then only counts the returned rows.
                  On failure contains error information.
         """
-        try:
-            # Use pandas to read SQL results
-            df = pd.read_sql_query(text(sql_query), self.engine)
-
-            # Convert results to dictionary list
-            results = df.to_dict('records')
+        # Reject anything but a single SELECT without a database round trip
+        if not is_read_only_query(sql_query):
+            log_database_operation(
+                logger=logger,
+                operation="query",
+                success=False,
+                error=ErrorMessages.SQL_NOT_READ_ONLY
+            )
+            return _error_result(f"{ErrorMessages.SQL_EXECUTION_FAILED}: {ErrorMessages.SQL_NOT_READ_ONLY}")
 
-            # Get column information
-            columns = list(df.columns)
+        cache_key = _query_cache_key(sql_query)
+        cached = _query_result_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Query result served from cache")
+            # Callers add fields to the returned dict, so hand out a copy
+            return dict(cached)
 
-            # Limit number of returned records
+        try:
+            # Stream rows with a server-side cursor, keeping at most max_rows of them
             max_rows = DatabaseConstants.MAX_RESULT_ROWS
-            if len(results) > max_rows:
-                results = results[:max_rows]
-                truncated = True
-            else:
-                truncated = False
+            with self.engine.connect().execution_options(
+                stream_results=True, max_row_buffer=max_rows
+            ) as conn:
+                result = conn.execute(text(sql_query))
+
+                # Get column information
+                columns = list(result.keys())
+
+                # One extra row tells whether the result set was truncated;
+                # the remaining rows are never materialized, though the driver
+                # may still read them off the wire when the cursor closes
+                rows = result.fetchmany(max_rows + 1)
+                truncated = len(rows) > max_rows
+                if truncated:
+                    rows = rows[:max_rows]
+                row_count = len(rows)
+
+            # Keep rows as plain tuples in column order
+            rows = [tuple(row) for row in rows]
 
             # Log success
             log_database_operation(
                 logger=logger,
                 operation="query",
-                row_count=len(df),
+                row_count=row_count,
                 success=True
             )
 
-            return {
+            response = {
                 'success': True,
-                'results': results,
+                'rows': rows,
                 'columns': columns,
-                'row_count': len(df),
+                'row_count': row_count,
                 'truncated': truncated,
                 'error': None
             }
 
+            _query_result_cache.set(cache_key, response)
+            return dict(response)
+
         except Exception as e:
             error_msg = f"{ErrorMessages.SQL_EXECUTION_FAILED}: {str(e)}"
 
@@ -88,15 +185,29 @@ class SQLExecutor:
                 error=str(e)
             )
 
-            return create_error_response(
-                error=error_msg,
-                additional_data={
-                    'results': None,
-                    'columns': None,
-                    'row_count': 0,
-                    'truncated': False
-                }
-            )
+            return _error_result(error_msg)
+
+
+# Errors returned before execution, built once and copied with the current retry count
+_MAX_RETRY_ERROR = create_error_response(error=ErrorMessages.MAX_RETRY_EXCEEDED)
+_SQL_NOT_FOUND_ERROR = create_error_response(error=ErrorMessages.SQL_NOT_FOUND)
+_CONTROLLED_SQL_NOT_FOUND_ERROR = create_error_response(
+    error="Permission-controlled SQL query statement not found in state"
+)
+
+
+def _early_error_update(error_template: Dict[str, Any], retry_count: int) -> dict:
+    """Build state update for an error found before execution"""
+    return {
+        "execution_result": {**error_template, "retry_count": retry_count},
+        "retry_count": retry_count,
+    }
+
+
+@lru_cache()
+def get_sql_executor() -> SQLExecutor:
+    """Get shared SQL executor"""
+    return SQLExecutor()
 
 
 def sql_execution_node(state: SQLAssistantState) -> dict:
@@ -117,11 +228,7 @@ def sql_execution_node(state: SQLAssistantState) -> dict:
     # Check if maximum retry count reached
     max_retries = BusinessConstants.MAX_SQL_RETRY
     if retry_count >= max_retries:
-        error_response = create_error_response(
-            error=ErrorMessages.MAX_RETRY_EXCEEDED,
-            additional_data={"retry_count": retry_count}
-        )
-        return {"execution_result": error_response, "retry_count": retry_count}
+        return _early_error_update(_MAX_RETRY_ERROR, retry_count)
 
     # Get SQL to execute
     # Prioritize using SQL fixed by error analysis node
@@ -134,24 +241,16 @@ def sql_execution_node(state: SQLAssistantState) -> dict:
     else:
         generated_sql = state.get("generated_sql", {})
         if not generated_sql:
-            error_response = create_error_response(
-                error=ErrorMessages.SQL_NOT_FOUND,
-                additional_data={"retry_count": retry_count}
-            )
-            return {"execution_result": error_response, "retry_count": retry_count}
+            return _early_error_update(_SQL_NOT_FOUND_ERROR, retry_count)
 
         # Use SQL with injected permissions
         sql_query = generated_sql.get('permission_controlled_sql')
         if not sql_query:
-            error_response = create_error_response(
-                error="Permission-controlled SQL query statement not found in state",
-                additional_data={"retry_count": retry_count}
-            )
-            return {"execution_result": error_response, "retry_count": retry_count}
+            return _early_error_update(_CONTROLLED_SQL_NOT_FOUND_ERROR, retry_count)
 
     try:
-        # Create executor instance
-        executor = SQLExecutor()
+        # Get shared executor instance
+        executor = get_sql_executor()
 
         # Execute SQL
         result = executor.execute_query(sql_query)
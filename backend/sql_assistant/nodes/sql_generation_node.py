@@ -5,16 +5,21 @@ Responsible for generating SQL query statements.
 
 from pydantic import BaseModel, Field
 import logging
-from datetime import datetime
+from functools import lru_cache
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
 from backend.sql_assistant.utils.format_utils import (
-    format_table_structures,
-    format_term_descriptions
+    get_formatted_table_structures,
+    get_formatted_term_descriptions,
+    get_formatted_query_examples,
+    get_current_date,
 )
 # Service function imports
 from utils.services.llm import init_language_model, LanguageModelChain
 
+# Core infrastructure imports
+from utils.core.streamlit_config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -120,6 +125,12 @@ def create_sql_generation_chain(temperature: float = 0.0) -> LanguageModelChain:
     )()
 
 
+@lru_cache(maxsize=None)
+def _get_sql_generation_chain(temperature: float = 0.0):
+    """Get shared SQL generation chain, built once per temperature"""
+    return create_sql_generation_chain(temperature)
+
+
 def sql_generation_node(state: SQLAssistantState) -> dict:
     """SQL generation node function"""
     if not state.get("rewritten_query"):
@@ -129,24 +140,19 @@ def sql_generation_node(state: SQLAssistantState) -> dict:
 
     try:
         # Get database type from configuration
-        from utils.core.streamlit_config import settings
         db_type = settings.database.type.upper()
 
         input_data = {
             "rewritten_query": state["rewritten_query"],
-            "table_structures": format_table_structures(state["table_structures"]),
-            "term_descriptions": format_term_descriptions(
-                state.get("domain_term_mappings", {})
-            ),
-            "current_date": datetime.now().strftime("%Y-%m-%d"),
+            # Reuse prompt text formatted once by earlier nodes, so retries skip it
+            "table_structures": get_formatted_table_structures(state),
+            "term_descriptions": get_formatted_term_descriptions(state),
+            "current_date": get_current_date(),
             "database_type": db_type,
-            "query_examples": "\n".join([
-            f"Example query: [{example['query_text']}]\nExample SQL: [{example['query_sql']}]"
-            for example in state.get("query_examples", [])
-        ]) or "No related examples"
+            "query_examples": get_formatted_query_examples(state),
         }
 
-        generation_chain = create_sql_generation_chain()
+        generation_chain = _get_sql_generation_chain()
         result = generation_chain.invoke(input_data)
 
         logger.info(f"Generated SQL query: {result['sql_query']}")
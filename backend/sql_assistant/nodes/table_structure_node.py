@@ -6,6 +6,7 @@ Responsible for parsing detailed structure information of data tables.
 import logging
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
+from backend.sql_assistant.utils.format_utils import format_table_structures
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,7 @@ def table_structure_analysis_node(state: SQLAssistantState) -> dict:
     if not matched_tables:
         return {
             "table_structures": [],
+            "formatted_table_structures": format_table_structures([]),
             "error": "No data tables found for analysis"
         }
 
@@ -36,33 +38,32 @@ def table_structure_analysis_node(state: SQLAssistantState) -> dict:
 
         # Process each matched table
         for table in matched_tables:
-            try:
-                # Get schema from table information
-                schema_str = table.get("schema")
-                if not schema_str:
-                    raise ValueError("Table structure information not found")
-
-                # Build table structure information
-                structure = {
-                    "table_name": table["table_name"],
-                    "columns": schema_str,
-                    "description": table.get("description", ""),
-                    "additional_info": table.get("additional_info", "")
-                }
-                table_structures.append(structure)
-
-            except Exception as table_error:
+            # Get schema from table information
+            schema_str = table.get("schema")
+            if not schema_str:
                 failed_tables.append({
                     "table_name": table["table_name"],
-                    "error": str(table_error)
+                    "error": "Table structure information not found"
                 })
-                logger.warning(f"Table {table['table_name']} structure parsing failed: {str(table_error)}")
+                logger.warning(
+                    "Table %s structure parsing failed: Table structure information not found",
+                    table["table_name"],
+                )
                 continue
 
+            # Build table structure information
+            table_structures.append({
+                "table_name": table["table_name"],
+                "columns": schema_str,
+                "description": table.get("description", ""),
+                "additional_info": table.get("additional_info", "")
+            })
+
         logger.info(f"Table structure analysis completed, successfully parsed {len(table_structures)} table structures, failed {len(failed_tables)} tables")
 
         return {
             "table_structures": table_structures,
+            "formatted_table_structures": format_table_structures(table_structures),
             "failed_tables": failed_tables
         }
 
@@ -71,6 +72,7 @@ def table_structure_analysis_node(state: SQLAssistantState) -> dict:
         logger.error(error_msg)
         return {
             "table_structures": [],
+            "formatted_table_structures": format_table_structures([]),
             "failed_tables": [],
             "error": error_msg
         }
@@ -4,22 +4,110 @@ Responsible for mapping user-input non-standard terms to standard domain termino
 """
 
 import os
+import asyncio
 import logging
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from backend.sql_assistant.states.assistant_state import SQLAssistantState
+from backend.sql_assistant.utils.format_utils import format_term_descriptions
 # Factory class imports
 from utils.factories.milvus import MilvusFactory
 from utils.factories.embedding import EmbeddingFactory
 
 # Service function imports
-from utils.services.milvus_service import search_in_milvus
+from utils.services.milvus_service import batch_search_in_milvus
 
 # Core infrastructure imports
 from utils.core.streamlit_config import settings
+from utils.core.cache import TTLCache
+from utils.core.constants import CacheConstants
 
 logger = logging.getLogger(__name__)
 
+_TERM_OUTPUT_FIELDS = ["original_term", "standard_name", "additional_info"]
+
+# Best Milvus match of each keyword (None when nothing was found), shared across mapper instances
+_term_match_cache = TTLCache(
+    maxsize=CacheConstants.TERM_MATCH_MAXSIZE,
+    ttl=CacheConstants.TERM_MATCH_TTL,
+)
+_MISSING = object()
+
+# Term collections up to this size are matched in memory instead of through Milvus
+TERM_MATRIX_MAX_ROWS = 50000
+# Rows per query page; a single Milvus query returns at most 16384 rows
+TERM_QUERY_BATCH_SIZE = 16384
+
+# In-memory copy of the term collection: term fields and their vectors as one matrix
+_term_matrix_cache = TTLCache(maxsize=1, ttl=CacheConstants.TERM_MATCH_TTL)
+
+
+def _load_term_matrix(collection) -> Optional[Tuple[List[Dict], np.ndarray]]:
+    """Load all terms and their vectors, None when the collection is too large
+
+    Rows are read page by page with a query iterator, as one query cannot
+    return more rows than the Milvus query result window.
+    """
+    if collection.num_entities > TERM_MATRIX_MAX_ROWS:
+        return None
+
+    records = []
+    iterator = collection.query_iterator(
+        batch_size=TERM_QUERY_BATCH_SIZE,
+        expr="id >= 0",
+        output_fields=_TERM_OUTPUT_FIELDS + ["original_term_vector"],
+    )
+    try:
+        while True:
+            batch = iterator.next()
+            if not batch:
+                break
+            records.extend(batch)
+            # Rows inserted since num_entities was read may push it over the limit
+            if len(records) > TERM_MATRIX_MAX_ROWS:
+                return None
+    finally:
+        iterator.close()
+
+    if not records:
+        return None
+
+    terms = [{field: record[field] for field in _TERM_OUTPUT_FIELDS} for record in records]
+    matrix = np.asarray(
+        [record["original_term_vector"] for record in records], dtype=np.float32
+    )
+    logger.info(f"Loaded {len(terms)} terms for in-memory matching")
+    return terms, matrix
+
+
+def _get_term_matrix(collection) -> Optional[Tuple[List[Dict], np.ndarray]]:
+    """Get the cached in-memory term matrix, reloaded after the cache TTL"""
+    cached = _term_matrix_cache.get(collection.name, _MISSING)
+    if cached is _MISSING:
+        try:
+            cached = _load_term_matrix(collection)
+        except Exception as e:
+            logger.warning(f"Failed to load term matrix, using vector search: {str(e)}")
+            cached = None
+        _term_matrix_cache.set(collection.name, cached)
+    return cached
+
+
+def _match_in_memory(
+    query_vectors: List[List[float]], term_matrix: Tuple[List[Dict], np.ndarray]
+) -> List[List[Dict]]:
+    """Find the top-1 term of each vector by inner product, shaped like Milvus results"""
+    terms, matrix = term_matrix
+    scores = np.asarray(query_vectors, dtype=np.float32) @ matrix.T
+    best = scores.argmax(axis=1)
+    return [
+        [{**terms[index], "distance": float(scores[row, index])}]
+        for row, index in enumerate(best)
+    ]
+
 
 class DomainTermMapper:
     """Business domain term mapper
@@ -40,6 +128,24 @@ class DomainTermMapper:
         # Initialize embedding model
         self.embeddings = EmbeddingFactory.get_default_embeddings()
 
+    def _search_terms(self, query_vectors: List[List[float]]) -> List[List[Dict]]:
+        """Find the best matching term of each query vector
+
+        Small term collections are matched against an in-memory matrix with the
+        same inner-product metric as the Milvus index; larger ones use vector search.
+        """
+        term_matrix = _get_term_matrix(self.collection)
+        if term_matrix is not None:
+            return _match_in_memory(query_vectors, term_matrix)
+
+        return batch_search_in_milvus(
+            collection=self.collection,
+            query_vectors=query_vectors,
+            vector_field="original_term",
+            top_k=1,
+            output_fields=_TERM_OUTPUT_FIELDS,
+        )
+
     def find_standard_terms(
         self, keywords: List[str], similarity_threshold: float = 0.9
     ) -> Dict[str, Dict[str, str]]:
@@ -52,34 +158,94 @@ class DomainTermMapper:
         Returns:
             Dict[str, Dict[str, str]]: Mapping dictionary from keywords to standard term information
         """
-        if not keywords:
-            return {}
+        matches, missing = _split_cached_matches(keywords)
+        if missing:
+            try:
+                # Embed uncached keywords in one request and match them in one pass
+                query_vectors = self.embeddings.embed_documents(missing)
+                results_batch = self._search_terms(query_vectors)
+            except Exception as e:
+                logger.error(f"Error processing keywords {missing}: {str(e)}")
+                results_batch = []
+            matches.update(_cache_matches(missing, results_batch))
 
-        term_mappings = {}
+        return _build_term_mappings(matches, similarity_threshold)
 
-        for keyword in keywords:
+    async def afind_standard_terms(
+        self, keywords: List[str], similarity_threshold: float = 0.9
+    ) -> Dict[str, Dict[str, str]]:
+        """Asynchronous variant of find_standard_terms"""
+        matches, missing = _split_cached_matches(keywords)
+        if missing:
             try:
-                query_vector = self.embeddings.embed_query(keyword)
-
-                results = search_in_milvus(
-                    collection=self.collection,
-                    query_vector=query_vector,
-                    vector_field="original_term",
-                    top_k=1,
-                )
-
-                if results and results[0]["distance"] > similarity_threshold:
-                    term_mappings[keyword] = {
-                        "original_term": results[0]["original_term"],
-                        "standard_name": results[0]["standard_name"],
-                        "additional_info": results[0]["additional_info"],
-                    }
-
+                query_vectors = await self.embeddings.aembed_documents(missing)
+                results_batch = await asyncio.to_thread(self._search_terms, query_vectors)
             except Exception as e:
-                logger.error(f"Error processing keyword '{keyword}': {str(e)}")
-                continue
+                logger.error(f"Error processing keywords {missing}: {str(e)}")
+                results_batch = []
+            matches.update(_cache_matches(missing, results_batch))
+
+        return _build_term_mappings(matches, similarity_threshold)
+
+
+def _split_cached_matches(keywords: List[str]) -> Tuple[Dict[str, Optional[Dict]], List[str]]:
+    """Split keywords into cached best matches and keywords still to search"""
+    matches, missing = {}, []
+    for keyword in dict.fromkeys(keywords):
+        match = _term_match_cache.get(keyword, _MISSING)
+        if match is _MISSING:
+            missing.append(keyword)
+        else:
+            matches[keyword] = match
+    return matches, missing
 
-        return term_mappings
+
+def _cache_matches(
+    keywords: List[str], results_batch: List[List[Dict]]
+) -> Dict[str, Optional[Dict]]:
+    """Cache the best match of each searched keyword, None when nothing matched
+
+    After a failed search results_batch is empty, so nothing is cached and
+    the keywords are searched again next time.
+    """
+    matches = {}
+    for keyword, results in zip(keywords, results_batch):
+        matches[keyword] = results[0] if results else None
+        _term_match_cache.set(keyword, matches[keyword])
+    return matches
+
+
+def _build_term_mappings(
+    matches: Dict[str, Optional[Dict]], similarity_threshold: float
+) -> Dict[str, Dict[str, str]]:
+    """Keep the best match of each keyword when it is similar enough"""
+    return {
+        keyword: {
+            "original_term": match["original_term"],
+            "standard_name": match["standard_name"],
+            "additional_info": match["additional_info"],
+        }
+        for keyword, match in matches.items()
+        if match is not None and match["distance"] > similarity_threshold
+    }
+
+
+def _build_term_mapping_response(term_mappings: Dict[str, Dict[str, str]]) -> dict:
+    """Build state update from term mapping results"""
+    logger.info(f"Term mapping results: {term_mappings}")
+    return {
+        "domain_term_mappings": term_mappings,
+        "formatted_term_descriptions": format_term_descriptions(term_mappings),
+    }
+
+
+@lru_cache()
+def get_term_mapper() -> DomainTermMapper:
+    """Get shared term mapper
+
+    Reuses the Milvus connection and embedding model across requests.
+    """
+    return DomainTermMapper()
 
 
 def domain_term_mapping_node(state: SQLAssistantState) -> dict:
@@ -98,18 +264,32 @@ def domain_term_mapping_node(state: SQLAssistantState) -> dict:
     keywords = state.get("keywords", [])
 
     try:
-        # Create standardizer instance
-        standardizer = DomainTermMapper()
+        # Get shared standardizer instance
+        standardizer = get_term_mapper()
 
         # Execute term standardization
         term_mappings = standardizer.find_standard_terms(keywords)
 
-        logger.info(f"Term mapping results: {term_mappings}")
-
         # Update state
-        return {"domain_term_mappings": term_mappings}
+        return _build_term_mapping_response(term_mappings)
+
+    except Exception as e:
+        error_msg = f"Business term standardization process error: {str(e)}"
+        logger.error(error_msg)
+        return {"domain_term_mappings": {}, "formatted_term_descriptions": [], "error": error_msg}
+
+
+async def domain_term_mapping_node_async(state: SQLAssistantState) -> dict:
+    """Asynchronous variant of domain_term_mapping_node"""
+    keywords = state.get("keywords", [])
+
+    try:
+        # The first call connects to Milvus, so it must not block the event loop
+        standardizer = await asyncio.to_thread(get_term_mapper)
+        term_mappings = await standardizer.afind_standard_terms(keywords)
+        return _build_term_mapping_response(term_mappings)
 
     except Exception as e:
         error_msg = f"Business term standardization process error: {str(e)}"
         logger.error(error_msg)
-        return {"domain_term_mappings": {}, "error": error_msg}
+        return {"domain_term_mappings": {}, "formatted_term_descriptions": [], "error": error_msg}
@@ -13,6 +13,8 @@ def route_after_intent(state: SQLAssistantState):
 
     Decide the next processing node based on intent analysis results.
     If intent is unclear, end conversation for clarification; otherwise continue processing.
+    Keywords are extracted in parallel with intent analysis, so processing
+    continues directly with term mapping.
 
     Args:
         state: Current state object
@@ -22,7 +24,7 @@ def route_after_intent(state: SQLAssistantState):
     """
     if not state["is_intent_clear"]:
         return END
-    return "keyword_extraction"
+    return "domain_term_mapping"
 
 
 def route_after_execution(state: SQLAssistantState):
@@ -37,8 +39,8 @@ def route_after_execution(state: SQLAssistantState):
     Returns:
         str: Next node identifier
     """
-    execution_result = state.get("execution_result", {})
-    if execution_result.get("success", False):
+    execution_result = state.get("execution_result")
+    if execution_result and execution_result.get("success"):
         return "result_generation"  # Execution successful, generate result feedback
     return "error_analysis"  # Execution failed, proceed to error analysis
 
@@ -56,9 +58,10 @@ def route_after_error_analysis(state: SQLAssistantState):
     Returns:
         str: Next node identifier
     """
-    error_analysis_result = state.get("error_analysis_result", {})
-    if error_analysis_result.get("is_sql_fixable", False):
-        state["generated_sql"] = {"sql_query": error_analysis_result["fixed_sql"]}
+    # The execution node reads fixed_sql from the error analysis result itself;
+    # routing functions cannot update state
+    error_analysis_result = state.get("error_analysis_result")
+    if error_analysis_result and error_analysis_result.get("is_sql_fixable"):
         return "sql_execution"
     return END
 
@@ -68,6 +71,8 @@ def route_after_feasibility_check(state: SQLAssistantState):
 
     Decide next operation based on feasibility check results.
     If query is feasible, generate SQL; otherwise end processing.
+    Query examples are retrieved in parallel with data source identification
+    and are already in state at this point.
 
     Args:
         state: Current state object
@@ -75,10 +80,10 @@ def route_after_feasibility_check(state: SQLAssistantState):
     Returns:
         str: Next node identifier
     """
-    feasibility_check = state.get("feasibility_check", {})
-    if not feasibility_check or not feasibility_check.get("is_feasible"):
-        return END
-    return "query_example_retrieval"
+    feasibility_check = state.get("feasibility_check")
+    if feasibility_check and feasibility_check.get("is_feasible"):
+        return "sql_generation"
+    return END
 
 
 def route_after_permission_check(state: SQLAssistantState):
@@ -94,9 +99,8 @@ def route_after_permission_check(state: SQLAssistantState):
     Returns:
         str: Next node identifier
     """
-    execution_result = state.get("execution_result", {})
-
-    if execution_result.get("success", False):
+    execution_result = state.get("execution_result")
+    if execution_result and execution_result.get("success"):
         return "sql_execution"
     return "error_analysis"
 
@@ -113,6 +117,6 @@ def route_after_data_source(state: SQLAssistantState):
     Returns:
         str: Next node identifier
     """
-    if not state.get("has_relevant_tables", False):
-        return END
-    return "table_structure_analysis"
+    if state.get("has_relevant_tables"):
+        return "table_structure_analysis"
+    return END
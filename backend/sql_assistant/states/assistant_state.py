@@ -17,6 +17,8 @@ class SQLAssistantState(TypedDict):
     user_id: Optional[int]
     # Message history
     messages: Annotated[List[BaseMessage], add_messages]
+    # Formatted conversation history of the current turn, written by intent analysis
+    dialogue_history: str
     # Query intent analysis result
     query_intent: Optional[Dict]
     # Flag indicating whether intent is clear
@@ -25,12 +27,16 @@ class SQLAssistantState(TypedDict):
     keywords: List[str]
     # Business terms and their descriptions
     domain_term_mappings: Dict[str, str]
+    # Prompt-ready term descriptions, written together with domain_term_mappings
+    formatted_term_descriptions: List[Dict[str, str]]
     # Rewritten query
     rewritten_query: Optional[str]
     # Matched table information
     matched_tables: List[Dict[str, Any]]
     # Table structure information
     table_structures: List[Dict[str, Any]]
+    # Prompt-ready table structure text, written together with table_structures
+    formatted_table_structures: str
     # Generated SQL information
     generated_sql: Optional[Dict[str, Any]]
     # SQL execution result
@@ -44,4 +50,6 @@ class SQLAssistantState(TypedDict):
     # Feasibility check result
     feasibility_check: Optional[Dict]
     query_examples: Optional[List[Dict[str, str]]]
+    # Prompt-ready query example text, written together with query_examples
+    formatted_query_examples: str
     has_relevant_tables: bool
\ No newline at end of file
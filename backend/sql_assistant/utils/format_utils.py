@@ -3,9 +3,38 @@ Formatting utility functions module.
 Provides common functions for various data formatting.
 """
 
-from typing import List, Dict
-from langchain_core.messages import HumanMessage, BaseMessage
-from tabulate import tabulate
+import re
+from datetime import date
+from functools import lru_cache
+from typing import List, Dict, Optional
+from langchain_core.messages import AIMessage, HumanMessage, BaseMessage
+
+from utils.core.constants import TimeFormats
+
+# Minimum number of word characters in user messages worth sending to the LLM
+MIN_QUERY_LENGTH = 3
+_WORD_CHAR_PATTERN = re.compile(r"\w")
+
+# Role names in formatted history by message type; other types are shown as the assistant
+_ROLE_NAMES = {"human": "User"}
+
+
+@lru_cache(maxsize=1)
+def _format_date(day_ordinal: int) -> str:
+    """Format a date given as proleptic Gregorian ordinal"""
+    return date.fromordinal(day_ordinal).strftime(TimeFormats.DATE_FORMAT)
+
+
+def get_current_date() -> str:
+    """Get today's date formatted for prompts
+
+    The formatted string is computed once per day; keying on the day itself
+    means it changes exactly at midnight, keeping prompt text stable all day.
+
+    Returns:
+        str: Current date in YYYY-MM-DD format
+    """
+    return _format_date(date.today().toordinal())
 
 
 def format_conversation_history(messages: List[BaseMessage]) -> str:
@@ -19,11 +48,64 @@ def format_conversation_history(messages: List[BaseMessage]) -> str:
     Returns:
         str: Formatted conversation history
     """
-    formatted = []
+    return "\n".join(
+        f"{_ROLE_NAMES.get(msg.type, 'Assistant')}: {msg.content}" for msg in messages
+    )
+
+
+def get_dialogue_history(state: Dict) -> str:
+    """Get formatted conversation history, preferring the copy stored in state
+
+    Intent analysis stores the formatted history for the current turn, so nodes
+    running after it do not scan the message list again.
+
+    Args:
+        state: Current state object
+
+    Returns:
+        str: Formatted conversation history
+    """
+    dialogue_history = state.get("dialogue_history")
+    if dialogue_history is None:
+        dialogue_history = format_conversation_history(state.get("messages", []))
+    return dialogue_history
+
+
+def feedback_message_update(feedback: Optional[str]) -> Dict[str, List[AIMessage]]:
+    """Build the messages part of a state update from user feedback
+
+    Meant to be unpacked into a node's response dict, so the AIMessage is only
+    built when there is feedback to show.
+
+    Args:
+        feedback: Feedback text shown to the user, may be empty
+
+    Returns:
+        Dict[str, List[AIMessage]]: Messages update, empty without feedback
+    """
+    return {"messages": [AIMessage(content=feedback)]} if feedback else {}
+
+
+def has_meaningful_input(messages: List[BaseMessage], min_length: int = MIN_QUERY_LENGTH) -> bool:
+    """Check whether the user messages contain enough text to analyze
+
+    Whitespace, punctuation and emoji are not counted, so such messages are
+    rejected without a model call.
+
+    Args:
+        messages: Message history list
+        min_length: Minimum number of word characters required
+
+    Returns:
+        bool: True if user messages contain at least min_length word characters
+    """
+    count = 0
     for msg in messages:
-        role = "User" if isinstance(msg, HumanMessage) else "Assistant"
-        formatted.append(f"{role}: {msg.content}")
-    return "\n".join(formatted)
+        if isinstance(msg, HumanMessage) and isinstance(msg.content, str):
+            count += len(_WORD_CHAR_PATTERN.findall(msg.content))
+            if count >= min_length:
+                return True
+    return False
 
 
 def format_term_descriptions(term_mappings: Dict[str, Dict[str, str]]) -> List[Dict[str, str]]:
@@ -38,15 +120,14 @@ def format_term_descriptions(term_mappings: Dict[str, Dict[str, str]]) -> List[D
     if not term_mappings:
         return []
 
-    formatted_mappings = []
-    for mapping in term_mappings.values():
-        formatted_mappings.append({
+    return [
+        {
             "original_term": mapping["original_term"],
             "standard_name": mapping["standard_name"],
             "additional_info": mapping["additional_info"]
-        })
-    
-    return formatted_mappings
+        }
+        for mapping in term_mappings.values()
+    ]
 
 
 def format_table_structures(table_structures: List[Dict]) -> str:
@@ -61,16 +142,99 @@ def format_table_structures(table_structures: List[Dict]) -> str:
     if not table_structures:
         return "No available table structure information"
 
-    formatted = []
-    for table in table_structures:
-        formatted.append(
-            f"Table name: {table['table_name']}\n"
-            f"Description: {table.get('description', 'No description')}\n"
-            f"Column information:\n{table['columns']}\n"
-            f"Additional info: {table.get('additional_info', 'No additional info')}\n"
-        )
+    # Sort by table name so the same tables always render to the same prompt text
+    return "\n".join(
+        _format_table_structure(table)
+        for table in sorted(table_structures, key=lambda t: t["table_name"])
+    )
 
-    return "\n".join(formatted)
+
+def _format_table_structure(table: Dict) -> str:
+    """Format structure information of a single table"""
+    return (
+        f"Table name: {table['table_name']}\n"
+        f"Description: {table.get('description', 'No description')}\n"
+        f"Column information:\n{table['columns']}\n"
+        f"Additional info: {table.get('additional_info', 'No additional info')}\n"
+    )
+
+
+def get_formatted_table_structures(state: Dict) -> str:
+    """Get prompt-ready table structures, preferring the copy precomputed in state
+
+    Args:
+        state: Current state object
+
+    Returns:
+        str: Formatted table structure description text
+    """
+    formatted = state.get("formatted_table_structures")
+    if formatted is None:
+        formatted = format_table_structures(state.get("table_structures", []))
+    return formatted
+
+
+def get_formatted_term_descriptions(state: Dict) -> List[Dict[str, str]]:
+    """Get prompt-ready term descriptions, preferring the copy precomputed in state
+
+    Args:
+        state: Current state object
+
+    Returns:
+        List[Dict[str, str]]: Formatted term mapping information list
+    """
+    formatted = state.get("formatted_term_descriptions")
+    if formatted is None:
+        formatted = format_term_descriptions(state.get("domain_term_mappings", {}))
+    return formatted
+
+
+def format_query_examples(query_examples: List[Dict[str, str]]) -> str:
+    """Format retrieved query examples
+
+    Args:
+        query_examples: Query examples with query_text and query_sql
+
+    Returns:
+        str: Formatted query example text
+    """
+    return "\n".join(
+        f"Example query: [{example['query_text']}]\nExample SQL: [{example['query_sql']}]"
+        for example in query_examples
+    ) or "No related examples"
+
+
+def get_formatted_query_examples(state: Dict) -> str:
+    """Get prompt-ready query examples, preferring the copy precomputed in state
+
+    Args:
+        state: Current state object
+
+    Returns:
+        str: Formatted query example text
+    """
+    formatted = state.get("formatted_query_examples")
+    if formatted is None:
+        formatted = format_query_examples(state.get("query_examples") or [])
+    return formatted
+
+
+def get_result_rows(execution_result: Dict) -> List[tuple]:
+    """Get result rows as tuples in column order
+
+    Results stored by older versions hold a list of dicts under 'results'.
+
+    Args:
+        execution_result: SQL execution result dictionary
+
+    Returns:
+        List[tuple]: Result rows, empty when there are none
+    """
+    rows = execution_result.get('rows')
+    if rows is None and execution_result.get('results'):
+        columns = execution_result['columns']
+        rows = [tuple(row[col] for col in columns) for row in execution_result['results']]
+    return rows or []
 
 
 def format_results_preview(execution_result: Dict) -> str:
@@ -85,14 +249,14 @@ def format_results_preview(execution_result: Dict) -> str:
     Returns:
         str: Formatted result preview text
     """
-    if not execution_result.get('results'):
+    rows = get_result_rows(execution_result)
+    if not rows:
         return "No data"
 
-    results = execution_result['results']
     columns = execution_result['columns']
 
     # If result set is too large, return prompt information
-    if len(results) > 20:
+    if len(rows) > 20:
         return f"Result set too large, not displaying specific data"
 
     # Build table format preview
@@ -101,9 +265,8 @@ def format_results_preview(execution_result: Dict) -> str:
     lines.append("| " + " | ".join(columns) + " |")
     lines.append("|" + "|".join(["-" * len(col) for col in columns]) + "|")
     # Data rows
-    for row in results:
-        lines.append("| " + " | ".join(str(row[col])
-                                       for col in columns) + " |")
+    for row in rows:
+        lines.append("| " + " | ".join(map(str, row)) + " |")
 
     return "\n".join(lines)
 
@@ -119,18 +282,18 @@ def format_full_results(execution_result: Dict) -> str:
     Returns:
         str: Formatted complete result text
     """
-    if not execution_result.get('results'):
+    rows = get_result_rows(execution_result)
+    if not rows:
         return "No data"
 
-    results = execution_result['results']
-    columns = execution_result['columns']
+    # Imported here: no graph node renders full results, so most processes never need it
+    from tabulate import tabulate
 
-    # Convert results to row data list
-    rows = []
-    for row in results:
-        rows.append([str(row[col]) for col in columns])
+    columns = execution_result['columns']
 
-    # Generate table using tabulate
+    # Rows are already in column order, so they go to tabulate as they are.
+    # With number parsing disabled tabulate renders every cell with str() itself,
+    # so the cells need no conversion pass beforehand
     # Use 'pipe' style for best display in notebooks
     table = tabulate(
         rows,
@@ -138,7 +301,9 @@ def format_full_results(execution_result: Dict) -> str:
         tablefmt='pipe',  # Use pipe format for markdown table display in notebooks
         showindex=False,
         numalign='left',
-        stralign='left'
+        stralign='left',
+        disable_numparse=True,
+        missingval='None'
     )
     
     return table
@@ -0,0 +1,236 @@
+"""
+LLM cache module.
+Provides the global exact-match LLM cache used by LangChain, and an in-process
+cache of parsed chain results that chains can opt into semantic matching for.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.caches import BaseCache
+from langchain_core.embeddings import Embeddings
+from langchain_community.cache import SQLiteCache
+
+from utils.core.cache import TTLCache
+from utils.core.constants import PathConstants
+
+logger = logging.getLogger(__name__)
+
+try:
+    # Rust JSON serializer shipped with langsmith, used when available
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed langsmith version
+    orjson = None
+
+
+class _SemanticPartition:
+    """Cached results of a single chain with their normalized input embeddings
+
+    Vectors are kept in a preallocated matrix that doubles when full, so adding
+    an entry copies existing rows only O(log n) times. Once ``max_entries`` is
+    reached, the oldest entry is overwritten in place.
+    """
+
+    _INITIAL_ROWS = 16
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # Rows [0, len(results)) hold the vectors of the cached results
+        self.matrix: Optional[np.ndarray] = None
+        self.results: List[Any] = []
+        self._oldest = 0
+
+    def add(self, vector: np.ndarray, result: Any) -> None:
+        size = len(self.results)
+        if size == self.max_entries:
+            self.matrix[self._oldest] = vector
+            self.results[self._oldest] = result
+            self._oldest = (self._oldest + 1) % self.max_entries
+            return
+
+        if self.matrix is None:
+            rows = min(self._INITIAL_ROWS, self.max_entries)
+            self.matrix = np.empty((rows, vector.shape[0]), dtype=np.float32)
+        elif size == self.matrix.shape[0]:
+            grown = np.empty((min(size * 2, self.max_entries), self.matrix.shape[1]), dtype=np.float32)
+            grown[:size] = self.matrix
+            self.matrix = grown
+        self.matrix[size] = vector
+        self.results.append(result)
+
+    def best_match(self, vector: np.ndarray) -> Tuple[float, Optional[Any]]:
+        if not self.results:
+            return 0.0, None
+        scores = self.matrix[:len(self.results)] @ vector
+        index = int(np.argmax(scores))
+        return float(scores[index]), self.results[index]
+
+
+def create_llm_cache() -> BaseCache:
+    """Create global LLM cache
+
+    The global cache serves every chain, and most prompts are dominated by table
+    structures and result previews, so prompts differing only in a filter value
+    or date would look alike to an embedding. It therefore matches exactly;
+    semantic matching is opted into per chain through LLMCache.
+
+    Returns:
+        BaseCache: SQLite exact-match cache
+    """
+    return SQLiteCache(database_path=PathConstants.LANGCHAIN_CACHE_DB)
+
+
+class LLMCache:
+    """In-process cache of parsed chain results
+
+    Caches the parsed output of a temperature 0 chain keyed on its prompt
+    templates and input, which skips both the model call and output parsing.
+    With ``semantic_field`` set, a miss falls back to comparing the embedding of
+    that input field with earlier inputs of the same chain.
+    """
+
+    def __init__(
+        self,
+        sys_msg: str,
+        user_msg: str,
+        maxsize: int = 4096,
+        ttl: Optional[float] = 3600,
+        semantic_field: Optional[str] = None,
+        similarity_threshold: float = 0.92,
+        embeddings: Optional[Embeddings] = None,
+    ):
+        """Initialize chain result cache
+
+        Args:
+            sys_msg: System prompt template of the chain
+            user_msg: User prompt template of the chain
+            maxsize: Maximum number of cached results
+            ttl: Result lifetime in seconds, None for no expiry
+            semantic_field: Input field compared by embedding similarity, None to disable
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            embeddings: Embedding model, defaults to the shared batching embedder
+        """
+        self._prefix = hashlib.sha256(f"{sys_msg}\x00{user_msg}".encode("utf-8")).hexdigest()
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._semantic_field = semantic_field
+        self._similarity_threshold = similarity_threshold
+        self._embeddings = embeddings
+        self._partition = _SemanticPartition(maxsize) if semantic_field else None
+        self._lock = threading.Lock()
+
+    def make_key(self, input_data: Dict[str, Any]) -> str:
+        """Build cache key from chain input
+
+        Inputs carry the formatted table structures, so serialization uses
+        orjson when available, hashing its bytes without a decode round trip.
+        """
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(input_data, default=str, option=orjson.OPT_SORT_KEYS)
+                return hashlib.sha256(self._prefix.encode("ascii") + b"\x00" + payload).hexdigest()
+            except TypeError:
+                # e.g. non-string dict keys, which only the stdlib encoder accepts
+                pass
+        payload = json.dumps(input_data, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(f"{self._prefix}\x00{payload}".encode("utf-8")).hexdigest()
+
+    def _get_embeddings(self) -> Embeddings:
+        if self._embeddings is None:
+            # Imported here so exact-only caches never touch the embedding setup
+            from utils.services.batching import get_batching_embeddings
+            self._embeddings = get_batching_embeddings()
+        return self._embeddings
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def _semantic_text(self, input_data: Dict[str, Any]) -> Optional[str]:
+        if self._partition is None:
+            return None
+        text = input_data.get(self._semantic_field)
+        return text if isinstance(text, str) and text else None
+
+    def _semantic_lookup(self, vector: Optional[np.ndarray]) -> Any:
+        if vector is None:
+            return None
+        with self._lock:
+            score, result = self._partition.best_match(vector)
+        if result is not None and score >= self._similarity_threshold:
+            logger.debug(f"Chain semantic cache hit: similarity={score:.4f}")
+            return copy.deepcopy(result)
+        return None
+
+    def _store(self, key: str, vector: Optional[np.ndarray], result: Any) -> None:
+        self._cache.set(key, copy.deepcopy(result))
+        if vector is not None:
+            with self._lock:
+                self._partition.add(vector, copy.deepcopy(result))
+
+    def get_or_compute(self, input_data: Dict[str, Any], compute: Callable[[], Any]) -> Any:
+        """Return cached result for input, computing and caching it on a miss
+
+        Args:
+            input_data: Chain input
+            compute: Function invoking the chain
+
+        Returns:
+            Any: Parsed chain result
+        """
+        key = self.make_key(input_data)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        vector = None
+        text = self._semantic_text(input_data)
+        if text is not None:
+            try:
+                vector = self._normalize(self._get_embeddings().embed_query(text))
+            except Exception as e:
+                logger.warning(f"Chain semantic cache embedding failed: {str(e)}")
+            result = self._semantic_lookup(vector)
+            if result is not None:
+                return result
+
+        result = compute()
+        self._store(key, vector, result)
+        return result
+
+    async def aget_or_compute(
+        self, input_data: Dict[str, Any], compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Asynchronous variant of get_or_compute"""
+        key = self.make_key(input_data)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        vector = None
+        text = self._semantic_text(input_data)
+        if text is not None:
+            try:
+                vector = self._normalize(await self._get_embeddings().aembed_query(text))
+            except Exception as e:
+                logger.warning(f"Chain semantic cache embedding failed: {str(e)}")
+            result = self._semantic_lookup(vector)
+            if result is not None:
+                return result
+
+        result = await compute()
+        self._store(key, vector, result)
+        return result
+
+    def clear(self) -> None:
+        """Clear cached results"""
+        self._cache.clear()
+        if self._partition is not None:
+            with self._lock:
+                self._partition = _SemanticPartition(self._cache.maxsize)
@@ -0,0 +1,92 @@
+"""
+Node result cache module.
+Memoizes state updates of deterministic graph nodes so repeated queries skip
+their LLM and vector search calls.
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import logging
+from typing import Any, Callable, Hashable
+
+from utils.core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def _hash_key(node_name: str, key: Hashable) -> str:
+    """Hash node name and input key into a fixed-size cache key"""
+    return hashlib.blake2b(f"{node_name}\x00{key!r}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def memoize_node(
+    key_func: Callable[[Any], Hashable],
+    ttl: float = 3600,
+    maxsize: int = 1024,
+) -> Callable:
+    """Decorator caching a node's state update by the state fields it reads
+
+    The node must be a deterministic function of the fields returned by
+    ``key_func``. Updates are deep-copied in and out of the cache because
+    LangGraph reducers (e.g. add_messages) mutate returned messages.
+
+    Args:
+        key_func: Function building the cache key from the node's input state
+        ttl: Result lifetime in seconds
+        maxsize: Maximum number of cached results
+
+    Returns:
+        Callable: Decorator; the wrapped node exposes the cache as ``.cache``
+    """
+
+    def decorator(node: Callable) -> Callable:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        node_name = node.__name__
+
+        def _lookup(state: Any):
+            try:
+                cache_key = _hash_key(node_name, key_func(state))
+            except Exception as e:
+                logger.warning(f"Failed to build cache key for {node_name}: {str(e)}")
+                return None, _MISSING
+            cached = cache.get(cache_key, _MISSING)
+            if cached is not _MISSING:
+                logger.debug(f"Node cache hit: {node_name}")
+                return cache_key, copy.deepcopy(cached)
+            return cache_key, _MISSING
+
+        def _store(cache_key, result: Any) -> None:
+            # Error fallbacks are not cached so the next call retries
+            if cache_key is not None and isinstance(result, dict) and "error" not in result:
+                cache.set(cache_key, copy.deepcopy(result))
+
+        if asyncio.iscoroutinefunction(node):
+            @functools.wraps(node)
+            async def async_wrapper(state: Any) -> Any:
+                cache_key, cached = _lookup(state)
+                if cached is not _MISSING:
+                    return cached
+                result = await node(state)
+                _store(cache_key, result)
+                return result
+
+            async_wrapper.cache = cache
+            return async_wrapper
+
+        @functools.wraps(node)
+        def wrapper(state: Any) -> Any:
+            cache_key, cached = _lookup(state)
+            if cached is not _MISSING:
+                return cached
+            result = node(state)
+            _store(cache_key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
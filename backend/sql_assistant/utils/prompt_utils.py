@@ -0,0 +1,13 @@
+"""
+Prompt utility module.
+Provides prompt segments shared by the system prompts of several nodes.
+"""
+
+# Role sentence opening every analysis system prompt, kept identical so that
+# the providers' prefix caches can share it across node types
+ROLE_PREAMBLE = "You are a professional data analyst"
+
+# Rule shared by every prompt that writes feedback shown to users
+NATURAL_TABLE_NAMES_RULE = (
+    "Refer to tables in natural language, never expose database table names"
+)
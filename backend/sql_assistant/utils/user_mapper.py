@@ -4,13 +4,21 @@ Responsible for mapping queries between usernames and user IDs.
 """
 
 import logging
-from typing import Optional
-from sqlalchemy import text
+from functools import lru_cache
+from typing import Dict, List, Optional
+from sqlalchemy import bindparam, text
 
 from utils.factories.database import DatabaseFactory
+from utils.core.cache import TTLCache
+from utils.core.constants import CacheConstants
 
 logger = logging.getLogger(__name__)
 
+# Active users' IDs by username, shared across mapper instances
+_user_id_cache = TTLCache(
+    maxsize=CacheConstants.USER_ID_MAXSIZE, ttl=CacheConstants.USER_ID_TTL
+)
+
 class UserMapper:
     """Username mapper
 
@@ -30,14 +38,48 @@ class UserMapper:
         Returns:
             Optional[int]: User ID, returns None if user does not exist
         """
+        return self.get_user_ids([username]).get(username)
+
+    def get_user_ids(self, usernames: List[str]) -> Dict[str, int]:
+        """Query user IDs of several usernames in one round trip
+
+        Found IDs are cached briefly; unknown usernames are looked up again
+        next time, so newly created users are found at once.
+
+        Args:
+            usernames: Usernames
+
+        Returns:
+            Dict[str, int]: User ID by username, only for existing active users
+        """
+        user_ids = {}
+        missing = []
+        for username in dict.fromkeys(usernames):
+            user_id = _user_id_cache.get(username)
+            if user_id is None:
+                missing.append(username)
+            else:
+                user_ids[username] = user_id
+
+        if not missing:
+            return user_ids
+
         try:
             with self.engine.connect() as conn:
                 query = text(
-                    "SELECT user_id FROM user WHERE username = :username AND status = 1"
-                )
-                result = conn.execute(query, {"username": username}).fetchone()
-                return result[0] if result else None
+                    "SELECT username, user_id FROM user WHERE username IN :usernames AND status = 1"
+                ).bindparams(bindparam("usernames", expanding=True))
+                for username, user_id in conn.execute(query, {"usernames": missing}):
+                    _user_id_cache.set(username, user_id)
+                    user_ids[username] = user_id
 
         except Exception as e:
             logger.error(f"Failed to query user ID: {str(e)}")
-            return None
\ No newline at end of file
+
+        return user_ids
+
+
+@lru_cache()
+def get_user_mapper() -> UserMapper:
+    """Get shared username mapper"""
+    return UserMapper()
@@ -1,4 +1,5 @@
 import os
+import re
 import sys
 import streamlit as st
 import uuid
@@ -8,7 +9,30 @@ import time
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.append(project_root)
 
-from frontend.ui_components import apply_common_styles, display_project_info, display_demo_data_info
+from frontend.ui_components import (
+    apply_common_styles,
+    display_project_info,
+    display_demo_data_info,
+    ProgressTracker,
+)
+from utils.core.cache import TTLCache
+from utils.core.constants import CacheConstants
+from utils.core.streamlit_config import settings
+
+# Direct calls load the backend with the page rather than on the first query
+if settings.app.frontend_direct_call:
+    from langchain_core.utils.json import parse_partial_json
+    from langgraph.checkpoint.memory import MemorySaver
+    from backend.sql_assistant.graph.assistant_graph import (
+        run_query_bot as run_backend_query_bot,
+        stream_query_bot,
+    )
+    from backend.sql_assistant.utils.user_mapper import get_user_mapper
+
+# Markdown table: header row, separator row and at least one data row
+_MARKDOWN_TABLE_PATTERN = re.compile(r"\|.*\|\n\|[-:| ]+\|\n(\|.*\|\n)+")
+# First fenced SQL code block in an assistant reply
+_SQL_FENCE_PATTERN = re.compile(r"```sql(.*?)```", re.DOTALL)
 
 
 def initialize_query_bot():
@@ -52,14 +76,24 @@ def display_info_message():
     )
 
 
+@st.cache_resource
+def load_architecture_image():
+    """Load architecture diagram bytes once per process, None if the file is missing."""
+    architecture_path = os.path.join(project_root, "frontend", "assets", "architecture_diagram.png")
+    if not os.path.exists(architecture_path):
+        return None
+    with open(architecture_path, "rb") as f:
+        return f.read()
+
+
 def display_architecture_diagram():
     """Display system architecture diagram in an expander."""
     with st.expander("🏗️ System Architecture", expanded=False):
         # Load and display the architecture diagram
         try:
-            architecture_path = os.path.join(project_root, "frontend", "assets", "architecture_diagram.png")
-            if os.path.exists(architecture_path):
-                st.image(architecture_path, caption="QueryBot System Architecture", use_container_width=True)
+            architecture_image = load_architecture_image()
+            if architecture_image is not None:
+                st.image(architecture_image, caption="QueryBot System Architecture", use_container_width=True)
             else:
                 st.warning("Architecture diagram not found.")
         except Exception as e:
@@ -77,12 +111,17 @@ def process_user_query():
     user_query = input_placeholder.chat_input("Please enter your query:")
 
     if user_query:
-        display_user_input(chat_container, user_query)
+        # Submitting the same query again interrupts the run still answering it;
+        # that question is then the last, unanswered history entry and is not added twice
+        messages = st.session_state.messages
+        if not (messages and messages[-1]["role"] == "user" and messages[-1]["content"] == user_query):
+            display_user_input(chat_container, user_query)
         process_and_display_response(chat_container, user_query)
 
 
 def display_conversation_history(container):
     """Display conversation history."""
+    table_store = _table_store()
     with container:
         for message in st.session_state.messages:
             with st.chat_message(message["role"]):
@@ -92,9 +131,20 @@ def display_conversation_history(container):
                 if message["role"] == "assistant" and "sql_query" in message:
                     st.code(message["sql_query"], language="sql")
 
-                # If it contains query results, display data table
-                if "results" in message:
-                    st.dataframe(message["results"])
+                # If it references query results, display data table
+                table_id = message.get("table_id")
+                table = table_store.get((st.session_state.session_id, table_id)) if table_id else None
+                if table is not None:
+                    st.dataframe(table)
+
+
+@st.cache_resource
+def _table_store():
+    """Result tables by (session id, message id), kept out of session state so reruns do not copy them.
+
+    The store is bounded; a table evicted by size or age is no longer shown in the history.
+    """
+    return TTLCache(maxsize=CacheConstants.RESULT_TABLE_MAXSIZE, ttl=CacheConstants.RESULT_TABLE_TTL)
 
 
 def display_user_input(container, user_query):
@@ -108,43 +158,41 @@ def display_user_input(container, user_query):
 def process_and_display_response(container, user_query):
     """Process user query and display response with real-time progress."""
     # Call backend to process query (now with progress display)
-    response = process_query_with_backend(user_query)
+    response = process_query_with_backend(user_query, container)
 
     display_assistant_response(container, response)
 
 
 def extract_table_from_markdown(text):
     """Extract table data from markdown text"""
-    import re
-    import pandas as pd
-
     # Find markdown table
-    table_pattern = r"\|.*\|\n\|[-:| ]+\|\n(\|.*\|\n)+"
-    table_match = re.search(table_pattern, text)
+    table_match = _MARKDOWN_TABLE_PATTERN.search(text)
 
     if not table_match:
         return None
 
-    # Extract table text
-    table_text = table_match.group(0)
+    import csv
+    import io
+    import pandas as pd
 
     try:
-        # Parse markdown table using pandas
-        lines = table_text.strip().split('\n')
-        # Process header
-        header_line = lines[0]
-        headers = [col.strip() for col in header_line.split('|')[1:-1]]
-
-        # Skip separator line (|---|---|)
-        data_lines = lines[2:]
-        data = []
-        for line in data_lines:
-            if line.strip():
-                row = [cell.strip() for cell in line.split('|')[1:-1]]
-                data.append(row)
-
-        # Create DataFrame
-        df = pd.DataFrame(data, columns=headers)
+        # Drop the separator line (|---|---|) and parse the rest with pandas' C parser
+        lines = table_match.group(0).strip().split('\n')
+        table_text = '\n'.join([lines[0]] + lines[2:])
+        df = pd.read_csv(
+            io.StringIO(table_text),
+            sep='|',
+            engine='c',
+            dtype=str,
+            keep_default_na=False,
+            quoting=csv.QUOTE_NONE,
+            skipinitialspace=True,
+        )
+
+        # Leading and trailing pipes produce empty first and last columns
+        df = df.iloc[:, 1:-1]
+        df.columns = [str(col).strip() for col in df.columns]
+        df = df.apply(lambda col: col.str.strip())
 
         # Only return when table actually has data
         if not df.empty:
@@ -154,36 +202,30 @@ def extract_table_from_markdown(text):
         return None
 
 
-def process_query_with_backend(query):
+def process_query_with_backend(query, container=None):
     """Process query with backend."""
-    from utils.core.streamlit_config import settings
-
     if settings.app.frontend_direct_call:
-        return process_query_direct(query)
+        return process_query_direct(query, container)
     else:
         return process_query_via_api(query)
 
 
-def process_query_direct(query):
-    """Call backend logic directly with streamlined progress display."""
-    try:
-        from backend.sql_assistant.graph.assistant_graph import build_query_bot_graph
-        from langgraph.checkpoint.memory import MemorySaver
-        from backend.sql_assistant.utils.user_mapper import UserMapper
-        from utils.core.streamlit_config import settings
-        from langchain_core.messages import HumanMessage
-        from frontend.ui_components import ProgressTracker
+@st.cache_resource
+def get_checkpoint_saver():
+    """Get checkpoint saver shared across reruns, so conversations keep their state between turns."""
+    return MemorySaver()
+
 
+def process_query_direct(query, container=None):
+    """Call backend logic directly, streaming the answer text as it is generated."""
+    try:
         # Initialize progress tracker
         progress_tracker = ProgressTracker()
         progress_tracker.start()
 
         # Initialize components
-        from backend.sql_assistant.graph.assistant_graph import stream_query_bot
-        from langgraph.checkpoint.memory import MemorySaver
-
-        checkpoint_saver = MemorySaver()
-        user_mapper = UserMapper()
+        checkpoint_saver = get_checkpoint_saver()
+        user_mapper = get_user_mapper()
 
         user_id = None
         username = "anonymous"
@@ -191,22 +233,48 @@ def process_query_direct(query):
             user_id = user_mapper.get_user_id(username)
 
 
-        # Stream execution with native LangGraph updates
+        # Stream execution with native LangGraph updates and LLM message chunks
         final_result = None
-        try:
-            # Use the new streaming function with native LangGraph stream_mode="updates"
-            for chunk in stream_query_bot(
+
+        def answer_stream():
+            """Yield the answer description as the result generation model writes it."""
+            nonlocal final_result
+
+            answer_json = ""
+            streamed = ""
+            for mode, chunk in stream_query_bot(
                 query=query,
                 thread_id=st.session_state.session_id,
                 checkpoint_saver=checkpoint_saver,
-                user_id=user_id
+                user_id=user_id,
+                stream_tokens=True,
             ):
+                if mode == "messages":
+                    # Other nodes emit internal JSON, only the answer is shown
+                    message_chunk, metadata = chunk
+                    if metadata.get("langgraph_node") != "result_generation":
+                        continue
+                    if not isinstance(message_chunk.content, str):
+                        continue
+                    answer_json += message_chunk.content
+                    try:
+                        partial = parse_partial_json(answer_json) or {}
+                    except Exception:
+                        continue
+                    description = partial.get("result_description") if isinstance(partial, dict) else None
+                    if isinstance(description, str) and description.startswith(streamed):
+                        delta = description[len(streamed):]
+                        if delta:
+                            streamed = description
+                            yield delta
+                    continue
+
                 # Handle error chunks
                 if "error" in chunk:
                     progress_tracker.error(f"Execution failed: {chunk['error']['error']}")
                     break
 
-                # Each chunk is a dict: {node_name: node_output}
+                # Each update is a dict: {node_name: node_output}
                 for node_name, node_output in chunk.items():
                     # Update progress tracker
                     progress_tracker.update(node_name)
@@ -215,6 +283,12 @@ def process_query_direct(query):
                     if isinstance(node_output, dict) and 'messages' in node_output:
                         final_result = node_output
 
+        try:
+            preview = (container or st).empty()
+            preview.write_stream(answer_stream())
+            # The final message is rendered with its table by display_assistant_response
+            preview.empty()
+
             # Mark processing as complete if no errors
             if final_result:
                 progress_tracker.complete()
@@ -224,9 +298,7 @@ def process_query_direct(query):
 
             # Fallback to traditional execution if streaming fails
             with st.spinner("🔄 Switching to traditional execution mode..."):
-                from backend.sql_assistant.graph.assistant_graph import run_query_bot
-
-                result = run_query_bot(
+                result = run_backend_query_bot(
                     query=query,
                     thread_id=st.session_state.session_id,
                     checkpoint_saver=checkpoint_saver,
@@ -265,37 +337,78 @@ def process_query_direct(query):
         return {"error": f"Direct call failed: {str(e)}"}
 
 
-def process_query_via_api(query):
-    """Call backend API to process query."""
+@st.cache_resource
+def get_api_session():
+    """Get HTTP session shared across reruns, keeping backend connections alive."""
     import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def process_query_via_api(query):
+    """Call backend streaming API, showing progress as node updates arrive."""
+    import json
 
-    from utils.core.streamlit_config import settings
     api_base_url = f"http://{settings.app.base_host}:8000"
+    progress_tracker = ProgressTracker()
+    progress_tracker.start()
+
     try:
-        response = requests.post(
-            f"{api_base_url}/api/query-bot",
+        last_message = None
+        with get_api_session().post(
+            f"{api_base_url}/api/query-bot/stream",
             json={"text": query, "session_id": st.session_state.session_id, "username": "anonymous"},
-        )
-        result = response.json()
+            stream=True,
+        ) as response:
+            response.raise_for_status()
 
-        message_text = result.get("text", "")
+            # Each server-sent event holds one {node_name: node_output} update
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data: "):
+                    continue
+                chunk = json.loads(line[len("data: "):])
+
+                # The opening event only echoes the session ID
+                if "session_id" in chunk:
+                    continue
+
+                if "error" in chunk:
+                    progress_tracker.error(f"Execution failed: {chunk['error']['error']}")
+                    return {"error": chunk["error"]["error"]}
+
+                for node_name, node_output in chunk.items():
+                    progress_tracker.update(node_name)
+                    if isinstance(node_output, dict) and node_output.get("messages"):
+                        last_message = node_output["messages"][-1]["content"]
+
+        if last_message is None:
+            return {"error": "No assistant reply received"}
+
+        progress_tracker.complete()
 
         response_data = {
-            "message": message_text,
-            "session_id": result.get("session_id", st.session_state.session_id)
+            "message": last_message,
+            "session_id": st.session_state.session_id
         }
 
-        table_data = extract_table_from_markdown(message_text)
+        table_data = extract_table_from_markdown(last_message)
         if table_data is not None:
             response_data["results"] = table_data
 
         return response_data
     except Exception as e:
+        progress_tracker.error(f"API call failed: {str(e)}")
         return {"error": f"API call failed: {str(e)}"}
 
 
 def display_assistant_response(container, response):
     """Display assistant response."""
+    message = {"role": "assistant"}
     with container:
         with st.chat_message("assistant"):
             if "error" in response:
@@ -307,16 +420,11 @@ def display_assistant_response(container, response):
                 # Parse message content, try to extract SQL and results
                 # SQL is usually between ```sql and ```
                 sql_query = None
-                if '```sql' in message_content:
-                    try:
-                        sql_start = message_content.find('```sql') + 6
-                        sql_end = message_content.find('```', sql_start)
-                        if sql_end > sql_start:
-                            sql_query = message_content[sql_start:sql_end].strip()
-                            # Remove SQL code block to avoid displaying twice in markdown
-                            message_content = message_content.replace(f"```sql\n{sql_query}\n```", "")
-                    except Exception as e:
-                        st.warning(f"Failed to extract SQL: {str(e)}")
+                match = _SQL_FENCE_PATTERN.search(message_content)
+                if match:
+                    sql_query = match.group(1).strip()
+                    # Remove SQL code block to avoid displaying twice in markdown
+                    message_content = message_content[:match.start()] + message_content[match.end():]
 
                 # Display message content
                 st.markdown(message_content)
@@ -324,20 +432,18 @@ def display_assistant_response(container, response):
                 # If SQL was extracted, display as code block
                 if sql_query:
                     st.code(sql_query, language="sql")
-                    response["sql_query"] = sql_query
+                    message["sql_query"] = sql_query
 
                 # Only display data table when there is actually non-empty result data
                 if "results" in response and not response["results"].empty:
                     st.dataframe(response["results"])
+                    table_id = str(uuid.uuid4())
+                    _table_store().set((st.session_state.session_id, table_id), response["results"])
+                    message["table_id"] = table_id
 
-            # Save to conversation history
-            st.session_state.messages.append(
-                {
-                    "role": "assistant",
-                    "content": message_content,
-                    **response,  # Include other response information
-                }
-            )
+            # Save to conversation history, tables only by reference
+            message["content"] = message_content
+            st.session_state.messages.append(message)
 
 
 # If running this file directly, start the application
@@ -9,11 +9,15 @@ VERSION = "0.1.0"
 class ProgressTracker:
     """Simple progress tracker for LangGraph stream updates."""
 
+    # Minimum interval between two renders of the same step, in seconds
+    MIN_RENDER_INTERVAL = 0.1
+
     def __init__(self):
-        self.progress_bar = None
-        self.status_text = None
+        self.status = None
         self.current_step = 0
         self.total_steps = 13  # Total number of processing nodes
+        self._last_node = None
+        self._last_render = 0.0
 
         # Node display names
         self.node_names = {
@@ -34,34 +38,41 @@ class ProgressTracker:
 
     def start(self):
         """Initialize progress display."""
-        self.progress_bar = st.progress(0)
-        self.status_text = st.empty()
+        self.status = st.status("Processing...", state="running")
         self.current_step = 0
+        self._last_node = None
+        self._last_render = 0.0
 
     def update(self, node_name: str):
-        """Update progress for a node."""
-        if node_name in self.node_names:
-            self.current_step += 1
-            progress = min(self.current_step / self.total_steps, 1.0)
+        """Update progress for a node.
+
+        The status label is re-rendered when the step changes, and repeated
+        updates of the same step at most every MIN_RENDER_INTERVAL seconds.
+        """
+        display_name = self.node_names.get(node_name)
+        if display_name is None:
+            return
 
-            if self.progress_bar:
-                self.progress_bar.progress(progress)
+        self.current_step += 1
+        now = time.monotonic()
+        if node_name == self._last_node and now - self._last_render < self.MIN_RENDER_INTERVAL:
+            return
 
-            if self.status_text:
-                display_name = self.node_names[node_name]
-                self.status_text.text(f"Processing: {display_name}")
+        self._last_node = node_name
+        self._last_render = now
+        if self.status:
+            step = min(self.current_step, self.total_steps)
+            self.status.update(label=f"Processing: {display_name} ({step}/{self.total_steps})")
 
     def complete(self):
         """Mark processing as complete."""
-        if self.progress_bar:
-            self.progress_bar.progress(1.0)
-        if self.status_text:
-            self.status_text.success("✅ Processing Complete")
+        if self.status:
+            self.status.update(label="✅ Processing Complete", state="complete")
 
     def error(self, message: str):
         """Display error message."""
-        if self.status_text:
-            self.status_text.error(f"❌ {message}")
+        if self.status:
+            self.status.update(label=f"❌ {message}", state="error")
 
 
 def apply_common_styles():
@@ -0,0 +1,80 @@
+"""
+Tests for table reference extraction in the permission control node.
+"""
+
+import pytest
+
+from backend.sql_assistant.nodes.permission_control_node import (
+    _find_mentioned_tables,
+    _find_unrestricted_tables,
+    _scan_table_references,
+)
+
+TABLES = frozenset({"employees", "departments"})
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        # Comma join: the second reference follows neither FROM nor JOIN
+        "SELECT * FROM employees e, employees f WHERE e.manager_id = f.id",
+        # Schema-qualified name
+        "SELECT * FROM employees e JOIN hr.employees f ON e.id = f.id",
+        # Parenthesized source in a nested subquery
+        "SELECT * FROM employees WHERE id IN (SELECT id FROM (employees))",
+        # FROM inside EXTRACT is followed by a column reference, not a table
+        "SELECT EXTRACT(YEAR FROM employees.hire_date) FROM employees",
+    ],
+)
+def test_unmatched_occurrences_fall_back_to_parser(sql):
+    assert _scan_table_references(sql, TABLES) is None
+
+
+def test_self_join_with_join_keyword_matches_every_reference():
+    sql = "SELECT * FROM employees e JOIN employees f ON e.manager_id = f.id"
+    # The ON clause only uses aliases, so both references are matched
+    tables = _scan_table_references(sql, TABLES)
+    assert [(t.name, t.alias) for t in tables] == [("employees", "e"), ("employees", "f")]
+
+
+def test_nested_subquery_references_are_all_returned():
+    sql = (
+        "SELECT e.name FROM employees e JOIN departments AS d ON e.dept_id = d.id "
+        "WHERE e.id IN (SELECT manager_id FROM employees)"
+    )
+    tables = _scan_table_references(sql, TABLES)
+    assert [(t.name, t.alias) for t in tables] == [
+        ("employees", "e"), ("departments", "d"), ("employees", None)
+    ]
+    for table in tables:
+        assert sql[table.start:table.end].lower().startswith(table.name)
+
+
+def test_index_hint_is_not_an_alias():
+    tables = _scan_table_references("SELECT * FROM employees USE INDEX (idx_dept)", TABLES)
+    assert [(t.name, t.alias) for t in tables] == [("employees", None)]
+
+
+def test_mentioned_tables_are_counted_per_occurrence():
+    sql = "SELECT * FROM employees e, Employees f, departments"
+    assert _find_mentioned_tables(sql, TABLES) == {"employees": 2, "departments": 1}
+
+
+AUTH = "(SELECT * FROM employees WHERE dept_path REGEXP '(^|>)7(>|$)') AS e"
+
+
+def test_injected_references_are_not_unrestricted():
+    sql = f"SELECT e.name, employees.id FROM {AUTH}"
+    assert _find_unrestricted_tables(sql, [AUTH], frozenset({"employees"})) == set()
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        f"SELECT * FROM {AUTH}, employees f",
+        f"SELECT * FROM {AUTH} JOIN hr.employees f ON e.id = f.id",
+        f"SELECT * FROM {AUTH} WHERE e.id IN (SELECT id FROM (employees))",
+    ],
+)
+def test_references_missed_by_injection_are_reported(sql):
+    assert _find_unrestricted_tables(sql, [AUTH], frozenset({"employees"})) == {"employees"}
@@ -0,0 +1,103 @@
+"""
+Tests for in-memory term matching in the term mapping node.
+"""
+
+import pytest
+
+from backend.sql_assistant.nodes import term_mapping_node
+from backend.sql_assistant.nodes.term_mapping_node import (
+    DomainTermMapper,
+    TERM_QUERY_BATCH_SIZE,
+    _get_term_matrix,
+)
+
+
+class _FakeIterator:
+    def __init__(self, batches):
+        self._batches = list(batches)
+        self.closed = False
+
+    def next(self):
+        return self._batches.pop(0) if self._batches else []
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeCollection:
+    """Term collection served in pages, like Milvus query_iterator"""
+
+    name = "term_descriptions"
+
+    def __init__(self, records, page_size=2):
+        self.num_entities = len(records)
+        self._records = records
+        self._page_size = page_size
+        self.iterators = []
+
+    def query_iterator(self, batch_size, expr, output_fields):
+        assert batch_size == TERM_QUERY_BATCH_SIZE
+        assert "original_term_vector" in output_fields
+        pages = [
+            self._records[i:i + self._page_size]
+            for i in range(0, len(self._records), self._page_size)
+        ]
+        iterator = _FakeIterator(pages)
+        self.iterators.append(iterator)
+        return iterator
+
+    def query(self, *args, **kwargs):
+        raise AssertionError("a single query cannot read the whole collection")
+
+
+def _term(name, vector):
+    return {
+        "original_term": name,
+        "standard_name": name.upper(),
+        "additional_info": "",
+        "original_term_vector": vector,
+    }
+
+
+RECORDS = [
+    _term("revenue", [1.0, 0.0, 0.0]),
+    _term("headcount", [0.0, 1.0, 0.0]),
+    _term("attrition", [0.0, 0.0, 1.0]),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_term_matrix_cache():
+    term_mapping_node._term_matrix_cache.clear()
+    yield
+    term_mapping_node._term_matrix_cache.clear()
+
+
+def test_term_matrix_is_loaded_across_pages():
+    collection = _FakeCollection(RECORDS)
+
+    terms, matrix = _get_term_matrix(collection)
+
+    assert [term["original_term"] for term in terms] == ["revenue", "headcount", "attrition"]
+    assert matrix.shape == (3, 3)
+    assert collection.iterators[0].closed
+
+
+def test_search_terms_matches_in_memory(monkeypatch):
+    def fail_search(**kwargs):
+        raise AssertionError("vector search used for a small term collection")
+
+    monkeypatch.setattr(term_mapping_node, "batch_search_in_milvus", fail_search)
+    mapper = DomainTermMapper.__new__(DomainTermMapper)
+    mapper.collection = _FakeCollection(RECORDS)
+
+    results = mapper._search_terms([[0.1, 0.9, 0.0], [0.0, 0.2, 0.8]])
+
+    assert [hits[0]["standard_name"] for hits in results] == ["HEADCOUNT", "ATTRITION"]
+    assert results[0][0]["distance"] == pytest.approx(0.9)
+
+
+def test_large_collection_uses_vector_search(monkeypatch):
+    monkeypatch.setattr(term_mapping_node, "TERM_MATRIX_MAX_ROWS", 2)
+
+    assert _get_term_matrix(_FakeCollection(RECORDS)) is None
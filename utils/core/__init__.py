@@ -6,6 +6,7 @@ Provides core infrastructure for the project, including:
 - Constant definitions: Project-level constants
 - Error handling: Standardized exception handling mechanisms
 - Logging configuration: Unified logging configuration
+- Caching: Thread-safe in-process TTL/LRU cache
 """
 
 from .config import settings, get_settings
@@ -17,7 +18,8 @@ from .constants import (
     HttpStatusCodes,
     PathConstants,
     TimeFormats,
-    RegexPatterns
+    RegexPatterns,
+    CacheConstants
 )
 from .error_handler import (
     SQLAssistantError,
@@ -29,6 +31,7 @@ from .error_handler import (
     error_handler,
     create_error_response
 )
+from .cache import TTLCache
 from .logging_config import get_logger, setup_logging, log_operation_result, log_database_operation, log_function_call
 
 __all__ = [
@@ -45,6 +48,7 @@ __all__ = [
     "PathConstants",
     "TimeFormats",
     "RegexPatterns",
+    "CacheConstants",
 
     # Error handling
     "SQLAssistantError",
@@ -56,6 +60,9 @@ __all__ = [
     "error_handler",
     "create_error_response",
 
+    # Caching
+    "TTLCache",
+
     # Logging
     "get_logger",
     "setup_logging",
@@ -68,6 +68,13 @@ class VectorDBConfig(BaseSettings):
     password: Optional[str] = Field(default=None, description="Milvus password")
     database: str = Field(default="default", description="Milvus database name")
 
+    # Search tuning
+    table_similarity_threshold: float = Field(
+        default=0.3,
+        description="Minimum inner-product score of candidate tables sent to table selection; "
+                    "assumes normalized embeddings, 0 keeps every candidate"
+    )
+
     class Config:
         env_prefix = "VECTOR_DB_"
         case_sensitive = False
@@ -88,6 +95,18 @@ class LLMConfig(BaseSettings):
         default="https://api.siliconflow.cn/v1",
         description="LLM API base URL"
     )
+    semantic_cache_enabled: bool = Field(
+        default=False,
+        description="Whether chains that opt in (intent analysis) reuse results for paraphrased inputs"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        description="Minimum cosine similarity for a semantic chain cache hit"
+    )
+    prompt_cache_control: bool = Field(
+        default=False,
+        description="Whether to mark static system prompts with cache_control for provider prompt caching"
+    )
 
     class Config:
         env_prefix = "LLM_"
@@ -22,9 +22,9 @@ class DatabaseConstants:
     DEFAULT_MILVUS_PORT = '19530'
 
     # Connection pool configuration
-    DEFAULT_POOL_SIZE = 5
+    DEFAULT_POOL_SIZE = 20
     DEFAULT_MAX_OVERFLOW = 10
-    DEFAULT_POOL_RECYCLE_TIME = 3600  # 1 hour
+    DEFAULT_POOL_RECYCLE_TIME = 1800  # 30 minutes
 
     # Query related
     MAX_RESULT_ROWS = 100
@@ -60,6 +60,7 @@ class ErrorMessages:
     # SQL execution errors
     SQL_NOT_FOUND = "SQL query statement not found in state"
     SQL_EXECUTION_FAILED = "SQL execution failed"
+    SQL_NOT_READ_ONLY = "Only a single SELECT statement can be executed"
     MAX_RETRY_EXCEEDED = "Maximum retry limit reached"
 
     # System errors
@@ -140,6 +141,39 @@ class PathConstants:
     LANGCHAIN_CACHE_DB = "./data/llm_cache/langchain.db"
 
 
+# Cache related constants
+class CacheConstants:
+    """In-process cache configuration"""
+    # Vector search candidates, refreshed when table descriptions are re-indexed
+    CANDIDATE_TABLES_TTL = 900  # 15 minutes
+    CANDIDATE_TABLES_MAXSIZE = 4096
+    # Best matching standard term of each keyword
+    TERM_MATCH_TTL = 900  # 15 minutes
+    TERM_MATCH_MAXSIZE = 4096
+    # Table permission catalog and configurations, changed only by administrators
+    TABLE_PERMISSION_TTL = 300  # 5 minutes
+    TABLE_PERMISSION_MAXSIZE = 1024
+    # Per-user accessible tables and department paths
+    USER_PERMISSION_TTL = 60  # 1 minute
+    USER_PERMISSION_MAXSIZE = 1024
+    # User IDs by username; disabled users drop out once their entry expires
+    USER_ID_TTL = 60  # 1 minute
+    USER_ID_MAXSIZE = 4096
+    # Results of read-only SQL queries, keyed by the executed statement
+    QUERY_RESULT_TTL = 60  # 1 minute
+    QUERY_RESULT_MAXSIZE = 512
+    # Result tables shown in the chat history, per session and message
+    RESULT_TABLE_TTL = 3600  # 1 hour
+    RESULT_TABLE_MAXSIZE = 256
+
+
+# HTTP client constants
+class HttpClientConstants:
+    """Connection pool limits of the shared LLM HTTP clients"""
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    MAX_CONNECTIONS = 100
+
+
 # Time format constants
 class TimeFormats:
     """Time format constants"""
@@ -78,6 +78,7 @@ def load_streamlit_secrets() -> Dict[str, Any]:
                     'VECTOR_DB_USERNAME': _get_first_present(v_cfg, ['username', 'VECTOR_DB_USERNAME']),
                     'VECTOR_DB_PASSWORD': _get_first_present(v_cfg, ['password', 'VECTOR_DB_PASSWORD']),
                     'VECTOR_DB_DATABASE': _get_first_present(v_cfg, ['database', 'VECTOR_DB_DATABASE'], 'default'),
+                    'VECTOR_DB_TABLE_SIMILARITY_THRESHOLD': _get_first_present(v_cfg, ['table_similarity_threshold', 'VECTOR_DB_TABLE_SIMILARITY_THRESHOLD'], 0.3),
                 })
             
             # LLM configuration (support lower and UPPER keys within [llm])
@@ -87,6 +88,9 @@ def load_streamlit_secrets() -> Dict[str, Any]:
                     'LLM_MODEL': _get_first_present(llm_cfg, ['model', 'LLM_MODEL'], 'Qwen/Qwen2.5-72B-Instruct'),
                     'LLM_API_KEY': _get_first_present(llm_cfg, ['api_key', 'LLM_API_KEY']),
                     'LLM_API_BASE': _get_first_present(llm_cfg, ['api_base', 'LLM_API_BASE'], 'https://api.siliconflow.cn/v1'),
+                    'LLM_SEMANTIC_CACHE_ENABLED': _get_first_present(llm_cfg, ['semantic_cache_enabled', 'LLM_SEMANTIC_CACHE_ENABLED'], False),
+                    'LLM_SEMANTIC_CACHE_THRESHOLD': _get_first_present(llm_cfg, ['semantic_cache_threshold', 'LLM_SEMANTIC_CACHE_THRESHOLD'], 0.95),
+                    'LLM_PROMPT_CACHE_CONTROL': _get_first_present(llm_cfg, ['prompt_cache_control', 'LLM_PROMPT_CACHE_CONTROL'], False),
                 })
             
             # Embedding model configuration (support lower and UPPER keys)
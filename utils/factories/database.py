@@ -7,6 +7,7 @@ from typing import Optional
 from sqlalchemy import create_engine, Engine
 from sqlalchemy.pool import QueuePool
 
+from utils.core.constants import DatabaseConstants
 from utils.core.logging_config import get_logger
 from utils.core.error_handler import (
     DatabaseError,
@@ -32,9 +33,9 @@ class DatabaseFactory:
     @error_handler("Create database connection engine", DatabaseError, ErrorLevel.ERROR)
     def create_engine(cls,
                      database_name: Optional[str] = None,
-                     pool_size: int = 5,
-                     max_overflow: int = 10,
-                     pool_recycle: int = 3600,
+                     pool_size: int = DatabaseConstants.DEFAULT_POOL_SIZE,
+                     max_overflow: int = DatabaseConstants.DEFAULT_MAX_OVERFLOW,
+                     pool_recycle: int = DatabaseConstants.DEFAULT_POOL_RECYCLE_TIME,
                      echo: bool = False) -> Engine:
         """Create database connection engine
 
@@ -3,14 +3,17 @@ Services business service module.
 
 Provides high-level business services, including:
 - LLM service: Language model initialization and call chain management
+- Batching service: Micro-batching of concurrent single-item calls
 """
 
-from .llm import init_language_model, LanguageModelChain, create_llm_chain
+from .llm import init_language_model, LanguageModelChain, create_llm_chain, get_output_schema, get_prompt_template
+from .batching import MicroBatcher, BatchingEmbedder, get_batching_embeddings
 from .milvus_service import (
     create_milvus_collection,
     insert_to_milvus,
     update_milvus_records,
     search_in_milvus,
+    batch_search_in_milvus,
     asearch_in_milvus,
     get_collection_stats
 )
@@ -20,12 +23,20 @@ __all__ = [
     "init_language_model",
     "LanguageModelChain",
     "create_llm_chain",
+    "get_output_schema",
+    "get_prompt_template",
+
+    # Batching service
+    "MicroBatcher",
+    "BatchingEmbedder",
+    "get_batching_embeddings",
 
     # Milvus vector database service
     "create_milvus_collection",
     "insert_to_milvus",
     "update_milvus_records",
     "search_in_milvus",
+    "batch_search_in_milvus",
     "asearch_in_milvus",
     "get_collection_stats",
 ]
\ No newline at end of file
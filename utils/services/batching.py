@@ -0,0 +1,172 @@
+"""
+Micro-batching service module.
+
+Coalesces single-item calls issued concurrently by different requests into one
+batched call, e.g. several embed_query calls into one embed_documents request.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, List, Sequence
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """Collect submitted items into batches processed by a single batch function
+
+    A batch is dispatched once ``max_batch_size`` items are queued or the first
+    queued item has waited ``max_wait`` seconds, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 16,
+        max_wait: float = 0.005,
+        max_concurrent_batches: int = 4,
+        name: str = "micro-batcher",
+    ):
+        """Initialize micro-batcher
+
+        Args:
+            batch_fn: Function mapping a list of items to results in the same order
+            max_batch_size: Maximum items per batch
+            max_wait: Maximum seconds to wait for a batch to fill
+            max_concurrent_batches: Maximum batches processed at the same time
+            name: Name used for worker threads
+        """
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._name = name
+        self._queue: "queue.Queue" = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_batches, thread_name_prefix=name
+        )
+        self._collector = None
+        self._lock = threading.Lock()
+
+    def submit(self, item: Any) -> Future:
+        """Queue item for batching
+
+        Args:
+            item: Item passed to the batch function
+
+        Returns:
+            Future: Future resolved with the item's result
+        """
+        self._ensure_collector()
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def __call__(self, item: Any) -> Any:
+        """Process item through a batch and wait for its result"""
+        return self.submit(item).result()
+
+    async def acall(self, item: Any) -> Any:
+        """Process item through a batch without blocking the event loop"""
+        return await asyncio.wrap_future(self.submit(item))
+
+    def _ensure_collector(self) -> None:
+        if self._collector is not None:
+            return
+        with self._lock:
+            if self._collector is None:
+                self._collector = threading.Thread(
+                    target=self._collect, name=f"{self._name}-collector", daemon=True
+                )
+                self._collector.start()
+
+    def _collect(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._executor.submit(self._process, batch)
+
+    def _process(self, batch: List[tuple]) -> None:
+        items = [item for item, _ in batch]
+        try:
+            results = self._batch_fn(items)
+            if len(results) != len(items):
+                raise ValueError(
+                    f"Batch function returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as e:
+            logger.error(f"{self._name} batch of {len(items)} failed: {str(e)}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+class BatchingEmbedder(Embeddings):
+    """Embeddings wrapper that micro-batches embed_query calls
+
+    Concurrent embed_query calls are sent as one embed_documents request;
+    embed_documents calls are passed straight through.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        max_batch_size: int = 16,
+        max_wait: float = 0.005,
+    ):
+        """Initialize batching embedder
+
+        Args:
+            embeddings: Underlying embedding model
+            max_batch_size: Maximum queries per embedding request
+            max_wait: Maximum seconds to wait for a batch to fill
+        """
+        self.embeddings = embeddings
+        self._batcher = MicroBatcher(
+            embeddings.embed_documents,
+            max_batch_size=max_batch_size,
+            max_wait=max_wait,
+            name="embedding-batcher",
+        )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._batcher(text)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self._batcher.acall(text)
+
+
+@lru_cache()
+def get_batching_embeddings() -> BatchingEmbedder:
+    """Get shared batching wrapper around the default embedding model
+
+    A single instance is shared so that queries from different nodes and
+    requests end up in the same batches.
+    """
+    # Imported here to avoid loading the factory when only MicroBatcher is needed
+    from utils.factories.embedding import EmbeddingFactory
+
+    return BatchingEmbedder(EmbeddingFactory.get_default_embeddings())
@@ -4,17 +4,54 @@ Specialized in handling language model initialization, configuration, and call c
 """
 
 import os
+import re
+import copy
+import json
 import logging
-from typing import Any, Optional, Type
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+import httpx
 from pydantic import BaseModel
 from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
+from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate
+from langchain_core.exceptions import OutputParserException
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.outputs import Generation
+from langchain_core.runnables import RunnableLambda
 
+from utils.core.constants import HttpClientConstants
 from utils.core.logging_config import get_logger
+from utils.core.streamlit_config import settings
 
 logger = get_logger(__name__)
 
+try:
+    # Rust JSON parser shipped with the openai client, used when available
+    import jiter
+except ImportError:  # pragma: no cover - depends on installed openai version
+    jiter = None
+
+_JSON_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL)
+
+
+@lru_cache()
+def get_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Get HTTP clients shared by all language model instances.
+
+    Sharing one connection pool lets every chain reuse keep-alive connections
+    to the LLM API instead of paying for new TCP and TLS handshakes.
+
+    Returns:
+        Synchronous and asynchronous HTTP clients.
+    """
+    limits = httpx.Limits(
+        max_keepalive_connections=HttpClientConstants.MAX_KEEPALIVE_CONNECTIONS,
+        max_connections=HttpClientConstants.MAX_CONNECTIONS,
+    )
+    return httpx.Client(limits=limits), httpx.AsyncClient(limits=limits)
+
 
 def init_language_model(
     temperature: float = 0.0,
@@ -24,6 +61,8 @@ def init_language_model(
     """
     Initialize language model with simplified configuration.
 
+    Instances without extra parameters are shared per (temperature, model_name).
+
     Args:
         temperature: Model output temperature, controls randomness. Default is 0.0.
         model_name: Model name, if not provided uses settings from configuration file
@@ -35,8 +74,23 @@ def init_language_model(
     Raises:
         ValueError: Raised when provided parameters are invalid or necessary configuration is missing.
     """
-    from utils.core.streamlit_config import settings
+    if kwargs:
+        return _create_language_model(temperature, model_name, **kwargs)
+    return _get_language_model(temperature, model_name)
+
+
+@lru_cache(maxsize=8)
+def _get_language_model(temperature: float, model_name: Optional[str]) -> ChatOpenAI:
+    """Get shared language model instance"""
+    return _create_language_model(temperature, model_name)
 
+
+def _create_language_model(
+    temperature: float,
+    model_name: Optional[str],
+    **kwargs: Any
+) -> ChatOpenAI:
+    """Create language model instance using the shared HTTP clients"""
     llm_config = settings.llm
     model_name = model_name or llm_config.model
 
@@ -49,12 +103,15 @@ def init_language_model(
             "Unable to find LLM API key or base URL. Please check environment variables or configuration file settings."
         )
 
+    http_client, http_async_client = get_http_clients()
     model_params = {
         "model": model_name,
         "openai_api_key": openai_api_key,
         "openai_api_base": openai_api_base,
         "temperature": temperature,
         'max_tokens': 1024,
+        "http_client": http_client,
+        "http_async_client": http_async_client,
         **kwargs,
     }
 
@@ -62,10 +119,151 @@ def init_language_model(
     return ChatOpenAI(**model_params)
 
 
+@lru_cache(maxsize=None)
+def get_output_schema(model_cls: Type[BaseModel]) -> str:
+    """
+    Get serialized JSON schema of an output model.
+
+    Schema generation walks the whole Pydantic model, so the serialized
+    result is computed once per model class and reused by every chain.
+
+    Args:
+        model_cls: Pydantic model class defining the output structure.
+
+    Returns:
+        JSON schema string embedded in the system prompt.
+    """
+    return json.dumps(model_cls.model_json_schema(), ensure_ascii=False)
+
+
+class FastJsonOutputParser(JsonOutputParser):
+    """
+    JSON output parser trying jiter on complete responses first.
+
+    Falls back to JsonOutputParser's tolerant parsing for partial results,
+    malformed JSON, or when jiter is not installed.
+    """
+
+    def parse_result(self, result: List[Generation], *, partial: bool = False) -> Any:
+        if jiter is not None and not partial:
+            text = result[0].text.strip()
+            match = _JSON_FENCE_PATTERN.match(text)
+            if match:
+                text = match.group(1)
+            try:
+                return jiter.from_json(text.encode("utf-8"))
+            except ValueError:
+                pass
+        return super().parse_result(result, partial=partial)
+
+
+def build_output_normalizer(model_cls: Type[BaseModel]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Build a lightweight checker for parsed LLM output.
+
+    JsonOutputParser only parses JSON, so a response missing a field would fail
+    later with a KeyError inside the node. The required fields and defaults are
+    read from the model once; the returned function then only does dict lookups
+    per response instead of a full Pydantic validation.
+
+    Args:
+        model_cls: Pydantic model class defining the output structure.
+
+    Returns:
+        Function raising OutputParserException when a required field is missing
+        and filling defaults for missing optional fields.
+    """
+    required = tuple(name for name, field in model_cls.model_fields.items() if field.is_required())
+    defaults = tuple(
+        (name, field.get_default(call_default_factory=True))
+        for name, field in model_cls.model_fields.items()
+        if not field.is_required()
+    )
+    model_name = model_cls.__name__
+
+    def normalize(output: Any) -> Dict[str, Any]:
+        if not isinstance(output, dict):
+            raise OutputParserException(f"{model_name} output must be a JSON object, got: {output!r}")
+        missing = [name for name in required if name not in output]
+        if missing:
+            raise OutputParserException(f"{model_name} output missing required fields: {missing}")
+        for name, default in defaults:
+            if name not in output:
+                output[name] = copy.copy(default)
+        return output
+
+    return normalize
+
+
+FORMAT_INSTRUCTIONS = """
+Output your answer as a JSON object that conforms to the following schema:
+```json
+{schema}
+```
+
+Important instructions:
+1. Ensure your JSON is valid and properly formatted.
+2. Do not include the schema definition in your answer.
+3. Only output the data instance that matches the schema.
+4. Do not include any explanations or comments within the JSON output.
+        """
+
+
+@lru_cache(maxsize=128)
+def get_prompt_template(
+    model_cls: Type[BaseModel],
+    sys_msg: str,
+    user_msg: str,
+    cache_system_prompt: bool = False,
+) -> ChatPromptTemplate:
+    """
+    Get compiled chat prompt template for a chain.
+
+    Templates are parsed once per (model, prompts, cache flag) combination and
+    shared between chains; they are not mutated after construction.
+
+    Args:
+        model_cls: Pydantic model class defining the output structure.
+        sys_msg: System message.
+        user_msg: User message.
+        cache_system_prompt: Mark the system message as a cacheable prefix with cache_control.
+
+    Returns:
+        ChatPromptTemplate: Prompt template with the output schema filled in.
+    """
+    system_template = SystemMessagePromptTemplate.from_template(sys_msg + FORMAT_INSTRUCTIONS)
+    if cache_system_prompt and system_template.input_variables == ["schema"]:
+        # Render the static system prompt once and send it as a content block
+        # with cache_control, for providers that cache explicitly marked prefixes
+        system_text = system_template.format(schema=get_output_schema(model_cls)).content
+        system_message = SystemMessage(
+            content=[
+                {"type": "text", "text": system_text, "cache_control": {"type": "ephemeral"}}
+            ]
+        )
+        return ChatPromptTemplate.from_messages(
+            [
+                system_message,
+                ("human", user_msg),
+            ]
+        )
+
+    return ChatPromptTemplate.from_messages(
+        [
+            system_template,
+            ("human", user_msg),
+        ]
+    ).partial(schema=get_output_schema(model_cls))
+
+
 class LanguageModelChain:
     """
     Language model chain for processing input and generating output conforming to specified schema.
 
+    The Pydantic model only defines the output contract: its JSON schema is
+    embedded in the prompt and its fields drive the output normalizer. Results
+    are returned as plain dicts and no model instance is ever created.
+
     Attributes:
         model_cls: Pydantic model class defining the output structure.
         parser: JSON output parser.
@@ -78,7 +276,8 @@ class LanguageModelChain:
         model_cls: Type[BaseModel],
         sys_msg: str,
         user_msg: str,
-        model: Any
+        model: Any,
+        cache_system_prompt: Optional[bool] = None
     ):
         """
         Initialize LanguageModelChain instance.
@@ -88,6 +287,8 @@ class LanguageModelChain:
             sys_msg: System message.
             user_msg: User message.
             model: Language model instance.
+            cache_system_prompt: Mark the system message as a cacheable prefix with
+                cache_control, defaults to the LLM_PROMPT_CACHE_CONTROL setting.
 
         Raises:
             ValueError: Raised when provided parameters are invalid.
@@ -100,29 +301,19 @@ class LanguageModelChain:
             raise ValueError("model must be a callable object")
 
         self.model_cls = model_cls
-        self.parser = JsonOutputParser(pydantic_object=model_cls)
+        self.parser = FastJsonOutputParser(pydantic_object=model_cls)
 
-        format_instructions = """
-Output your answer as a JSON object that conforms to the following schema:
-```json
-{schema}
-```
+        if cache_system_prompt is None:
+            cache_system_prompt = settings.llm.prompt_cache_control
 
-Important instructions:
-1. Ensure your JSON is valid and properly formatted.
-2. Do not include the schema definition in your answer.
-3. Only output the data instance that matches the schema.
-4. Do not include any explanations or comments within the JSON output.
-        """
+        self.prompt_template = get_prompt_template(model_cls, sys_msg, user_msg, cache_system_prompt)
 
-        self.prompt_template = ChatPromptTemplate.from_messages(
-            [
-                ("system", sys_msg + format_instructions),
-                ("human", user_msg),
-            ]
-        ).partial(schema=model_cls.model_json_schema())
-
-        self.chain = self.prompt_template | model | self.parser
+        self.chain = (
+            self.prompt_template
+            | model
+            | self.parser
+            | RunnableLambda(build_output_normalizer(model_cls))
+        )
 
         logger.debug(f"Created LanguageModelChain: model_cls={model_cls.__name__}")
 
@@ -6,7 +6,8 @@ data insertion, vector search, etc.
 """
 
 import asyncio
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from pymilvus import (
     Collection,
     utility,
@@ -19,6 +20,69 @@ from utils.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Vector index used for new collections. HNSW keeps search latency low for
+# catalogs of a few thousand rows without the recall loss of coarse IVF probing.
+VECTOR_INDEX_PARAMS = {
+    "metric_type": "IP",
+    "index_type": "HNSW",
+    "params": {"M": 16, "efConstruction": 200},
+}
+
+# Search parameters per index type, collections built before the switch keep IVF_FLAT
+SEARCH_PARAMS_BY_INDEX = {
+    "HNSW": {"ef": 64},
+    "IVF_FLAT": {"nprobe": 10},
+    "IVF_SQ8": {"nprobe": 10},
+    "IVF_PQ": {"nprobe": 10},
+}
+DEFAULT_SEARCH_PARAMS = {"nprobe": 10}
+
+_index_type_cache: Dict[Tuple[str, str], str] = {}
+_index_type_lock = threading.Lock()
+
+
+def _get_index_type(collection: Collection, anns_field: str) -> str:
+    """Get index type of a vector field, cached per collection and field"""
+    cache_key = (collection.name, anns_field)
+    with _index_type_lock:
+        index_type = _index_type_cache.get(cache_key)
+    if index_type is not None:
+        return index_type
+
+    index_type = "unknown"
+    try:
+        for index in collection.indexes:
+            if index.field_name == anns_field:
+                index_type = index.params.get("index_type", "unknown")
+                break
+    except Exception as e:
+        logger.warning(f"Failed to read index of {collection.name}.{anns_field}: {str(e)}")
+        return index_type
+
+    with _index_type_lock:
+        _index_type_cache[cache_key] = index_type
+    return index_type
+
+
+def get_search_params(collection: Collection, anns_field: str, top_k: int) -> Dict[str, Any]:
+    """
+    Build search parameters matching the index of the searched vector field.
+
+    Args:
+        collection (Collection): Milvus collection object.
+        anns_field (str): Vector field to search.
+        top_k (int): Number of results requested.
+
+    Returns:
+        Dict[str, Any]: Search parameters.
+    """
+    index_type = _get_index_type(collection, anns_field)
+    params = dict(SEARCH_PARAMS_BY_INDEX.get(index_type, DEFAULT_SEARCH_PARAMS))
+    if "ef" in params:
+        # HNSW requires ef >= limit
+        params["ef"] = max(params["ef"], top_k)
+    return {"metric_type": "IP", "params": params}
+
 
 def create_milvus_collection(collection_config: Dict[str, Any], dim: int) -> Collection:
     """
@@ -51,12 +115,7 @@ def create_milvus_collection(collection_config: Dict[str, Any], dim: int) -> Col
     # Create indexes for vector fields
     for field in collection.schema.fields:
         if field.name.endswith("_vector"):
-            index_params = {
-                "metric_type": "IP",
-                "index_type": "IVF_FLAT",
-                "params": {"nlist": 1024},
-            }
-            collection.create_index(field.name, index_params)
+            collection.create_index(field.name, VECTOR_INDEX_PARAMS)
 
     collection.load()
     logger.info(f"Successfully created and loaded collection: {collection_config['name']}")
@@ -133,8 +192,22 @@ def update_milvus_records(
     logger.info(f"Successfully updated {len(data)} records in collection {collection.name}")
 
 
+def _default_output_fields(collection: Collection) -> List[str]:
+    """Get all scalar fields of a collection except the primary key"""
+    return [
+        field.name
+        for field in collection.schema.fields
+        if not field.name.endswith("_vector") and field.name != "id"
+    ]
+
+
 def search_in_milvus(
-    collection: Collection, query_vector: List[float], vector_field: str, top_k: int = 1
+    collection: Collection,
+    query_vector: List[float],
+    vector_field: str,
+    top_k: int = 1,
+    expr: Optional[str] = None,
+    output_fields: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Search for most similar vectors in Milvus collection.
@@ -144,40 +217,78 @@ def search_in_milvus(
         query_vector (List[float]): Query vector.
         vector_field (str): Vector field name to search.
         top_k (int): Number of most similar results to return. Default is 1.
+        expr (Optional[str]): Boolean filter on scalar fields applied during search.
+        output_fields (Optional[List[str]]): Scalar fields to return. Default is all non-vector fields.
 
     Returns:
         List[Dict[str, Any]]: Search results list.
     """
-    search_params = {"metric_type": "IP", "params": {"nprobe": 10}}
+    return batch_search_in_milvus(
+        collection, [query_vector], vector_field, top_k, expr, output_fields
+    )[0]
 
-    output_fields = [
-        field.name
-        for field in collection.schema.fields
-        if not field.name.endswith("_vector") and field.name != "id"
-    ]
+
+def batch_search_in_milvus(
+    collection: Collection,
+    query_vectors: List[List[float]],
+    vector_field: str,
+    top_k: int = 1,
+    expr: Optional[str] = None,
+    output_fields: Optional[List[str]] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Search for most similar vectors of several queries in one Milvus request.
+
+    Args:
+        collection (Collection): Milvus collection object.
+        query_vectors (List[List[float]]): Query vectors.
+        vector_field (str): Vector field name to search.
+        top_k (int): Number of most similar results per query. Default is 1.
+        expr (Optional[str]): Boolean filter on scalar fields applied during search.
+        output_fields (Optional[List[str]]): Scalar fields to return. Default is all non-vector fields.
+
+    Returns:
+        List[List[Dict[str, Any]]]: Search results list of each query, in input order.
+    """
+    search_params = get_search_params(collection, f"{vector_field}_vector", top_k)
+
+    if output_fields is None:
+        output_fields = _default_output_fields(collection)
 
     results = collection.search(
-        data=[query_vector],
+        data=query_vectors,
         anns_field=f"{vector_field}_vector",
         param=search_params,
         limit=top_k,
+        expr=expr,
         output_fields=output_fields,
     )
 
     search_results = [
-        {
-            **{field: getattr(hit.entity, field) for field in output_fields},
-            "distance": hit.distance,
-        }
-        for hit in results[0]
+        [
+            {
+                **{field: getattr(hit.entity, field) for field in output_fields},
+                "distance": hit.distance,
+            }
+            for hit in hits
+        ]
+        for hits in results
     ]
 
-    logger.debug(f"Found {len(search_results)} results in collection {collection.name}")
+    logger.debug(
+        f"Found {sum(len(hits) for hits in search_results)} results for "
+        f"{len(query_vectors)} queries in collection {collection.name}"
+    )
     return search_results
 
 
 async def asearch_in_milvus(
-    collection: Collection, query_vector: List[float], vector_field: str, top_k: int = 1
+    collection: Collection,
+    query_vector: List[float],
+    vector_field: str,
+    top_k: int = 1,
+    expr: Optional[str] = None,
+    output_fields: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Asynchronously search for most similar vectors in Milvus collection.
@@ -187,17 +298,16 @@ async def asearch_in_milvus(
         query_vector (List[float]): Query vector.
         vector_field (str): Vector field name to search.
         top_k (int): Number of most similar results to return. Default is 1.
+        expr (Optional[str]): Boolean filter on scalar fields applied during search.
+        output_fields (Optional[List[str]]): Scalar fields to return. Default is all non-vector fields.
 
     Returns:
         List[Dict[str, Any]]: Search results list.
     """
-    search_params = {"metric_type": "IP", "params": {"nprobe": 10}}
+    search_params = get_search_params(collection, f"{vector_field}_vector", top_k)
 
-    output_fields = [
-        field.name
-        for field in collection.schema.fields
-        if not field.name.endswith("_vector") and field.name != "id"
-    ]
+    if output_fields is None:
+        output_fields = _default_output_fields(collection)
 
     # Use asyncio.to_thread to run synchronous operation in thread
     results = await asyncio.to_thread(
@@ -206,6 +316,7 @@ async def asearch_in_milvus(
         anns_field=f"{vector_field}_vector",
         param=search_params,
         limit=top_k,
+        expr=expr,
         output_fields=output_fields,
     )
 